@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Provisioning Benchmark
+Runs issue catalogs through the provisioning path against the local fake GitHub API and reports throughput
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List
+
+# Keep benchmark metadata out of the real cache; must be set before metadata_cache is imported
+os.environ["KANBAN_CACHE_DIR"] = tempfile.mkdtemp(prefix="kanban-bench-")
+
+import provisioning
+from fake_github import FakeGitHub
+from github_client import GitHubClient
+from issue_catalog import expand_template, load_catalog
+from issue_templates import cache_stats
+from pipeline import percentile
+from rate_limiter import configure_shared_limiter
+from run_metrics import reset_metrics
+
+MODES: Dict[str, Dict[str, Any]] = {
+    "sequential": {"jobs": 1},
+    "concurrent": {"jobs": 8},
+    "batched": {"jobs": 4, "batch_size": 25},
+    "pipeline": {"jobs": 8, "stage_workers": {"create": 8, "add": 4}},
+}
+
+SYNTHETIC_LAYERS = [
+    ("L0", "L0:Ingestion", "Comp:Crawler", "Phase 1: Foundation"),
+    ("L1", "L1:Allocation", "Comp:ML", "Phase 2: Core Intelligence"),
+    ("L2", "L2:DialoguePod", "Comp:Orchestrator", "Phase 2: Core Intelligence"),
+    ("L3", "L3:MetaReview", "Comp:Evolution", "Phase 3: Evolution & Learning"),
+    ("L4", "L4:RL-FineTuning", "Comp:Trainer", "Phase 3: Evolution & Learning"),
+    ("L5", "L5:Observability", "Comp:Monitoring", "Phase 4: Production & Optimization"),
+]
+PRIORITIES = ["Prio:Critical", "Prio:High", "Prio:Medium", "Prio:Low"]
+
+class TimedClient(GitHubClient):
+    """GitHubClient that records the wall time of every HTTP round trip"""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.latencies: List[float] = []
+        self._timing_lock = threading.Lock()
+
+    def _send(self, *args: Any, **kwargs: Any):
+        start = time.monotonic()
+        try:
+            return super()._send(*args, **kwargs)
+        finally:
+            with self._timing_lock:
+                self.latencies.append(time.monotonic() - start)
+
+def board_catalog() -> List[Dict[str, str]]:
+    """The real board: every spec in catalog/board.jsonl and catalog/missing.jsonl"""
+    return load_catalog("board") + load_catalog("missing")
+
+SYNTHETIC_TEMPLATE = {
+    "title": "[{prefix}] Synthetic {level} Task {i:06d}",
+    "body": """## 🎯 Task Objective
+Synthetic benchmark task for {layer} owned by {component}.
+
+## 📋 Technical Requirements
+- Requirement A for {component}
+- Requirement B for {component}
+
+## 🎯 Acceptance Criteria
+- [ ] {level} priority criterion for {layer}
+
+## 📊 Success Metrics
+- Throughput: >100 items/hour""",
+    "labels": "{layer},Type:Feature,{component},Prio:{level}",
+    "milestone": "{milestone}",
+}
+
+def synthetic_record(count: int) -> Dict[str, Any]:
+    """A catalog template record expanding to at least `count` unique specs across every layer and priority"""
+    rows = [{"prefix": prefix, "layer": layer, "component": component, "milestone": milestone,
+             "level": priority.split(":")[1]}
+            for prefix, layer, component, milestone in SYNTHETIC_LAYERS for priority in PRIORITIES]
+    return {"template": SYNTHETIC_TEMPLATE, "rows": rows, "matrix": {"i": list(range(-(-count // len(rows))))}}
+
+def synthetic_catalog(count: int) -> List[Dict[str, str]]:
+    """Generate `count` unique, realistically sized specs spread across layers and milestones"""
+    return list(itertools.islice(expand_template(synthetic_record(count)), count))
+
+def catalog_size(name: str) -> int:
+    return int(name[:-1]) * 1000 if name.endswith("k") else int(name)
+
+def catalog(name: str) -> List[Dict[str, str]]:
+    if name == "board":
+        return board_catalog()
+    return synthetic_catalog(catalog_size(name))
+
+def run_scenario(catalog_name: str, issues: List[Dict[str, str]], mode: str,
+                 args: argparse.Namespace) -> Dict[str, Any]:
+    """Provision one catalog in one mode against a fresh fake server"""
+    labels = sorted({l for issue in issues for l in issue["labels"].split(",")})
+    fake = FakeGitHub(latency=args.latency, error_rate=args.error_rate,
+                      writes_per_second=args.fake_writes_per_second, labels=labels)
+    url = fake.start()
+    options = dict(MODES[mode])
+    concurrency = sum(options["stage_workers"].values()) if "stage_workers" in options else options["jobs"]
+    limiter = configure_shared_limiter(create_rate=args.writes_per_minute / 60.0,
+                                       burst=max(10.0, args.writes_per_minute / 60.0), max_concurrency=concurrency)
+    client = TimedClient(token="fake", api_url=url, limiter=limiter)
+    provisioning.set_backend("api", metadata_ttl=0, client=client)
+    provisioning.set_journal(None)
+    run = reset_metrics()
+
+    start = time.monotonic()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = provisioning.provision_issues(issues, **options)
+    elapsed = time.monotonic() - start
+    fake.stop()
+    client.close()
+
+    created = sum(1 for _, status in results if status == provisioning.RESULT_CREATED)
+    return {
+        "catalog": catalog_name,
+        "mode": mode,
+        "issues": len(issues),
+        "created": created,
+        "seconds": elapsed,
+        "issues_per_second": created / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(client.latencies, 50) * 1000,
+        "p99_ms": percentile(client.latencies, 99) * 1000,
+        "api_calls": fake.total_calls,
+        "retries": run.summary()["retries"],
+        "rate_limit_wait_seconds": run.summary()["rate_limit_wait_seconds"],
+        "operations": run.summary()["operations"],
+        "calls_by_endpoint": dict(fake.calls),
+    }
+
+def render_benchmark(names: List[str]) -> None:
+    """Time expanding synthetic catalogs through the template engine, without any API calls"""
+    print(f"{'catalog':<8} {'specs':>8} {'secs':>8} {'specs/s':>10} {'hits':>8} {'misses':>7}")
+    for name in names:
+        count = catalog_size(name)
+        before = cache_stats()
+        start = time.monotonic()
+        rendered = sum(1 for _ in itertools.islice(expand_template(synthetic_record(count)), count))
+        elapsed = time.monotonic() - start
+        after = cache_stats()
+        print(f"{name:<8} {rendered:>8} {elapsed:>8.3f} {rendered / elapsed if elapsed else 0:>10.0f} "
+              f"{after['hits'] - before['hits']:>8} {after['misses'] - before['misses']:>7}")
+
+def main():
+    """Run every requested catalog in every requested mode and print a comparison table"""
+    parser = argparse.ArgumentParser(description="Benchmark issue provisioning against a local fake GitHub API")
+    parser.add_argument("--catalogs", default="board,1k", help="comma-separated: board, 1k, 10k or an issue count")
+    parser.add_argument("--modes", default=",".join(MODES), help=f"comma-separated subset of: {', '.join(MODES)}")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds the fake server adds to every call")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of calls the fake answers with 502")
+    parser.add_argument("--fake-writes-per-second", type=float, default=0.0,
+                        help="writes per second the fake accepts before secondary rate-limit 403s (0 = unlimited)")
+    parser.add_argument("--writes-per-minute", type=float, default=1e6,
+                        help="client-side write pacing (default: effectively unpaced)")
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON")
+    parser.add_argument("--render-only", action="store_true",
+                        help="only time rendering the synthetic catalogs through the template engine")
+    args = parser.parse_args()
+
+    if args.render_only:
+        render_benchmark([name for name in args.catalogs.split(",") if name and name != "board"])
+        return
+
+    rows = []
+    print(f"{'catalog':<8} {'mode':<11} {'issues':>7} {'ok':>7} {'secs':>8} {'issues/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'calls':>7}")
+    for name in filter(None, args.catalogs.split(",")):
+        issues = catalog(name)
+        for mode in filter(None, args.modes.split(",")):
+            row = run_scenario(name, issues, mode, args)
+            rows.append(row)
+            print(f"{row['catalog']:<8} {row['mode']:<11} {row['issues']:>7} {row['created']:>7} {row['seconds']:>8.2f} "
+                  f"{row['issues_per_second']:>9.1f} {row['p50_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['api_calls']:>7}")
+            sys.stdout.flush()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+        print(f"\n📄 Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Board Mirror
+Syncs the local SQLite copy of the board and answers board questions from it without API calls
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from board_mirror import COUNT_BY, BoardMirror
+from github_client import GitHubAPIError, GitHubClient
+from provisioning import PROJECT_ID, PROJECT_OWNER, REPO, ApiBackend
+
+def add_filter_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--label", action="append", default=[], help="only issues with this label (repeatable)")
+    parser.add_argument("--milestone", help="only issues in this milestone")
+    parser.add_argument("--layer", help="only issues in this layer, e.g. L0")
+    parser.add_argument("--state", choices=("open", "closed"), help="only open or closed issues")
+    parser.add_argument("--field", action="append", default=[], metavar="NAME=VALUE",
+                        help="only issues whose project field has this value, e.g. Status=Todo (repeatable)")
+
+def filters(args: argparse.Namespace) -> dict:
+    fields = dict(part.split("=", 1) for part in args.field)
+    return {"labels": args.label, "milestone": args.milestone, "layer": args.layer, "state": args.state,
+            "fields": fields}
+
+def main():
+    """Sync the mirror or query it"""
+    parser = argparse.ArgumentParser(description="Local SQLite mirror of the Kanban board")
+    parser.add_argument("--repo", default=REPO, help=f"owner/name (default: {REPO})")
+    parser.add_argument("--db", metavar="PATH", help="mirror database (default: .kanban-cache/board-<repo>.sqlite3)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sync = commands.add_parser("sync", help="pull what changed since the last sync")
+    sync.add_argument("--project", default=f"{PROJECT_OWNER}/{PROJECT_ID}", metavar="LOGIN/N",
+                      help=f"project whose items and field values are mirrored (default: {PROJECT_OWNER}/{PROJECT_ID}; '' skips items)")
+    sync.add_argument("--full", action="store_true", help="ignore the cursors and re-read everything")
+
+    query = commands.add_parser("query", help="list matching issues")
+    add_filter_arguments(query)
+    query.add_argument("--json", action="store_true", help="print JSON instead of a table")
+
+    count = commands.add_parser("count", help="count matching issues by label, milestone, layer, state or field")
+    count.add_argument("--by", choices=COUNT_BY, default="milestone")
+    count.add_argument("--by-field", metavar="NAME", help="with --by field, the project field to group by (e.g. Status)")
+    add_filter_arguments(count)
+    args = parser.parse_args()
+
+    mirror = BoardMirror(args.repo, args.db)
+    if args.command == "sync":
+        client = GitHubClient()
+        resolve = None
+        if args.project:
+            login, _, number = args.project.rpartition("/")
+            resolve = ApiBackend(client, repo=args.repo, project_owner=login, project_id=number).project_node_id
+        started = time.monotonic()
+        try:
+            counts = mirror.sync(client, resolve, full=args.full)
+        except (GitHubAPIError, OSError) as e:
+            print(f"❌ Sync failed, mirror left at its previous state: {e}")
+            sys.exit(1)
+        changed = ", ".join(f"{n} {kind}" for kind, n in counts.items())
+        print(f"✓ Synced {args.repo} in {time.monotonic() - started:.2f}s: {changed}; {len(mirror)} issues mirrored")
+    elif args.command == "query":
+        rows = mirror.query(**filters(args))
+        if args.json:
+            json.dump(rows, sys.stdout, indent=2)
+            print()
+        else:
+            for row in rows:
+                print(f"#{row['number']:<5} {row['state']:<7} {row['milestone'] or '-':<36} {row['title']}")
+            print(f"\n{len(rows)} issues")
+    else:
+        if args.by == "field" and not args.by_field:
+            parser.error("--by field needs --by-field NAME")
+        for value, n in mirror.count_by(args.by, args.by_field, **filters(args)):
+            print(f"{n:>6}  {value if value is not None else '(none)'}")
+    mirror.close()
+
+if __name__ == "__main__":
+    main()
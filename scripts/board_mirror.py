@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Local Board Mirror
+SQLite copy of a repository's issues, labels, milestones and project items, kept current with updatedAt cursors and indexed for local queries
+"""
+
+import re
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+from github_client import GitHubClient
+from metadata_cache import cache_path
+
+LAYER_LABEL = re.compile(r"^(L\d+):")
+COUNT_BY = ("label", "milestone", "layer", "state", "field")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    number INTEGER PRIMARY KEY,
+    node_id TEXT,
+    title TEXT NOT NULL,
+    body TEXT,
+    state TEXT,
+    state_reason TEXT,
+    milestone TEXT,
+    layer TEXT,
+    url TEXT,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS issue_labels (
+    number INTEGER NOT NULL,
+    label TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (number, label)
+);
+CREATE TABLE IF NOT EXISTS labels (
+    name TEXT PRIMARY KEY COLLATE NOCASE,
+    color TEXT,
+    description TEXT
+);
+CREATE TABLE IF NOT EXISTS milestones (
+    number INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    state TEXT,
+    node_id TEXT
+);
+CREATE TABLE IF NOT EXISTS project_items (
+    item_id TEXT PRIMARY KEY,
+    issue_number INTEGER,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS item_fields (
+    item_id TEXT NOT NULL,
+    field TEXT NOT NULL COLLATE NOCASE,
+    value TEXT,
+    PRIMARY KEY (item_id, field)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS issue_labels_by_label ON issue_labels(label, number);
+CREATE INDEX IF NOT EXISTS issues_by_milestone ON issues(milestone);
+CREATE INDEX IF NOT EXISTS issues_by_layer ON issues(layer);
+CREATE INDEX IF NOT EXISTS issues_by_state ON issues(state);
+CREATE INDEX IF NOT EXISTS project_items_by_issue ON project_items(issue_number);
+CREATE INDEX IF NOT EXISTS item_fields_by_value ON item_fields(field, value);
+"""
+
+ITEMS_QUERY = """query($project: ID!, $after: String) {
+  node(id: $project) {
+    ... on ProjectV2 {
+      items(first: 100, after: $after) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          id
+          updatedAt
+          content { ... on Issue { number } }
+          fieldValues(first: 50) {
+            nodes {
+              ... on ProjectV2ItemFieldSingleSelectValue { name field { ... on ProjectV2FieldCommon { name } } }
+              ... on ProjectV2ItemFieldTextValue { text field { ... on ProjectV2FieldCommon { name } } }
+              ... on ProjectV2ItemFieldNumberValue { number field { ... on ProjectV2FieldCommon { name } } }
+              ... on ProjectV2ItemFieldDateValue { date field { ... on ProjectV2FieldCommon { name } } }
+              ... on ProjectV2ItemFieldIterationValue { title field { ... on ProjectV2FieldCommon { name } } }
+            }
+          }
+        }
+      }
+    }
+  }
+}"""
+
+def mirror_path(repo: str) -> str:
+    """Default database file for a repository, inside the shared cache directory"""
+    return cache_path(f"board-{repo.replace('/', '_')}.sqlite3")
+
+def issue_layer(labels: Iterable[str]) -> Optional[str]:
+    """The architecture layer (L0..L5) an issue belongs to, from its first L<n>: label"""
+    for name in labels:
+        match = LAYER_LABEL.match(name)
+        if match:
+            return match.group(1)
+    return None
+
+def field_value(node: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    """(field name, value as text) of one ProjectV2 item field value node"""
+    name = (node.get("field") or {}).get("name")
+    for key in ("name", "text", "number", "date", "title"):
+        if node.get(key) is not None:
+            return name, str(node[key])
+    return name, None
+
+class BoardMirror:
+    """A local SQLite mirror of one repository and its project board
+
+    sync() pulls only what changed since the last sync: issues through the REST `since` cursor,
+    labels and milestones in one list call each, and project items with writes only for items whose
+    updatedAt moved. Queries then run entirely against the indexed local tables.
+    """
+
+    def __init__(self, repo: str, path: Optional[str] = None):
+        self.repo = repo
+        self.path = path or mirror_path(repo)
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.executescript(SCHEMA)
+            columns = {row["name"] for row in self.db.execute("PRAGMA table_info(issues)")}
+            if "state_reason" not in columns:
+                # Mirrors from before the column existed re-read every issue on their next sync to fill it in
+                with self.db:
+                    self.db.execute("ALTER TABLE issues ADD COLUMN state_reason TEXT")
+                    self.db.execute("UPDATE issues SET updated_at = NULL")
+                    self._set_state("issues_updated_at", None)
+
+    def close(self) -> None:
+        with self._lock:
+            self.db.close()
+
+    # --- sync state ----------------------------------------------------------------
+
+    def get_state(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._read_state(key)
+
+    def _read_state(self, key: str) -> Optional[str]:
+        row = self.db.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: Optional[str]) -> None:
+        self.db.execute("INSERT OR REPLACE INTO sync_state(key, value) VALUES (?, ?)", (key, value))
+
+    # --- sync ----------------------------------------------------------------------
+
+    def sync(self, client: GitHubClient, project_node_id: Optional[Callable[[], str]] = None,
+             full: bool = False) -> Dict[str, int]:
+        """Bring the mirror up to date and return how many rows of each kind changed
+
+        full ignores the cursors and re-reads every issue, dropping issues that no longer exist;
+        project_node_id, when given, resolves the board whose items and field values are mirrored.
+        Everything is written in one transaction, so a sync that fails part way changes nothing.
+        """
+        project_id = project_node_id() if project_node_id else None
+        with self._lock, self.db:
+            counts = {"labels": self._sync_labels(client), "milestones": self._sync_milestones(client),
+                      "issues": self._sync_issues(client, full)}
+            if project_id:
+                counts["items"] = self._sync_items(client, project_id, full)
+        return counts
+
+    def sync_labels(self, client: GitHubClient) -> int:
+        with self._lock, self.db:
+            return self._sync_labels(client)
+
+    def _sync_labels(self, client: GitHubClient) -> int:
+        labels = list(client.paginate(f"/repos/{self.repo}/labels?per_page=100"))
+        self.db.execute("DELETE FROM labels")
+        self.db.executemany("INSERT OR REPLACE INTO labels(name, color, description) VALUES (?, ?, ?)",
+                            [(l["name"], l.get("color"), l.get("description")) for l in labels])
+        return len(labels)
+
+    def sync_milestones(self, client: GitHubClient) -> int:
+        with self._lock, self.db:
+            return self._sync_milestones(client)
+
+    def _sync_milestones(self, client: GitHubClient) -> int:
+        milestones = list(client.paginate(f"/repos/{self.repo}/milestones?state=all&per_page=100"))
+        self.db.execute("DELETE FROM milestones")
+        self.db.executemany("INSERT INTO milestones(number, title, state, node_id) VALUES (?, ?, ?, ?)",
+                            [(m["number"], m["title"], m.get("state"), m.get("node_id")) for m in milestones])
+        return len(milestones)
+
+    def sync_issues(self, client: GitHubClient, full: bool = False) -> int:
+        """Upsert issues updated since the stored cursor, advancing it in the same transaction; returns how many changed"""
+        with self._lock, self.db:
+            return self._sync_issues(client, full)
+
+    def _sync_issues(self, client: GitHubClient, full: bool) -> int:
+        cursor = None if full else self._read_state("issues_updated_at")
+        path = f"/repos/{self.repo}/issues?state=all&sort=updated&direction=asc&per_page=100"
+        if cursor:
+            path += f"&since={quote(cursor)}"
+        changed = 0
+        newest = cursor or ""
+        seen = set()
+        for issue in client.paginate(path):
+            if "pull_request" in issue:
+                continue
+            seen.add(issue["number"])
+            newest = max(newest, issue.get("updated_at") or "")
+            stored = self.db.execute("SELECT updated_at FROM issues WHERE number = ?", (issue["number"],)).fetchone()
+            if not full and stored and stored[0] == issue.get("updated_at"):
+                # `since` is inclusive, so issues at the cursor itself come back on every sync
+                continue
+            self._upsert_issue(issue)
+            changed += 1
+        if full:
+            # Only a full read sees every issue, so only it can tell which were deleted or transferred away
+            gone = [(number,) for number, in self.db.execute("SELECT number FROM issues") if number not in seen]
+            self.db.executemany("DELETE FROM issues WHERE number = ?", gone)
+            self.db.executemany("DELETE FROM issue_labels WHERE number = ?", gone)
+            changed += len(gone)
+        if newest:
+            self._set_state("issues_updated_at", newest)
+        return changed
+
+    def _upsert_issue(self, issue: Dict[str, Any]) -> None:
+        labels = [label["name"] for label in issue.get("labels") or []]
+        self.db.execute(
+            "INSERT OR REPLACE INTO issues(number, node_id, title, body, state, state_reason, milestone, layer, url, "
+            "updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (issue["number"], issue.get("node_id"), issue["title"], issue.get("body") or "", issue.get("state"),
+             issue.get("state_reason"), (issue.get("milestone") or {}).get("title"), issue_layer(labels), issue.get("html_url"),
+             issue.get("updated_at")))
+        self.db.execute("DELETE FROM issue_labels WHERE number = ?", (issue["number"],))
+        self.db.executemany("INSERT OR IGNORE INTO issue_labels(number, label) VALUES (?, ?)",
+                            [(issue["number"], name) for name in labels])
+
+    def sync_items(self, client: GitHubClient, project_id: str, full: bool = False) -> int:
+        """Mirror the board's items and field values, rewriting only items whose updatedAt moved
+
+        Projects v2 cannot filter items by update time, so every page is read (100 items per call),
+        but unchanged items cost no database writes and removed items are dropped.
+        """
+        with self._lock, self.db:
+            return self._sync_items(client, project_id, full)
+
+    def _sync_items(self, client: GitHubClient, project_id: str, full: bool) -> int:
+        known = dict(self.db.execute("SELECT item_id, updated_at FROM project_items"))
+        if self._read_state("project_id") != project_id:
+            known = {}
+        seen = set()
+        changed = 0
+        after = None
+        if not known:
+            self.db.execute("DELETE FROM project_items")
+            self.db.execute("DELETE FROM item_fields")
+        while True:
+            data = client.graphql(ITEMS_QUERY, {"project": project_id, "after": after})
+            items = ((data.get("node") or {}).get("items")) or {}
+            for item in items.get("nodes") or []:
+                seen.add(item["id"])
+                if not full and known.get(item["id"]) == item.get("updatedAt"):
+                    continue
+                self._upsert_item(item)
+                changed += 1
+            page = items.get("pageInfo") or {}
+            if not page.get("hasNextPage"):
+                break
+            after = page["endCursor"]
+        gone = [(item_id,) for item_id in known if item_id not in seen]
+        self.db.executemany("DELETE FROM project_items WHERE item_id = ?", gone)
+        self.db.executemany("DELETE FROM item_fields WHERE item_id = ?", gone)
+        self._set_state("project_id", project_id)
+        return changed + len(gone)
+
+    def _upsert_item(self, item: Dict[str, Any]) -> None:
+        number = (item.get("content") or {}).get("number")
+        self.db.execute("INSERT OR REPLACE INTO project_items(item_id, issue_number, updated_at) VALUES (?, ?, ?)",
+                        (item["id"], number, item.get("updatedAt")))
+        self.db.execute("DELETE FROM item_fields WHERE item_id = ?", (item["id"],))
+        values = [field_value(node) for node in (item.get("fieldValues") or {}).get("nodes") or []]
+        self.db.executemany("INSERT OR REPLACE INTO item_fields(item_id, field, value) VALUES (?, ?, ?)",
+                            [(item["id"], name, value) for name, value in values if name])
+
+    # --- queries -------------------------------------------------------------------
+
+    def _filters(self, labels: Iterable[str] = (), milestone: Optional[str] = None, layer: Optional[str] = None,
+                 state: Optional[str] = None, fields: Optional[Dict[str, str]] = None) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        for label in labels:
+            clauses.append("i.number IN (SELECT number FROM issue_labels WHERE label = ?)")
+            params.append(label)
+        for column, value in (("milestone", milestone), ("layer", layer), ("state", state)):
+            if value is not None:
+                clauses.append(f"i.{column} = ?")
+                params.append(value)
+        for name, value in (fields or {}).items():
+            clauses.append("i.number IN (SELECT p.issue_number FROM project_items p JOIN item_fields f "
+                           "ON f.item_id = p.item_id WHERE f.field = ? AND f.value = ?)")
+            params += [name, value]
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def query(self, labels: Iterable[str] = (), milestone: Optional[str] = None, layer: Optional[str] = None,
+              state: Optional[str] = None, fields: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """Issues matching every given filter, with their labels, ordered by number"""
+        where, params = self._filters(labels, milestone, layer, state, fields)
+        sql = ("SELECT i.number, i.node_id, i.title, i.state, i.milestone, i.layer, i.url, "
+               "(SELECT item_id FROM project_items p WHERE p.issue_number = i.number) AS item_id, "
+               "(SELECT group_concat(label, ',') FROM issue_labels l WHERE l.number = i.number) AS labels "
+               f"FROM issues i{where} ORDER BY i.number")
+        with self._lock:
+            rows = self.db.execute(sql, params).fetchall()
+        return [{**dict(row), "labels": (row["labels"] or "").split(",") if row["labels"] else []} for row in rows]
+
+    def field_values(self, field: str) -> Dict[str, str]:
+        """{item id: value} of one project field across the mirrored items"""
+        with self._lock:
+            return dict(self.db.execute("SELECT item_id, value FROM item_fields WHERE field = ?", (field,)))
+
+    def count_by(self, by: str, field: Optional[str] = None, **filters: Any) -> List[Tuple[Optional[str], int]]:
+        """Issue counts grouped by label, milestone, layer, state or (with field) a project field's value"""
+        if by not in COUNT_BY:
+            raise ValueError(f"cannot count by {by!r}; choose from {', '.join(COUNT_BY)}")
+        where, params = self._filters(**filters)
+        if by == "label":
+            sql = f"SELECT l.label, count(*) FROM issues i JOIN issue_labels l ON l.number = i.number{where} GROUP BY l.label"
+        elif by == "field":
+            join = ("JOIN project_items p ON p.issue_number = i.number "
+                    "LEFT JOIN item_fields f ON f.item_id = p.item_id AND f.field = ?")
+            sql = f"SELECT f.value, count(*) FROM issues i {join}{where} GROUP BY f.value"
+            params = [field] + params
+        else:
+            sql = f"SELECT i.{by}, count(*) FROM issues i{where} GROUP BY i.{by}"
+        with self._lock:
+            return [(row[0], row[1]) for row in self.db.execute(sql + " ORDER BY 2 DESC, 1", params)]
+
+    def iter_issues(self) -> Iterator[Dict[str, Any]]:
+        """Every mirrored issue in the shape the provisioning backends' iter_issues yields"""
+        with self._lock:
+            labels: Dict[int, List[str]] = {}
+            for number, label in self.db.execute("SELECT number, label FROM issue_labels ORDER BY rowid"):
+                labels.setdefault(number, []).append(label)
+            rows = self.db.execute("SELECT number, node_id, title, body, state, state_reason, milestone, url FROM issues "
+                                   "ORDER BY number").fetchall()
+        for row in rows:
+            yield {"title": row["title"], "body": row["body"] or "", "url": row["url"], "node_id": row["node_id"],
+                   "number": row["number"], "state": row["state"], "state_reason": row["state_reason"], "labels": labels.get(row["number"], []),
+                   "milestone": row["milestone"]}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.db.execute("SELECT count(*) FROM issues").fetchone()[0]
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Bulk Edit
+Relabels, re-milestones or moves the status of every issue matching a filter, in batched GraphQL mutations
+"""
+
+import argparse
+import sys
+import time
+
+from board_mirror import BoardMirror
+from bulk_ops import DEFAULT_BULK_BATCH, STATUS_FIELD, apply_changes, label_prefix, plan_changes, select_issues
+from github_client import GitHubAPIError, GitHubClient
+from project_fields import ProjectFields
+from provisioning import DEFAULT_JOBS, PROJECT_ID, PROJECT_OWNER, REPO, ApiBackend
+from rate_limiter import DEFAULT_CREATE_RATE, configure_shared_limiter
+from run_metrics import metrics
+
+def main():
+    """Sync the mirror, select issues from it, then preview or apply the requested changes"""
+    parser = argparse.ArgumentParser(
+        description="Apply label, milestone and project field changes to every matching issue",
+        epilog="e.g. --label L3:MetaReview --milestone 'Phase 3: Evolution & Learning' "
+               "--set-milestone 'Phase 4: Production & Optimization'")
+    parser.add_argument("--repo", default=REPO, help=f"owner/name (default: {REPO})")
+    parser.add_argument("--project-owner", default=PROJECT_OWNER, metavar="LOGIN",
+                        help=f"user or organization owning the project (default: {PROJECT_OWNER})")
+    parser.add_argument("--project", default=PROJECT_ID, metavar="N", help=f"project number (default: {PROJECT_ID})")
+    parser.add_argument("--db", metavar="PATH", help="board mirror database (default: .kanban-cache/board-<repo>.sqlite3)")
+
+    select = parser.add_argument_group("selection (all given filters must match)")
+    select.add_argument("--label", action="append", default=[], help="only issues with this label (repeatable)")
+    select.add_argument("--milestone", help="only issues in this milestone")
+    select.add_argument("--layer", help="only issues in this layer, e.g. L3")
+    select.add_argument("--state", choices=("open", "closed"), help="only open or closed issues")
+    select.add_argument("--field", action="append", default=[], metavar="NAME=VALUE",
+                        help="only issues whose project field has this value, e.g. Status=Todo (repeatable)")
+    select.add_argument("--title", metavar="REGEX", help="only issues whose title matches (case-insensitive)")
+
+    change = parser.add_argument_group("changes")
+    change.add_argument("--add-label", action="append", default=[], metavar="NAME", help="add a label (repeatable)")
+    change.add_argument("--remove-label", action="append", default=[], metavar="NAME", help="remove a label (repeatable)")
+    change.add_argument("--set-label", action="append", default=[], metavar="PREFIX:VALUE",
+                        help="add a label and drop others with the same prefix, e.g. Prio:High (repeatable)")
+    change.add_argument("--set-milestone", metavar="TITLE", help="move to this milestone ('' clears it)")
+    change.add_argument("--set-field", action="append", default=[], metavar="NAME=OPTION",
+                        help="set a single-select project field, e.g. Priority=High (repeatable)")
+    change.add_argument("--status", metavar="OPTION", help=f"shorthand for --set-field {STATUS_FIELD}=OPTION")
+
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BULK_BATCH, metavar="N",
+                        help=f"changes per GraphQL request (default: {DEFAULT_BULK_BATCH})")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS,
+                        help=f"requests in flight at once (default: {DEFAULT_JOBS})")
+    parser.add_argument("--writes-per-minute", type=float, default=DEFAULT_CREATE_RATE * 60, metavar="N",
+                        help=f"sustained mutation rate (default: {DEFAULT_CREATE_RATE * 60:.0f})")
+    parser.add_argument("--no-sync", action="store_true", help="select from the mirror as it is, without syncing it first")
+    parser.add_argument("--dry-run", action="store_true", help="print the planned changes without writing anything")
+    args = parser.parse_args()
+
+    for flag, parts, example in (("--field", args.field, "Status=Todo"), ("--set-field", args.set_field, "Priority=High")):
+        if any(not part.partition("=")[0] or "=" not in part for part in parts):
+            parser.error(f"{flag} needs a NAME=VALUE pair such as {example}")
+    fields = dict(part.split("=", 1) for part in args.set_field)
+    if args.status:
+        fields[STATUS_FIELD] = args.status
+    actions = {"add_labels": args.add_label, "remove_labels": args.remove_label, "set_labels": args.set_label,
+               "milestone": args.set_milestone, "fields": fields}
+    if not any(actions.values()) and args.set_milestone is None:
+        parser.error("nothing to change; give --add-label, --remove-label, --set-label, --set-milestone, --set-field or --status")
+    filters = {"labels": args.label, "milestone": args.milestone, "layer": args.layer, "state": args.state,
+               "fields": dict(part.split("=", 1) for part in args.field)}
+    if not any(filters.values()) and not args.title:
+        parser.error("select issues with at least one of --label, --milestone, --layer, --state, --field or --title")
+    if any(not label_prefix(name) for name in args.set_label):
+        parser.error("--set-label needs a PREFIX:VALUE label such as Prio:High")
+
+    configure_shared_limiter(create_rate=args.writes_per_minute / 60.0, max_concurrency=max(1, args.jobs))
+    client = GitHubClient()
+    backend = ApiBackend(client, repo=args.repo, project_owner=args.project_owner, project_id=args.project)
+    mirror = BoardMirror(args.repo, args.db)
+    try:
+        if not args.no_sync:
+            started = time.monotonic()
+            counts = mirror.sync(client, backend.project_node_id)
+            print(f"✓ Mirror synced in {time.monotonic() - started:.2f}s "
+                  f"({', '.join(f'{n} {kind}' for kind, n in counts.items())} changed)")
+        ids = resolve_ids(backend, client, actions, fields)
+    except (GitHubAPIError, OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    issues = select_issues(mirror, args.title, fields, **filters)
+    mirror.close()
+    changes = list(plan_changes(issues, actions, ids))
+    touched = len({item["number"] for item in changes})
+    print(f"🔎 {len(issues)} issues selected, {touched} need changes ({len(changes)} mutations)")
+
+    if args.dry_run or not changes:
+        for item in changes:
+            print(f"  ~ #{item['number']:<5} {item['summary']:<40} {item['title']}")
+        return
+    started = time.monotonic()
+    failed = 0
+    for item, error in apply_changes(client, changes, args.batch_size, args.jobs):
+        if error:
+            failed += 1
+            print(f"❌ #{item['number']} {item['summary']}: {error}")
+        else:
+            print(f"✓ #{item['number']} {item['summary']}")
+    print(f"🎉 {len(changes) - failed} changes applied, {failed} failed in {time.monotonic() - started:.2f}s")
+    metrics().print_summary()
+    if failed:
+        sys.exit(1)
+
+def resolve_ids(backend: ApiBackend, client: GitHubClient, actions: dict, fields: dict) -> dict:
+    """Look up every label, milestone, field and option the changes refer to, before anything is written"""
+    labels = {name.casefold(): node_id for name, node_id in (backend.metadata.lookup("labels") or {}).items()}
+    unknown = [name for name in actions["add_labels"] + actions["set_labels"] if name.casefold() not in labels]
+    if unknown:
+        raise ValueError(f"no such label in {backend.repo}: {', '.join(unknown)}")
+    ids = {"labels": labels, "milestone": None, "fields": {}, "project": None}
+    if actions["milestone"]:
+        milestone = backend.milestone(actions["milestone"])
+        if not milestone:
+            raise ValueError(f"no such milestone in {backend.repo}: {actions['milestone']}")
+        ids["milestone"] = milestone["id"]
+    if fields:
+        ids["project"] = backend.project_node_id()
+        existing = ProjectFields(client, ids["project"], {}).load()
+        for name, value in fields.items():
+            option = (existing.get(name) or {}).get("options", {}).get(value)
+            if not option:
+                raise ValueError(f"project has no single-select field {name} with option {value}")
+            ids["fields"][name] = (existing[name]["id"], option)
+    return ids
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Bulk Board Operations
+Plans label, milestone and project field changes for a selection of issues and sends them as batched, aliased GraphQL mutations
+"""
+
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from board_mirror import BoardMirror
+from github_client import GitHubAPIError, GitHubClient
+from pipeline import bounded_map, chunked
+
+DEFAULT_BULK_BATCH = 50
+STATUS_FIELD = "Status"
+
+def label_prefix(name: str) -> Optional[str]:
+    """The family a label belongs to, e.g. "Prio:" for Prio:High, or None for labels without one"""
+    head, sep, _ = name.partition(":")
+    return head + sep if sep else None
+
+def replaced(name: str, removing: Set[str], set_prefixes: Dict[str, str]) -> bool:
+    """Whether a current label goes: named for removal, or in the family of a label being set to another value"""
+    key = name.casefold()
+    if key in removing:
+        return True
+    replacement = set_prefixes.get((label_prefix(name) or "").casefold())
+    return replacement is not None and replacement.casefold() != key
+
+def select_issues(mirror: BoardMirror, title: Optional[str] = None, current: Iterable[str] = (),
+                  **filters: Any) -> List[Dict[str, Any]]:
+    """Mirrored issues matching the filters and the title regex, each with the values of the `current` project fields"""
+    pattern = re.compile(title, re.IGNORECASE) if title else None
+    issues = [issue for issue in mirror.query(**filters) if not pattern or pattern.search(issue["title"])]
+    values = {name: mirror.field_values(name) for name in current}
+    for issue in issues:
+        issue["fields"] = {name: field.get(issue["item_id"]) for name, field in values.items()}
+    return issues
+
+def change(issue: Dict[str, Any], summary: str, mutation: str, args: Dict[str, Tuple[str, Any]]) -> Dict[str, Any]:
+    """One mutation against one issue; args maps each input key to (GraphQL type, value)"""
+    return {"number": issue["number"], "title": issue["title"], "summary": summary, "mutation": mutation, "args": args}
+
+def plan_changes(issues: Iterable[Dict[str, Any]], actions: Dict[str, Any], ids: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """The mutations that bring each issue in line with `actions`, skipping anything already in place
+
+    actions: add_labels, remove_labels, set_labels (replace any label with the same prefix),
+    milestone (a title, or "" to clear) and fields ({name: option}).
+    ids: label IDs by casefolded name, the milestone ID, {field: (field ID, option ID)} and the project ID.
+    """
+    set_prefixes = {label_prefix(name).casefold(): name for name in actions.get("set_labels") or [] if label_prefix(name)}
+    removing = {name.casefold() for name in actions.get("remove_labels") or []}
+    wanted = list(actions.get("add_labels") or []) + list(actions.get("set_labels") or [])
+    for issue in issues:
+        have = {name.casefold() for name in issue["labels"]}
+        add = [name for name in wanted if name.casefold() not in have]
+        remove = [name for name in issue["labels"]
+                  if name.casefold() in ids["labels"] and replaced(name, removing, set_prefixes)]
+        if add:
+            yield change(issue, " ".join(f"+{name}" for name in add), "addLabelsToLabelable",
+                         {"labelableId": ("ID!", issue["node_id"]), "labelIds": ("[ID!]!", [ids["labels"][n.casefold()] for n in add])})
+        if remove:
+            yield change(issue, " ".join(f"-{name}" for name in remove), "removeLabelsFromLabelable",
+                         {"labelableId": ("ID!", issue["node_id"]),
+                          "labelIds": ("[ID!]!", [ids["labels"][n.casefold()] for n in remove])})
+        milestone = actions.get("milestone")
+        if milestone is not None and (issue["milestone"] or "") != milestone:
+            yield change(issue, f"milestone {issue['milestone'] or '-'} -> {milestone or '-'}", "updateIssue",
+                         {"id": ("ID!", issue["node_id"]), "milestoneId": ("ID", ids["milestone"])})
+        for name, value in (actions.get("fields") or {}).items():
+            if issue["fields"].get(name) == value or not issue["item_id"]:
+                continue
+            field_id, option_id = ids["fields"][name]
+            yield change(issue, f"{name} {issue['fields'].get(name) or '-'} -> {value}", "updateProjectV2ItemFieldValue",
+                         {"projectId": ("ID!", ids["project"]), "itemId": ("ID!", issue["item_id"]),
+                          "fieldId": ("ID!", field_id), "value": ("ProjectV2FieldValue!", {"singleSelectOptionId": option_id})})
+
+def batch_mutation(changes: List[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+    """One aliased mutation document (c0, c1, ...) carrying every change, with all values as variables"""
+    params = []
+    fields = []
+    variables: Dict[str, Any] = {}
+    for i, item in enumerate(changes):
+        inputs = []
+        for j, (key, (kind, value)) in enumerate(item["args"].items()):
+            params.append(f"$v{i}_{j}: {kind}")
+            inputs.append(f"{key}: $v{i}_{j}")
+            variables[f"v{i}_{j}"] = value
+        fields.append(f"c{i}: {item['mutation']}(input: {{{', '.join(inputs)}}}) {{ clientMutationId }}")
+    return f"mutation({', '.join(params)}) {{\n  " + "\n  ".join(fields) + "\n}", variables
+
+def apply_changes(client: GitHubClient, changes: Iterable[Dict[str, Any]], batch_size: int = DEFAULT_BULK_BATCH,
+                  jobs: int = 4) -> Iterator[Tuple[Dict[str, Any], Optional[str]]]:
+    """Send changes in batches with up to `jobs` requests in flight, yielding (change, error or None) in order"""
+    def send(batch: List[Dict[str, Any]]) -> List[Optional[str]]:
+        mutation, variables = batch_mutation(batch)
+        try:
+            data, errors = client.graphql_partial(mutation, variables)
+        except (GitHubAPIError, OSError) as e:
+            return [str(e)] * len(batch)
+        messages = {(error.get("path") or [None])[0]: error.get("message", "") for error in errors}
+        return [None if data.get(f"c{i}") is not None else messages.get(f"c{i}") or "no result"
+                for i in range(len(batch))]
+
+    for batch, results in bounded_map(send, chunked(changes, max(1, batch_size)), jobs):
+        yield from zip(batch, results)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Export Issues
+Regenerates ALL_ISSUES_EXPORT.txt from the live board, re-fetching only issues updated since the last export
+"""
+
+import argparse
+import sys
+import time
+
+from export_formats import FORMATS, read_text_record, write_formats
+from github_client import GitHubAPIError, GitHubClient
+from issue_export import DEFAULT_EXPORT, STATES, export_issues
+from provisioning import REPO
+
+def main():
+    """Write or refresh the text export"""
+    parser = argparse.ArgumentParser(description="Export every issue to the ALL_ISSUES_EXPORT.txt text format")
+    parser.add_argument("--repo", default=REPO, help=f"owner/name (default: {REPO})")
+    parser.add_argument("--output", "-o", default=DEFAULT_EXPORT, metavar="PATH",
+                        help="export file (default: ALL_ISSUES_EXPORT.txt); offsets and the update cursor go in PATH.state.json")
+    parser.add_argument("--state", choices=STATES, default="all", help="which issues to export (default: all)")
+    parser.add_argument("--full", action="store_true", help="ignore the previous export and re-fetch everything")
+    parser.add_argument("--formats", default=",".join(FORMATS), metavar="LIST",
+                        help=f"extra formats derived from the text export: {', '.join(FORMATS)} (default: all; '' for none); "
+                             "the offset index PATH.idx is always written")
+    parser.add_argument("--show", type=int, metavar="N", help="print issue #N from the existing export and exit")
+    args = parser.parse_args()
+
+    if args.show is not None:
+        try:
+            record = read_text_record(args.output, args.show)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not read the export index: {e}")
+            sys.exit(1)
+        if record is None:
+            print(f"❌ Issue #{args.show} is not in {args.output}")
+            sys.exit(1)
+        print(record, end="")
+        return
+    formats = tuple(name.strip() for name in args.formats.split(",") if name.strip())
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        parser.error(f"unknown formats: {', '.join(sorted(unknown))}")
+
+    started = time.monotonic()
+    try:
+        counts = export_issues(GitHubClient(), args.repo, args.output, args.state, args.full)
+    except (GitHubAPIError, OSError) as e:
+        print(f"❌ Export failed, {args.output} left unchanged: {e}")
+        sys.exit(1)
+    print(f"📄 {args.output}: {counts['written']} new, {counts['patched']} updated, {counts['copied']} unchanged, "
+          f"{counts['removed']} removed in {time.monotonic() - started:.2f}s")
+    for kind, path in write_formats(args.output, formats).items():
+        print(f"📄 {kind}: {path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Machine-Readable Export Formats
+JSONL, a memory-mappable columnar file and a binary offset index derived from the text export in one pass
+"""
+
+import bisect
+import json
+import mmap
+import os
+import struct
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from issue_export import SEPARATOR, ExportState
+
+FORMATS = ("jsonl", "columns")
+INDEX_MAGIC = b"KIDX1\n"
+COLUMNS_MAGIC = b"KCOL1\n"
+# number, text offset, text length, jsonl offset, jsonl length
+INDEX_ENTRY = struct.Struct("<IQIQI")
+_TRAILER = f"\n{SEPARATOR}\n\n".encode("utf-8")
+
+def jsonl_path(path: str) -> str:
+    return f"{os.path.splitext(path)[0]}.jsonl"
+
+def columns_path(path: str) -> str:
+    return f"{os.path.splitext(path)[0]}.cols"
+
+def index_path(path: str) -> str:
+    return f"{path}.idx"
+
+def parse_record(data: bytes, offset: int) -> Dict[str, Any]:
+    """Split one text record back into fields, noting where its body sits in the export file"""
+    head, labels, milestone, rest = data.split(b"\n", 3)
+    number, _, title = head.decode("utf-8")[len("Issue #"):].partition(": ")
+    labels_text = labels.decode("utf-8")[len("Labels: "):]
+    body = rest[:-len(_TRAILER)] if rest.endswith(_TRAILER) else rest
+    return {
+        "number": int(number),
+        "title": title,
+        "labels": labels_text.split(", ") if labels_text else [],
+        "milestone": milestone.decode("utf-8")[len("Milestone: "):],
+        "body": body.decode("utf-8"),
+        "body_offset": offset + len(head) + len(labels) + len(milestone) + 3,
+        "body_length": len(body),
+    }
+
+def iter_export(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream the issues of a text export, in file order, using its sidecar offsets"""
+    state = ExportState(path)
+    if not state.load():
+        raise OSError(f"{state.path} not found; run the text export first")
+    with open(path, "rb") as f:
+        for number, offset, length, updated_at, issue_state in state.records:
+            f.seek(offset)
+            issue = parse_record(f.read(length), offset)
+            issue.update(state=issue_state, updated_at=updated_at, offset=offset, length=length)
+            yield issue
+
+class Dictionary:
+    """Assigns small integer codes to repeated strings (labels, milestones, states)"""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+def write_formats(path: str, formats: Tuple[str, ...] = FORMATS) -> Dict[str, str]:
+    """Derive JSONL, the columnar file and the offset index from the text export at `path`
+
+    Bodies stream straight through to the JSONL file; only the per-issue metadata is held, so the
+    pass stays small even for very large boards. Returns the files written.
+    """
+    rows: List[Tuple[int, int, int, int, int, int, int, int, int, bytes, List[int]]] = []
+    labels, milestones, states = Dictionary(), Dictionary(), Dictionary()
+    written = {}
+    json_file = open(f"{jsonl_path(path)}.tmp", "wb") if "jsonl" in formats else None
+    json_offset = 0
+    try:
+        for issue in iter_export(path):
+            line = b""
+            if json_file:
+                line = (json.dumps({key: issue[key] for key in ("number", "title", "labels", "milestone", "state",
+                                                                  "updated_at", "body")}, ensure_ascii=False)
+                        + "\n").encode("utf-8")
+                json_file.write(line)
+            rows.append((issue["number"], issue["offset"], issue["length"], json_offset, len(line),
+                         states.code(issue["state"]), milestones.code(issue["milestone"]),
+                         issue["body_offset"], issue["body_length"], issue["title"].encode("utf-8"),
+                         [labels.code(name) for name in issue["labels"]]))
+            json_offset += len(line)
+    except BaseException:
+        if json_file:
+            json_file.close()
+            os.remove(json_file.name)
+        raise
+    if json_file:
+        json_file.close()
+        os.replace(json_file.name, jsonl_path(path))
+        written["jsonl"] = jsonl_path(path)
+
+    rows.sort(key=lambda row: row[0])
+    index = bytearray(INDEX_MAGIC + struct.pack("<I", len(rows)))
+    for row in rows:
+        index += INDEX_ENTRY.pack(*row[:5])
+    atomic_write(index_path(path), bytes(index))
+    written["index"] = index_path(path)
+
+    if "columns" in formats:
+        atomic_write(columns_path(path), pack_columns(rows, labels, milestones, states))
+        written["columns"] = columns_path(path)
+    return written
+
+def pack_columns(rows: List[Tuple], labels: Dictionary, milestones: Dictionary, states: Dictionary) -> bytes:
+    """Lay out each field as one contiguous array, 8-byte aligned, behind a small JSON directory"""
+    title_offsets, label_offsets = array("I", [0]), array("I", [0])
+    titles = bytearray()
+    label_codes = array("H")
+    for row in rows:
+        titles += row[9]
+        title_offsets.append(len(titles))
+        label_codes.extend(row[10])
+        label_offsets.append(len(label_codes))
+    columns = {
+        "number": array("I", (row[0] for row in rows)),
+        "state": array("B", (row[5] for row in rows)),
+        "milestone": array("H", (row[6] for row in rows)),
+        "body_offset": array("Q", (row[7] for row in rows)),
+        "body_length": array("I", (row[8] for row in rows)),
+        "title_offsets": title_offsets,
+        "titles": array("B", bytes(titles)),
+        "label_offsets": label_offsets,
+        "label_codes": label_codes,
+    }
+    directory: Dict[str, Any] = {"count": len(rows), "labels": labels.values, "milestones": milestones.values,
+                                 "states": states.values, "columns": {}}
+    blobs = []
+    position = 0
+    for name, values in columns.items():
+        blob = values.tobytes()
+        directory["columns"][name] = [position, len(values), values.typecode]
+        blobs.append(blob + b"\0" * (-len(blob) % 8))
+        position += len(blobs[-1])
+    header = json.dumps(directory, ensure_ascii=False).encode("utf-8")
+    header += b" " * (-(len(COLUMNS_MAGIC) + 4 + len(header)) % 8)
+    return COLUMNS_MAGIC + struct.pack("<I", len(header)) + header + b"".join(blobs)
+
+def atomic_write(path: str, data: bytes) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+class OffsetIndex:
+    """Memory-mapped number -> (text offset, length, jsonl offset, length) lookups by binary search"""
+
+    def __init__(self, path: str):
+        with open(index_path(path), "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            raise ValueError(f"{index_path(path)} is not an export index")
+        self.count = struct.unpack_from("<I", self.map, len(INDEX_MAGIC))[0]
+        self.base = len(INDEX_MAGIC) + 4
+
+    def entry(self, position: int) -> Tuple[int, int, int, int, int]:
+        return INDEX_ENTRY.unpack_from(self.map, self.base + position * INDEX_ENTRY.size)
+
+    def lookup(self, number: int) -> Optional[Tuple[int, int, int, int, int]]:
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if struct.unpack_from("<I", self.map, self.base + middle * INDEX_ENTRY.size)[0] < number:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count:
+            entry = self.entry(low)
+            if entry[0] == number:
+                return entry
+        return None
+
+    def close(self) -> None:
+        self.map.close()
+
+def read_issue(path: str, number: int) -> Optional[Dict[str, Any]]:
+    """Load one issue from the JSONL export by jumping straight to it through the offset index"""
+    index = OffsetIndex(path)
+    try:
+        entry = index.lookup(number)
+    finally:
+        index.close()
+    if not entry or not entry[4]:
+        return None
+    with open(jsonl_path(path), "rb") as f:
+        f.seek(entry[3])
+        return json.loads(f.read(entry[4]))
+
+def read_text_record(path: str, number: int) -> Optional[str]:
+    """One issue's record from the text export, found through the offset index"""
+    index = OffsetIndex(path)
+    try:
+        entry = index.lookup(number)
+    finally:
+        index.close()
+    if not entry:
+        return None
+    with open(path, "rb") as f:
+        f.seek(entry[1])
+        return f.read(entry[2]).decode("utf-8")
+
+class ColumnarExport:
+    """Read-only, memory-mapped view of the columnar file; opening it reads only the JSON directory
+
+    Columns are typed memoryviews over the mapping, so scanning one (e.g. labels) never touches the
+    others, and bodies are read from the text export only when asked for.
+    """
+
+    def __init__(self, path: str):
+        self.text_path = path
+        with open(columns_path(path), "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[:len(COLUMNS_MAGIC)] != COLUMNS_MAGIC:
+            raise ValueError(f"{columns_path(path)} is not a columnar export")
+        size = struct.unpack_from("<I", self.map, len(COLUMNS_MAGIC))[0]
+        start = len(COLUMNS_MAGIC) + 4
+        directory = json.loads(self.map[start:start + size])
+        self.count: int = directory["count"]
+        self.labels: List[str] = directory["labels"]
+        self.milestones: List[str] = directory["milestones"]
+        self.states: List[str] = directory["states"]
+        self._view = view = memoryview(self.map)
+        self.columns: Dict[str, memoryview] = {}
+        for name, (offset, length, typecode) in directory["columns"].items():
+            width = array(typecode).itemsize
+            begin = start + size + offset
+            self.columns[name] = view[begin:begin + length * width].cast(typecode)
+        self.numbers = self.columns["number"]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def row(self, number: int) -> Optional[int]:
+        """Row position of issue #number (rows are sorted by number)"""
+        position = bisect.bisect_left(self.numbers, number)
+        return position if position < self.count and self.numbers[position] == number else None
+
+    def title(self, row: int) -> str:
+        offsets = self.columns["title_offsets"]
+        return bytes(self.columns["titles"][offsets[row]:offsets[row + 1]]).decode("utf-8")
+
+    def titles(self) -> List[str]:
+        """Every title in row order, decoded in one pass over the title column"""
+        data = self.columns["titles"].tobytes()
+        offsets = self.columns["title_offsets"].tolist()
+        return [data[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])]
+
+    def issue_labels(self, row: int) -> List[str]:
+        offsets = self.columns["label_offsets"]
+        return [self.labels[code] for code in self.columns["label_codes"][offsets[row]:offsets[row + 1]]]
+
+    def milestone(self, row: int) -> str:
+        return self.milestones[self.columns["milestone"][row]]
+
+    def state(self, row: int) -> str:
+        return self.states[self.columns["state"][row]]
+
+    def body(self, row: int) -> str:
+        with open(self.text_path, "rb") as f:
+            f.seek(self.columns["body_offset"][row])
+            return f.read(self.columns["body_length"][row]).decode("utf-8")
+
+    def with_label(self, name: str) -> List[int]:
+        """Issue numbers carrying a label, found by scanning only the label columns"""
+        if name not in self.labels:
+            return []
+        code = self.labels.index(name)
+        offsets = self.columns["label_offsets"].tolist()
+        codes = self.columns["label_codes"].tolist()
+        numbers = self.numbers
+        return [numbers[bisect.bisect_right(offsets, position) - 1]
+                for position, value in enumerate(codes) if value == code]
+
+    def record(self, row: int) -> Dict[str, Any]:
+        return {"number": self.numbers[row], "title": self.title(row), "labels": self.issue_labels(row),
+                "milestone": self.milestone(row), "state": self.state(row)}
+
+    def close(self) -> None:
+        for column in self.columns.values():
+            column.release()
+        self.numbers = None
+        self.columns = {}
+        self._view.release()
+        self.map.close()
@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+"""
+Local GitHub API Stand-in
+In-memory fake of the issues, labels, milestones and Projects v2 GraphQL endpoints used by these scripts,
+with configurable latency, error injection and rate limiting for benchmarks and dry runs
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+DEFAULT_MILESTONES = [
+    "Phase 1: Foundation",
+    "Phase 2: Core Intelligence",
+    "Phase 3: Evolution & Learning",
+    "Phase 4: Production & Optimization",
+]
+
+_MUTATION_FIELD = re.compile(r"(?:(\w+)\s*:\s*)?(\w+)\(input:\s*\{([^{}]*)\}\)")
+_INPUT_ARG = re.compile(r"(\w+)\s*:\s*(\$\w+|\"[^\"]*\"|\[[^\]]*\]|[\w.-]+)")
+
+class FakeGitHub:
+    """Thread-safe in-memory GitHub state plus the knobs that shape its responses
+
+    latency: seconds added to every response
+    error_rate: fraction of requests answered with 502
+    writes_per_second: content-creating requests allowed per second before secondary-limit 403s (0 = unlimited)
+    """
+
+    def __init__(self, owner: str = "ughvvv", repo: str = "Idea_Foundry_Kanban", project_number: int = 2,
+                 latency: float = 0.0, error_rate: float = 0.0, writes_per_second: float = 0.0,
+                 labels: Optional[List[str]] = None, milestones: Optional[List[str]] = None, seed: int = 0):
+        self.owner = owner
+        self.repo = repo
+        self.project_number = project_number
+        self.latency = latency
+        self.error_rate = error_rate
+        self.writes_per_second = writes_per_second
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.calls: Dict[str, int] = {}
+        self.issues: List[Dict[str, Any]] = []
+        self.labels: Dict[str, Dict[str, Any]] = {}
+        self.milestones: List[Dict[str, Any]] = []
+        self.project_items: Dict[str, Dict[str, Any]] = {}
+        self.project_fields: Dict[str, Dict[str, Any]] = {"Status": {
+            "id": "PVTSSF_status", "name": "Status", "dataType": "SINGLE_SELECT",
+            "options": [{"id": f"OPT_status_{i}", "name": name} for i, name in enumerate(("Todo", "In Progress", "Done"))]}}
+        self.project_id = f"PVT_{owner}_{project_number}"
+        self._window = (0, 0)
+        for name in labels or []:
+            self.create_label({"name": name, "color": "ededed", "description": ""})
+        for title in milestones if milestones is not None else DEFAULT_MILESTONES:
+            self.create_milestone({"title": title})
+        self.server: Optional[ThreadingHTTPServer] = None
+
+    # --- state -----------------------------------------------------------------
+
+    def count(self, kind: str) -> None:
+        with self.lock:
+            self.calls[kind] = self.calls.get(kind, 0) + 1
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def create_label(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            label = {"id": len(self.labels) + 1, "node_id": f"LA_{len(self.labels) + 1}", "name": data["name"],
+                     "color": data.get("color", "ededed"), "description": data.get("description") or ""}
+            self.labels[label["name"]] = label
+            return label
+
+    def create_milestone(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            number = len(self.milestones) + 1
+            milestone = {"number": number, "node_id": f"MI_{number}", "title": data["title"],
+                         "description": data.get("description") or "", "state": "open", "due_on": data.get("due_on")}
+            self.milestones.append(milestone)
+            return milestone
+
+    def milestone_by(self, key: str, value: Any) -> Optional[Dict[str, Any]]:
+        return next((m for m in self.milestones if m[key] == value), None)
+
+    def create_issue(self, title: str, body: str, label_names: List[str], milestone: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        with self.lock:
+            number = len(self.issues) + 1
+            now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            issue = {
+                "number": number,
+                "node_id": f"I_{number}",
+                "title": title,
+                "body": body,
+                "state": "open",
+                "state_reason": None,
+                "labels": [dict(self.labels[n]) for n in label_names if n in self.labels],
+                "milestone": dict(milestone) if milestone else None,
+                "html_url": f"https://github.com/{self.owner}/{self.repo}/issues/{number}",
+                "created_at": now,
+                "updated_at": now,
+            }
+            self.issues.append(issue)
+            return issue
+
+    def add_project_item(self, content_id: str) -> Dict[str, Any]:
+        with self.lock:
+            for item in self.project_items.values():
+                if item["content_id"] == content_id:
+                    return item
+            item = {"id": f"PVTI_{len(self.project_items) + 1}", "content_id": content_id, "fields": {},
+                    "updated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())}
+            self.project_items[item["id"]] = item
+            return item
+
+    # --- throttling --------------------------------------------------------------
+
+    def throttle(self, write: bool) -> Optional[Tuple[int, Dict[str, str], Any]]:
+        """Return an injected error or secondary-limit response for this request, if any"""
+        if self.error_rate and self.random.random() < self.error_rate:
+            return 502, {}, {"message": "Server Error"}
+        if write and self.writes_per_second:
+            with self.lock:
+                second, used = self._window
+                now = int(time.monotonic())
+                if now != second:
+                    second, used = now, 0
+                used += 1
+                self._window = (second, used)
+            if used > self.writes_per_second:
+                return 403, {"Retry-After": "1"}, {"message": "You have exceeded a secondary rate limit."}
+        return None
+
+    # --- lifecycle ---------------------------------------------------------------
+
+    def start(self, port: int = 0) -> str:
+        """Serve on 127.0.0.1 in a background thread and return the base URL"""
+        fake = self
+
+        class Handler(FakeGitHubHandler):
+            state = fake
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def stop(self) -> None:
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+class FakeGitHubHandler(BaseHTTPRequestHandler):
+    """Routes REST and GraphQL requests onto a FakeGitHub instance"""
+    protocol_version = "HTTP/1.1"
+    state: FakeGitHub
+
+    def setup(self) -> None:
+        super().setup()
+        # Headers and body go out in separate writes; without this, Nagle + delayed ACK add ~40ms per call
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def reply(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        headers = dict(headers or {})
+        if self.command == "GET" and status == 200:
+            # Like GitHub, answer a matching If-None-Match with an empty 304
+            etag = f'W/"{hashlib.sha1(data).hexdigest()}"'
+            headers["ETag"] = etag
+            if self.headers.get("If-None-Match") == etag:
+                status, data = 304, b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("X-RateLimit-Remaining", "5000")
+        self.send_header("X-RateLimit-Reset", str(int(time.time()) + 3600))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def read_json(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length)) if length else {}
+
+    def handle_any(self, method: str) -> None:
+        fake = self.state
+        parts = urlsplit(self.path)
+        payload = self.read_json() if method != "GET" else None
+        is_graphql = parts.path.endswith("/graphql")
+        write = method != "GET" and not (is_graphql and not str(payload.get("query", "")).lstrip().startswith("mutation"))
+        fake.count(f"{method} {'graphql' if is_graphql else re.sub(r'/[0-9]+', '/:n', parts.path)}")
+        if fake.latency:
+            time.sleep(fake.latency)
+        injected = fake.throttle(write)
+        if injected:
+            status, headers, body = injected
+            return self.reply(status, body, headers)
+        try:
+            if is_graphql:
+                return self.reply(200, graphql(fake, payload.get("query", ""), payload.get("variables") or {}))
+            status, body, headers = rest(fake, method, parts.path, parse_qs(parts.query), payload)
+        except KeyError as e:
+            return self.reply(422, {"message": f"Validation Failed: {e}"})
+        self.reply(status, body, headers)
+
+    def do_GET(self) -> None:
+        self.handle_any("GET")
+
+    def do_POST(self) -> None:
+        self.handle_any("POST")
+
+    def do_PATCH(self) -> None:
+        self.handle_any("PATCH")
+
+    def do_DELETE(self) -> None:
+        self.handle_any("DELETE")
+
+def paginate(items: List[Any], query: Dict[str, List[str]], path: str) -> Tuple[List[Any], Dict[str, str]]:
+    per_page = min(100, int(query.get("per_page", ["30"])[0]))
+    page = int(query.get("page", ["1"])[0])
+    chunk = items[(page - 1) * per_page:page * per_page]
+    headers = {}
+    if page * per_page < len(items):
+        rest_query = "&".join(f"{k}={v[0]}" for k, v in query.items() if k != "page")
+        headers["Link"] = f'<{path}?{rest_query}&page={page + 1}>; rel="next"'
+    return chunk, headers
+
+def rest(fake: FakeGitHub, method: str, path: str, query: Dict[str, List[str]],
+         payload: Any) -> Tuple[int, Any, Dict[str, str]]:
+    """Handle a REST call, returning (status, body, extra headers)"""
+    match = re.match(r"^/repos/[^/]+/[^/]+/(issues|labels|milestones)(?:/([^/]+))?$", path)
+    if not match:
+        return 404, {"message": "Not Found"}, {}
+    kind, ident = match.groups()
+
+    if kind == "issues":
+        if method == "GET" and ident is None:
+            issues = fake.issues
+            since = query.get("since", [""])[0]
+            if since:
+                issues = [i for i in issues if i["updated_at"] >= since]
+            if query.get("sort", [""])[0] == "created" and query.get("direction", [""])[0] == "desc":
+                issues = issues[::-1]
+            chunk, headers = paginate(issues, query, path)
+            return 200, chunk, headers
+        if ident is not None and not (ident.isdigit() and 1 <= int(ident) <= len(fake.issues)):
+            return 404, {"message": "Not Found"}, {}
+        issue = fake.issues[int(ident) - 1] if ident else None
+        if method == "GET":
+            return 200, issue, {}
+        if method == "POST":
+            milestone = fake.milestone_by("number", payload.get("milestone"))
+            return 201, fake.create_issue(payload["title"], payload.get("body") or "", payload.get("labels") or [], milestone), {}
+        if method == "PATCH":
+            with fake.lock:
+                for key in ("title", "body", "state"):
+                    if key in payload:
+                        issue[key] = payload[key]
+                if "state" in payload:
+                    closed = payload["state"] == "closed"
+                    issue["state_reason"] = payload.get("state_reason") or ("completed" if closed else "reopened")
+                if "labels" in payload:
+                    issue["labels"] = [dict(fake.labels[n]) for n in payload["labels"] if n in fake.labels]
+                if "milestone" in payload:
+                    milestone = fake.milestone_by("number", payload["milestone"])
+                    issue["milestone"] = dict(milestone) if milestone else None
+                issue["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            return 200, issue, {}
+
+    if kind == "labels":
+        if method == "GET":
+            chunk, headers = paginate(list(fake.labels.values()), query, path)
+            return 200, chunk, headers
+        if method == "POST":
+            if payload["name"] in fake.labels:
+                return 422, {"message": "Validation Failed: already_exists"}, {}
+            return 201, fake.create_label(payload), {}
+        if method == "PATCH":
+            label = fake.labels[unquote(ident)]
+            with fake.lock:
+                label.update({k: v for k, v in payload.items() if k in ("color", "description")})
+                if payload.get("new_name"):
+                    del fake.labels[label["name"]]
+                    label["name"] = payload["new_name"]
+                    fake.labels[label["name"]] = label
+            return 200, label, {}
+
+    if kind == "milestones":
+        if method == "GET":
+            chunk, headers = paginate(fake.milestones, query, path)
+            return 200, chunk, headers
+        if method == "POST":
+            if fake.milestone_by("title", payload["title"]):
+                return 422, {"message": "Validation Failed: already_exists"}, {}
+            return 201, fake.create_milestone(payload), {}
+
+    return 404, {"message": "Not Found"}, {}
+
+def resolve_input(raw: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a GraphQL input object literal of `key: $var` pairs into a dict"""
+    values = {}
+    for key, value in _INPUT_ARG.findall(raw):
+        if value.startswith("$"):
+            values[key] = variables.get(value[1:])
+        else:
+            values[key] = json.loads(value) if value[0] in "\"[" else value
+    return values
+
+def graphql(fake: FakeGitHub, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+    """Answer the GraphQL documents these scripts send: metadata lookups and aliased mutations"""
+    if query.lstrip().startswith("mutation"):
+        data: Dict[str, Any] = {}
+        errors = []
+        for alias, name, raw in _MUTATION_FIELD.findall(query):
+            key = alias or name
+            handler = MUTATIONS.get(name)
+            try:
+                data[key] = handler(fake, resolve_input(raw, variables)) if handler else None
+                if handler is None:
+                    errors.append({"path": [key], "message": f"Field '{name}' doesn't exist on type 'Mutation'"})
+            except (KeyError, ValueError) as e:
+                data[key] = None
+                errors.append({"path": [key], "type": "NOT_FOUND", "message": f"Could not resolve to a node: {e}"})
+        return {"data": data, "errors": errors} if errors else {"data": data}
+
+    data = {}
+    if "repository(" in query:
+        data["repository"] = {
+            "id": f"R_{fake.owner}_{fake.repo}",
+            "labels": {"nodes": [{"id": l["node_id"], "name": l["name"]} for l in fake.labels.values()]},
+            "milestones": {"nodes": [{"id": m["node_id"], "number": m["number"], "title": m["title"]} for m in fake.milestones]},
+        }
+    if "node(id" in query and "items(first" in query:
+        data["node"] = project_items_page(fake, variables)
+    if "node(id" in query and "fields(first" in query and variables.get("project") == fake.project_id:
+        data["node"] = dict(data.get("node") or {}, fields={"nodes": list(fake.project_fields.values())})
+    for owner_field in ("repositoryOwner", "user", "organization"):
+        if f"{owner_field}(login" in query:
+            data[owner_field] = {"projectV2": {"id": fake.project_id}}
+    return {"data": data}
+
+def project_items_page(fake: FakeGitHub, variables: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """One page of project items with their field values, paged by an offset cursor"""
+    if variables.get("project") != fake.project_id:
+        return None
+    items = list(fake.project_items.values())
+    start = int(variables.get("after") or 0)
+    page = items[start:start + 100]
+    issues = {issue["node_id"]: issue for issue in fake.issues}
+    nodes = [{
+        "id": item["id"],
+        "updatedAt": item["updated_at"],
+        "content": {"number": issues[item["content_id"]]["number"],
+                    "labels": {"nodes": [{"name": l["name"]} for l in issues[item["content_id"]]["labels"]]}}
+                   if item["content_id"] in issues else {},
+        "fieldValues": {"nodes": [{"name": value, "field": {"name": name}} for name, value in item["fields"].items()]},
+    } for item in page]
+    more = start + 100 < len(items)
+    return {"items": {"nodes": nodes, "pageInfo": {"hasNextPage": more, "endCursor": str(start + 100) if more else None}}}
+
+def mutate_create_issue(fake: FakeGitHub, args: Dict[str, Any]) -> Dict[str, Any]:
+    by_node = {l["node_id"]: l["name"] for l in fake.labels.values()}
+    names = [by_node[label_id] for label_id in args.get("labelIds") or []]
+    milestone = fake.milestone_by("node_id", args["milestoneId"]) if args.get("milestoneId") else None
+    if args.get("milestoneId") and not milestone:
+        raise KeyError(args["milestoneId"])
+    issue = fake.create_issue(args["title"], args.get("body") or "", names, milestone)
+    return {"issue": {"id": issue["node_id"], "url": issue["html_url"], "number": issue["number"]}}
+
+def mutate_add_item(fake: FakeGitHub, args: Dict[str, Any]) -> Dict[str, Any]:
+    if args["projectId"] != fake.project_id:
+        raise KeyError(args["projectId"])
+    return {"item": {"id": fake.add_project_item(args["contentId"])["id"]}}
+
+def issue_by_node(fake: FakeGitHub, node_id: str) -> Dict[str, Any]:
+    issue = next((i for i in fake.issues if i["node_id"] == node_id), None)
+    if issue is None:
+        raise KeyError(node_id)
+    return issue
+
+def touch(issue: Dict[str, Any]) -> None:
+    issue["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+def mutate_add_labels(fake: FakeGitHub, args: Dict[str, Any]) -> Dict[str, Any]:
+    issue = issue_by_node(fake, args["labelableId"])
+    by_node = {l["node_id"]: l for l in fake.labels.values()}
+    added = [by_node[label_id] for label_id in args.get("labelIds") or []]
+    with fake.lock:
+        have = {l["name"] for l in issue["labels"]}
+        issue["labels"] += [dict(label) for label in added if label["name"] not in have]
+        touch(issue)
+    return {"clientMutationId": None}
+
+def mutate_remove_labels(fake: FakeGitHub, args: Dict[str, Any]) -> Dict[str, Any]:
+    issue = issue_by_node(fake, args["labelableId"])
+    removed = set(args.get("labelIds") or [])
+    with fake.lock:
+        issue["labels"] = [l for l in issue["labels"] if l["node_id"] not in removed]
+        touch(issue)
+    return {"clientMutationId": None}
+
+def mutate_update_issue(fake: FakeGitHub, args: Dict[str, Any]) -> Dict[str, Any]:
+    issue = issue_by_node(fake, args["id"])
+    with fake.lock:
+        if "milestoneId" in args:
+            milestone = fake.milestone_by("node_id", args["milestoneId"]) if args["milestoneId"] else None
+            if args["milestoneId"] and not milestone:
+                raise KeyError(args["milestoneId"])
+            issue["milestone"] = dict(milestone) if milestone else None
+        for key in ("title", "body"):
+            if key in args:
+                issue[key] = args[key]
+        touch(issue)
+    return {"clientMutationId": None, "issue": {"id": issue["node_id"], "number": issue["number"]}}
+
+def mutate_create_field(fake: FakeGitHub, args: Dict[str, Any]) -> Dict[str, Any]:
+    if args["projectId"] != fake.project_id:
+        raise KeyError(args["projectId"])
+    if args["name"] in fake.project_fields:
+        raise ValueError(f"Name has already been taken: {args['name']}")
+    with fake.lock:
+        number = len(fake.project_fields) + 1
+        field = {"id": f"PVTSSF_{number}", "name": args["name"], "dataType": args.get("dataType", "SINGLE_SELECT"),
+                 "options": [{"id": f"OPT_{number}_{i}", "name": option["name"]}
+                             for i, option in enumerate(args.get("singleSelectOptions") or [])]}
+        fake.project_fields[field["name"]] = field
+    return {"projectV2Field": field}
+
+def mutate_set_field_value(fake: FakeGitHub, args: Dict[str, Any]) -> Dict[str, Any]:
+    if args["projectId"] != fake.project_id:
+        raise KeyError(args["projectId"])
+    item = fake.project_items[args["itemId"]]
+    field = next((f for f in fake.project_fields.values() if f["id"] == args["fieldId"]), None)
+    if field is None:
+        raise KeyError(args["fieldId"])
+    option_id = (args.get("value") or {}).get("singleSelectOptionId")
+    option = next((o for o in field["options"] if o["id"] == option_id), None)
+    if option is None:
+        raise KeyError(option_id)
+    with fake.lock:
+        item["fields"][field["name"]] = option["name"]
+        item["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    return {"projectV2Item": {"id": item["id"]}}
+
+MUTATIONS = {
+    "createIssue": mutate_create_issue,
+    "addProjectV2ItemById": mutate_add_item,
+    "addLabelsToLabelable": mutate_add_labels,
+    "removeLabelsFromLabelable": mutate_remove_labels,
+    "updateIssue": mutate_update_issue,
+    "createProjectV2Field": mutate_create_field,
+    "updateProjectV2ItemFieldValue": mutate_set_field_value,
+}
+
+def main():
+    """Run the fake server in the foreground"""
+    parser = argparse.ArgumentParser(description="Serve a local in-memory stand-in for the GitHub API")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds of delay added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 502")
+    parser.add_argument("--writes-per-second", type=float, default=0.0,
+                        help="content-creating requests per second before secondary rate-limit 403s (0 = unlimited)")
+    parser.add_argument("--labels", default="", help="comma-separated label names to pre-create")
+    args = parser.parse_args()
+
+    fake = FakeGitHub(latency=args.latency, error_rate=args.error_rate, writes_per_second=args.writes_per_second,
+                      labels=[l for l in args.labels.split(",") if l])
+    url = fake.start(args.port)
+    print(f"🧪 Fake GitHub API listening on {url}")
+    print(f"   export GITHUB_API_URL={url} GH_TOKEN=fake")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        fake.stop()
+
+if __name__ == "__main__":
+    main()
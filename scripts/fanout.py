@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Multi-Board Fan-Out
+Provisions one catalog onto several repositories/projects in parallel, one worker process per board, all drawing from one write budget
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from typing import Any, Dict, Iterable, List, Optional
+
+from github_client import GitHubClient
+from http_cache import use_http_cache
+from issue_catalog import iter_catalog
+from metadata_cache import cache_path
+from provisioning import PROJECT_ID, RESULT_CREATED, RESULT_SKIPPED, iter_provision, register_field_setter, set_backend, set_journal, use_mirror, use_project_fields, use_similarity
+from rate_limiter import DEFAULT_BURST, SharedBudget, configure_shared_limiter
+from reconcile import reconcile_issues
+from run_journal import open_journal
+from run_metrics import cache_hit_ratio, reset_metrics
+
+LOG_DIR = "fanout-logs"
+
+_settings: Dict[str, Any] = {}
+
+def parse_target(text: str) -> Dict[str, str]:
+    """Parse owner/repo, owner/repo:N or owner/repo:login/N into {repo, project_owner, project_id}
+
+    The project owner defaults to the repository owner and the project number to PROJECT_ID.
+    """
+    repo, _, project = text.strip().partition(":")
+    if repo.count("/") != 1 or not all(repo.split("/")):
+        raise ValueError(f"invalid target {text!r}; expected owner/repo[:[login/]project-number]")
+    login, _, number = project.rpartition("/")
+    number = number or PROJECT_ID
+    if not number.isdigit():
+        raise ValueError(f"invalid project number in target {text!r}")
+    return {"repo": repo, "project_owner": login or repo.split("/")[0], "project_id": number}
+
+def load_targets(values: Iterable[str] = (), path: Optional[str] = None) -> List[Dict[str, str]]:
+    """Targets from comma-separated command line values and a file of one target per line (# comments)"""
+    texts = [part for value in values for part in value.split(",") if part.strip()]
+    if path:
+        with open(path, encoding="utf-8") as f:
+            texts += [line.split("#")[0] for line in f if line.split("#")[0].strip()]
+    targets: Dict[str, Dict[str, str]] = {}
+    for text in texts:
+        target = parse_target(text)
+        targets.setdefault(target_label(target), target)
+    return list(targets.values())
+
+def target_label(target: Dict[str, str]) -> str:
+    return f"{target['repo']}:{target['project_owner']}/{target['project_id']}"
+
+def target_slug(target: Dict[str, str]) -> str:
+    """A file-name-safe name for a target's log and journal"""
+    return f"{target['repo'].replace('/', '_')}-{target['project_owner']}_{target['project_id']}"
+
+def target_journal(path: str, target: Dict[str, str]) -> str:
+    """Give each target its own journal next to the configured one; '' keeps journalling off"""
+    if not path:
+        return ""
+    base, ext = os.path.splitext(path)
+    return f"{base}.{target_slug(target)}{ext}"
+
+def init_worker(budget: SharedBudget, settings: Dict[str, Any]) -> None:
+    """Pool initializer: point this process's limiter at the shared budget and keep the run settings"""
+    _settings.update(settings)
+    use_http_cache(settings["http_cache"])
+    use_similarity(*settings["similarity"])
+    configure_shared_limiter(create_rate=budget.rate, max_concurrency=settings["concurrency"], budget=budget)
+
+def provision_target(target: Dict[str, str], catalog: str) -> Dict[str, Any]:
+    """Provision the catalog onto one board inside a worker process and summarize the outcome
+
+    The worker's own output goes to a per-target log file so boards do not interleave on the console.
+    """
+    settings = _settings
+    log_path = cache_path(os.path.join(LOG_DIR, f"{target_slug(target)}.log"))
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    run = reset_metrics()
+    started = time.monotonic()
+    created = 0
+    skipped = 0
+    failed: List[str] = []
+    with open(log_path, "w", encoding="utf-8") as log, redirect_stdout(log):
+        client = GitHubClient(token=settings["token"]) if settings["backend"] == "api" else None
+        set_backend(settings["backend"], settings["metadata_ttl"], client, **target)
+        register_field_setter(None)
+        if settings["fields"]:
+            use_project_fields()
+        use_mirror(settings["mirror"])
+        journal = open_journal(target_journal(settings["journal"], target), settings["resume"])
+        set_journal(journal)
+        try:
+            specs = iter_catalog(catalog)
+            if settings["reconcile"]:
+                results = reconcile_issues(specs, catalog, settings["dry_run"], **settings["options"])
+            else:
+                results = iter_provision(specs, **settings["options"])
+            for issue, status in results:
+                if status == RESULT_CREATED:
+                    created += 1
+                elif status == RESULT_SKIPPED:
+                    skipped += 1
+                else:
+                    failed.append(issue["title"])
+        finally:
+            # The pool may reuse this process for another target: flush and release this one's journal
+            set_journal(None)
+            if journal:
+                journal.close()
+        run.print_summary()
+    summary = run.summary()
+    return {
+        "target": target_label(target),
+        "created": created,
+        "skipped": skipped,
+        "failed": failed,
+        "seconds": round(time.monotonic() - started, 3),
+        "api_calls": summary["api_calls"],
+        "retries": summary["retries"],
+        "rate_limit_wait_seconds": summary["rate_limit_wait_seconds"],
+        "counters": summary["counters"],
+        "log": log_path,
+    }
+
+def fan_out(targets: List[Dict[str, str]], catalog: str, settings: Dict[str, Any],
+            processes: int = 0) -> List[Dict[str, Any]]:
+    """Provision every target in its own process and return per-target results in target order
+
+    settings carries backend, token, metadata_ttl, journal, resume, mirror, http_cache, reconcile, dry_run, concurrency,
+    writes_per_minute and the provisioning options. Writes across all processes share one token
+    bucket at writes_per_minute, and a throttle seen by any process pauses them all, because
+    GitHub's limits apply to the token rather than to the board.
+    """
+    budget = SharedBudget(settings["writes_per_minute"] / 60.0, DEFAULT_BURST)
+    results: Dict[str, Dict[str, Any]] = {}
+    workers = max(1, min(processes or len(targets), len(targets)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(budget, settings)) as pool:
+        futures = {pool.submit(provision_target, target, catalog): target for target in targets}
+        for future in as_completed(futures):
+            label = target_label(futures[future])
+            try:
+                result = future.result()
+            except Exception as e:  # one board failing must not lose the others' results
+                result = {"target": label, "created": 0, "skipped": 0, "failed": [], "error": str(e), "seconds": 0.0,
+                          "api_calls": 0, "retries": 0, "rate_limit_wait_seconds": 0.0, "counters": {}}
+                print(f"❌ {label}: {e}")
+            else:
+                print(f"✓ {label}: {result['created']} created, {result['skipped']} skipped, {len(result['failed'])} failed "
+                      f"in {result['seconds']:.1f}s (log: {result['log']})")
+            results[label] = result
+    return [results[target_label(target)] for target in targets]
+
+def print_fanout_report(results: List[Dict[str, Any]], elapsed: float) -> None:
+    """Print one row per target plus the totals"""
+    print(f"\n{'target':<48} {'created':>8} {'skipped':>8} {'failed':>7} {'calls':>7} {'retries':>8} {'wait s':>7} {'secs':>7}")
+    for result in results:
+        failed = "error" if result.get("error") else len(result["failed"])
+        print(f"{result['target']:<48} {result['created']:>8} {result['skipped']:>8} {failed:>7} {result['api_calls']:>7} "
+              f"{result['retries']:>8} {result['rate_limit_wait_seconds']:>7.1f} {result['seconds']:>7.1f}")
+    created = sum(r["created"] for r in results)
+    busy = sum(r["seconds"] for r in results)
+    print(f"\n📈 {len(results)} boards: {created} issues created in {elapsed:.1f}s wall clock "
+          f"({busy:.1f}s of per-board work)")
+    counters: Dict[str, int] = {}
+    for result in results:
+        for name in ("http_cache_hits", "http_cache_misses"):
+            counters[name] = counters.get(name, 0) + result["counters"].get(name, 0)
+    ratio = cache_hit_ratio(counters)
+    if ratio is not None:
+        print(f"🗄  {counters['http_cache_hits']}/{counters['http_cache_hits'] + counters['http_cache_misses']} "
+              f"reads answered 304 from the HTTP cache ({ratio:.0%} hit ratio)")
+
+def write_fanout_json(path: str, results: List[Dict[str, Any]], elapsed: float) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"elapsed_seconds": round(elapsed, 3), "targets": results}, f, indent=2)
+
+def write_fanout_prometheus(path: str, results: List[Dict[str, Any]], prefix: str = "kanban_provisioning") -> None:
+    """Write per-target counters as a textfile-collector file, atomically replacing any previous one"""
+    lines = [f"# HELP {prefix}_target_events_total Provisioning events by target and kind",
+             f"# TYPE {prefix}_target_events_total counter"]
+    for result in results:
+        for name, value in sorted(result["counters"].items()):
+            lines.append(f'{prefix}_target_events_total{{target="{result["target"]}",event="{name}"}} {value}')
+    for metric, key, help_text in (
+        ("target_api_calls_total", "api_calls", "GitHub calls by target"),
+        ("target_retries_total", "retries", "Rate-limited attempts retried by target"),
+        ("target_duration_seconds", "seconds", "Provisioning time by target"),
+    ):
+        lines.append(f"# HELP {prefix}_{metric} {help_text}")
+        lines.append(f"# TYPE {prefix}_{metric} {'gauge' if metric.endswith('seconds') else 'counter'}")
+        for result in results:
+            lines.append(f'{prefix}_{metric}{{target="{result["target"]}"}} {result[key]}')
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp, path)
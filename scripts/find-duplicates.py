@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Find Duplicates
+Flags catalog specs that are near-duplicates of existing issues or of each other, before anything is created
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from github_client import GitHubAPIError
+from issue_catalog import CatalogError
+from issue_export import DEFAULT_EXPORT
+from provisioning import live_issues, set_backend, use_mirror
+from search_index import catalog_documents, export_documents
+from similarity import DEFAULT_PERMUTATIONS, DEFAULT_THRESHOLD, SimilarityIndex
+
+def describe(doc: dict) -> str:
+    return f"#{doc['number']} {doc['title']}" if doc.get("number") is not None else doc["title"]
+
+def main():
+    """Index the existing issues, then check each pending spec against them and against the specs before it"""
+    parser = argparse.ArgumentParser(description="Report near-duplicate issues with MinHash/LSH over title+body shingles")
+    parser.add_argument("--catalog", action="append", default=[], metavar="PATH",
+                        help="JSONL catalog or \"breakdown\" with the specs to check (repeatable; default: board and missing)")
+    parser.add_argument("--export", action="append", default=[], metavar="PATH",
+                        help="text export of existing issues (repeatable; default: ALL_ISSUES_EXPORT.txt if present)")
+    parser.add_argument("--live", action="store_true", help="also compare against the repository's current issues")
+    parser.add_argument("--mirror", action="store_true", help="with --live, read the issues from the local board mirror")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, metavar="J",
+                        help=f"minimum estimated Jaccard similarity to report (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--permutations", type=int, default=DEFAULT_PERMUTATIONS, metavar="N",
+                        help=f"MinHash signature length; more is slower but more precise (default: {DEFAULT_PERMUTATIONS})")
+    parser.add_argument("--json", action="store_true", help="print the pairs as JSON")
+    args = parser.parse_args()
+
+    catalogs = args.catalog or ["board", "missing"]
+    exports = args.export or ([DEFAULT_EXPORT] if os.path.exists(DEFAULT_EXPORT) else [])
+    index = SimilarityIndex(args.threshold, args.permutations)
+    pairs = []
+    started = time.monotonic()
+    try:
+        for path in exports:
+            for doc in export_documents(path):
+                index.add(doc["title"], doc["body"], {"number": doc["number"], "title": doc["title"], "source": path})
+        if args.live:
+            set_backend()
+            use_mirror(args.mirror)
+            for issue in live_issues():
+                index.add(issue["title"], issue.get("body") or "",
+                          {"number": issue["number"], "title": issue["title"], "source": "live"})
+        existing = len(index)
+        checked = 0
+        for path in catalogs:
+            for doc in catalog_documents(path):
+                checked += 1
+                signature = index.signature(doc["title"], doc["body"])
+                if signature is None:
+                    continue
+                for ref, score in index.query(doc["title"], signature=signature):
+                    pairs.append({"spec": doc["title"], "catalog": path, "match": ref, "similarity": round(score, 3)})
+                index.add(doc["title"], doc["body"], {"number": None, "title": doc["title"], "source": path}, signature)
+    except (OSError, CatalogError, GitHubAPIError, subprocess.CalledProcessError) as e:
+        print(f"❌ Could not read the issues: {e}")
+        sys.exit(1)
+    elapsed = time.monotonic() - started
+
+    if args.json:
+        print(json.dumps(pairs, indent=2, ensure_ascii=False))
+        return
+    for pair in pairs:
+        print(f"≈ {pair['similarity']:.0%}  {pair['spec']}")
+        print(f"         ~ {describe(pair['match'])}  ({os.path.basename(pair['match']['source'])})")
+    print(f"\n🔎 {checked} specs checked against {existing} existing issues and each other in {elapsed:.2f}s: "
+          f"{len({pair['spec'] for pair in pairs})} with near-duplicates at J >= {args.threshold}")
+
+if __name__ == "__main__":
+    main()
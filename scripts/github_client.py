@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+GitHub API Client
+Keep-alive, connection-pooled REST and GraphQL client that loads the auth token once per run
+"""
+
+import http.client
+import json
+import os
+import queue
+import re
+import subprocess
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from http_cache import HttpCache, http_cache, request_key, token_identity
+from rate_limiter import RETRIED_SERVER_ERRORS, AdaptiveRateLimiter, shared_limiter
+from run_metrics import metrics, operation_name
+
+DEFAULT_API_URL = "https://api.github.com"
+DEFAULT_POOL_SIZE = 8
+USER_AGENT = "idea-foundry-kanban-scripts"
+
+class GitHubAPIError(Exception):
+    """Raised when the GitHub API answers with an error status or GraphQL errors"""
+
+    def __init__(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+
+def load_token() -> str:
+    """Return a GitHub token from the environment, falling back to the gh CLI credentials"""
+    for name in ("GH_TOKEN", "GITHUB_TOKEN"):
+        token = os.environ.get(name, "").strip()
+        if token:
+            return token
+    try:
+        result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+def is_graphql_query(payload: Any) -> bool:
+    """True for read-only GraphQL documents, which do not count against content-creation limits"""
+    query = (payload or {}).get("query", "").lstrip() if isinstance(payload, dict) else ""
+    return not query.startswith("mutation")
+
+class GitHubClient:
+    """Thread-safe GitHub client that reuses a small pool of persistent HTTP connections"""
+
+    def __init__(self, token: Optional[str] = None, api_url: Optional[str] = None,
+                 pool_size: int = DEFAULT_POOL_SIZE, timeout: float = 30.0,
+                 limiter: Optional[AdaptiveRateLimiter] = None, cache: Optional[HttpCache] = None):
+        self.limiter = limiter or shared_limiter()
+        self.token = token if token is not None else load_token()
+        self.cache = cache or http_cache()
+        parts = urlsplit(api_url or os.environ.get("GITHUB_API_URL") or DEFAULT_API_URL)
+        self.scheme = parts.scheme
+        self.host = parts.netloc
+        self.base_path = parts.path.rstrip("/")
+        self.timeout = timeout
+        self._pool: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue(maxsize=pool_size)
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self.scheme == "http":
+            return http.client.HTTPConnection(self.host, timeout=self.timeout)
+        return http.client.HTTPSConnection(self.host, timeout=self.timeout)
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._new_connection()
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def request(self, method: str, path: str, payload: Any = None,
+                headers: Optional[Dict[str, str]] = None) -> Tuple[int, Dict[str, str], bytes]:
+        """Send a request through the rate limiter, retrying throttled responses, and return (status, headers, raw body)
+
+        Reads go out as conditional requests when the cache holds a copy; a 304 answer is returned
+        as the cached 200 response.
+        """
+        write = method != "GET" and not (path.endswith("/graphql") and is_graphql_query(payload))
+        if not self.cache or write:
+            return self._attempt(method, path, payload, headers, write)
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        key = request_key(method, f"{self.scheme}://{self.host}{path}", body, token_identity(self.token))
+        validators = self.cache.validators(key)
+        status, response_headers, data = self._attempt(method, path, payload, {**validators, **(headers or {})}, write)
+        run = metrics()
+        if status == 304:
+            cached = self.cache.replay(key)
+            if cached:
+                run.increment("http_cache_hits")
+                return cached
+            # The copy was pruned or replaced by another process since its validators were read:
+            # fetch the resource again unconditionally rather than hand back an empty 304
+            status, response_headers, data = self._attempt(method, path, payload, headers, write)
+        if status == 200:
+            run.increment("http_cache_misses")
+            self.cache.store(key, response_headers, data)
+        return status, response_headers, data
+
+    def _attempt(self, method: str, path: str, payload: Any, headers: Optional[Dict[str, str]],
+                 write: bool) -> Tuple[int, Dict[str, str], bytes]:
+        """One request through the rate limiter, retried after throttles and transient server errors"""
+        operation = operation_name(method, path, payload)
+        run = metrics()
+        for attempt in range(self.limiter.max_retries + 1):
+            queued = time.monotonic()
+            self.limiter.acquire(write)
+            start = time.monotonic()
+            run.record_wait(operation, start - queued)
+            status = 0
+            try:
+                status, response_headers, data = self._send(method, path, payload, headers)
+            finally:
+                self.limiter.release()
+                run.record(operation, time.monotonic() - start, 0 < status < 400)
+            delay = self.limiter.observe(status, response_headers, data, attempt)
+            if delay is None or attempt == self.limiter.max_retries:
+                break
+            if status in RETRIED_SERVER_ERRORS:
+                print(f"⚠ Server error {status} on {method} {path}, retrying in {delay:.1f}s")
+            else:
+                print(f"⏳ Rate limited on {method} {path}, retrying in {delay:.0f}s")
+            run.record_retry(operation, delay)
+            time.sleep(delay)
+        return status, response_headers, data
+
+    def _send(self, method: str, path: str, payload: Any = None,
+              headers: Optional[Dict[str, str]] = None) -> Tuple[int, Dict[str, str], bytes]:
+        """Send one request over a pooled connection"""
+        send_headers = {
+            "Accept": "application/vnd.github+json",
+            "User-Agent": USER_AGENT,
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        if self.token:
+            send_headers["Authorization"] = f"Bearer {self.token}"
+        body = None
+        if payload is not None:
+            body = json.dumps(payload).encode("utf-8")
+            send_headers["Content-Type"] = "application/json"
+        send_headers.update(headers or {})
+        url = path if path.startswith(self.base_path + "/") else self.base_path + path
+
+        # A pooled connection may have been closed by the server while idle; retry once on a fresh one
+        for attempt in range(2):
+            conn = self._acquire()
+            try:
+                conn.request(method, url, body=body, headers=send_headers)
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                    ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                conn.close()
+                raise
+            response_headers = {k.lower(): v for k, v in response.getheaders()}
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            return response.status, response_headers, data
+        raise GitHubAPIError(0, f"no response for {method} {path}")
+
+    def rest(self, method: str, path: str, payload: Any = None) -> Any:
+        """Call a REST endpoint and return the decoded JSON body"""
+        status, headers, data = self.request(method, path, payload)
+        decoded = json.loads(data) if data else None
+        if status >= 400:
+            message = decoded.get("message", "") if isinstance(decoded, dict) else data.decode("utf-8", "replace")
+            raise GitHubAPIError(status, message, headers)
+        return decoded
+
+    def paginate(self, path: str) -> Iterator[Any]:
+        """Yield items from a list endpoint page by page, following Link rel="next" headers"""
+        while path:
+            status, headers, data = self.request("GET", path)
+            decoded = json.loads(data) if data else []
+            if status >= 400:
+                raise GitHubAPIError(status, decoded.get("message", "") if isinstance(decoded, dict) else "", headers)
+            yield from decoded
+            match = re.search(r'<([^>]+)>;\s*rel="next"', headers.get("link", ""))
+            path = urlsplit(match.group(1))._replace(scheme="", netloc="").geturl() if match else ""
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a GraphQL query or mutation and return its data, raising on any error"""
+        result = self.rest("POST", "/graphql", {"query": query, "variables": variables or {}})
+        if result.get("errors"):
+            raise GitHubAPIError(200, "; ".join(e.get("message", "") for e in result["errors"]))
+        return result["data"]
+
+    def graphql_partial(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Run a GraphQL document and return (data, errors) so aliased batches can report per-alias failures"""
+        result = self.rest("POST", "/graphql", {"query": query, "variables": variables or {}})
+        return result.get("data") or {}, result.get("errors") or []
+
+    def close(self) -> None:
+        """Close every pooled connection"""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Conditional Request Cache
+On-disk store of GitHub read responses and their validators, replayed when the API answers 304 Not Modified
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from metadata_cache import cache_path
+
+# Entries nobody has revalidated for this long are dropped when the cache is opened
+DEFAULT_MAX_AGE = 14 * 24 * 3600
+# Response headers replayed with a cached body; the rest describe the original exchange only
+KEPT_HEADERS = ("content-type", "link", "etag", "last-modified")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    used_at REAL NOT NULL
+);
+"""
+
+def request_key(method: str, url: str, body: Optional[bytes], identity: str) -> str:
+    """Cache key for a read: the same request made with a different token is a different entry"""
+    digest = hashlib.sha256()
+    for part in (identity.encode("utf-8"), method.encode("utf-8"), url.encode("utf-8"), body or b""):
+        digest.update(part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def token_identity(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16] if token else ""
+
+class HttpCache:
+    """Responses keyed by request, stored only when GitHub sent an ETag or Last-Modified
+
+    Entries are never served without asking: every read is revalidated, so a hit is a 304 that
+    cost a round trip but no body and, per GitHub's rules, nothing from the primary rate limit.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_age: float = DEFAULT_MAX_AGE):
+        self.path = path or cache_path("http-cache.sqlite3")
+        self.db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self.db:
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.executescript(SCHEMA)
+            self.db.execute("DELETE FROM responses WHERE used_at < ?", (time.time() - max_age,))
+
+    def validators(self, key: str) -> Dict[str, str]:
+        """Conditional request headers for a stored response, or {} when there is none"""
+        with self._lock:
+            row = self.db.execute("SELECT etag, last_modified FROM responses WHERE key = ?", (key,)).fetchone()
+        if not row:
+            return {}
+        headers = {}
+        if row[0]:
+            headers["If-None-Match"] = row[0]
+        if row[1]:
+            headers["If-Modified-Since"] = row[1]
+        return headers
+
+    def replay(self, key: str) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+        """The stored response as a 200, marking it used"""
+        with self._lock, self.db:
+            row = self.db.execute("SELECT headers, body FROM responses WHERE key = ?", (key,)).fetchone()
+            if not row:
+                return None
+            self.db.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+        return 200, json.loads(row[0]), bytes(row[1])
+
+    def store(self, key: str, headers: Dict[str, str], body: bytes) -> bool:
+        """Keep a 200 response if it carries a validator; returns whether it was stored"""
+        etag, last_modified = headers.get("etag"), headers.get("last-modified")
+        if not etag and not last_modified:
+            return False
+        kept = {name: headers[name] for name in KEPT_HEADERS if name in headers}
+        with self._lock, self.db:
+            self.db.execute("INSERT OR REPLACE INTO responses(key, etag, last_modified, headers, body, used_at) "
+                            "VALUES (?, ?, ?, ?, ?, ?)", (key, etag, last_modified, json.dumps(kept), body, time.time()))
+        return True
+
+    def clear(self) -> None:
+        with self._lock, self.db:
+            self.db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self.db.close()
+
+_enabled = os.environ.get("KANBAN_HTTP_CACHE", "1") != "0"
+_path: Optional[str] = None
+_cache: Optional[HttpCache] = None
+_owner = 0
+_cache_lock = threading.Lock()
+
+def use_http_cache(enabled: bool = True, path: Optional[str] = None) -> None:
+    """Turn the shared conditional-request cache on or off for clients created from now on"""
+    global _enabled, _path, _cache
+    with _cache_lock:
+        _enabled, _path, _cache = enabled, path, None
+
+def http_cache() -> Optional[HttpCache]:
+    """The process-wide cache, opened on first use (and reopened in a forked worker), or None when disabled"""
+    global _cache, _owner
+    if not _enabled:
+        return None
+    with _cache_lock:
+        if _cache is None or _owner != os.getpid():
+            _cache, _owner = HttpCache(_path), os.getpid()
+        return _cache
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Issue Catalog Loader
+Streams issue specs from JSONL catalog files, expanding template records lazily so catalogs of any size load in constant memory
+"""
+
+import itertools
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from issue_templates import TemplateSet, render_rows
+from task_breakdown import TASK_BREAKDOWN, BreakdownError, load_breakdown
+
+CATALOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog")
+SPEC_FIELDS = ("title", "body", "labels", "milestone")
+
+class CatalogError(ValueError):
+    """Raised for a malformed catalog record, naming the file and line it came from"""
+
+def catalog_path(name: str) -> str:
+    """Resolve a bundled catalog name (e.g. "board", or "breakdown" for TASK_BREAKDOWN.md) or return a path unchanged"""
+    if name == "breakdown":
+        return TASK_BREAKDOWN
+    if os.path.exists(name) or os.sep in name or name.endswith(".jsonl"):
+        return name
+    return os.path.join(CATALOG_DIR, f"{name}.jsonl")
+
+def default_catalogs() -> List[str]:
+    """Every bundled catalog by name, plus "breakdown" when TASK_BREAKDOWN.md is present"""
+    names = sorted(name[:-len(".jsonl")] for name in os.listdir(CATALOG_DIR) if name.endswith(".jsonl"))
+    return names + (["breakdown"] if os.path.exists(TASK_BREAKDOWN) else [])
+
+def normalize_labels(labels: Any) -> str:
+    """Accept labels as a comma-separated string or a list"""
+    return ",".join(labels) if isinstance(labels, list) else labels
+
+def make_spec(record: Dict[str, Any]) -> Dict[str, str]:
+    missing = [field for field in SPEC_FIELDS if field not in record]
+    if missing:
+        raise CatalogError(f"missing {', '.join(missing)}")
+    return {"title": record["title"], "body": record["body"], "labels": normalize_labels(record["labels"]),
+            "milestone": record["milestone"]}
+
+def expand_rows(record: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield every row x matrix combination of a template record without materializing the product"""
+    matrix = record.get("matrix") or {}
+    keys = list(matrix)
+    for row in record.get("rows") or [{}]:
+        for values in itertools.product(*(matrix[key] for key in keys)):
+            combined = row.copy()
+            combined.update(zip(keys, values))
+            yield combined
+
+def expand_template(record: Dict[str, Any]) -> Iterator[Dict[str, str]]:
+    """Render a {"template": {...}, "rows": [...], "matrix": {...}} record into specs
+
+    Each spec field is the template's format string filled from the row, or the row's own value
+    when the template does not define that field. Templates are compiled once and identical
+    renders are reused, so a matrix that only varies the title renders its body a single time.
+    """
+    compiled = TemplateSet(record["template"], SPEC_FIELDS)
+    for batch in render_rows(compiled, expand_rows(record)):
+        if compiled.complete:
+            yield from batch
+        else:
+            yield from map(make_spec, batch)
+
+def iter_catalog(path: str, announce: bool = True, errors: Optional[List[CatalogError]] = None) -> Iterator[Dict[str, str]]:
+    """Stream specs from a JSONL catalog one line at a time
+
+    Lines are plain specs, {"template": ...} records expanded lazily, or {"section": text} markers
+    that are printed as the stream reaches them. Blank lines and lines starting with // are skipped.
+    A markdown path is read as a task breakdown document instead. Given an `errors` list, malformed
+    lines are collected there and skipped instead of ending the stream.
+    """
+    if catalog_path(path).endswith(".md"):
+        try:
+            specs = load_breakdown(catalog_path(path))
+        except BreakdownError as e:
+            if errors is None:
+                raise CatalogError(str(e)) from e
+            errors.append(CatalogError(str(e)))
+            return
+        yield from specs
+        return
+    with open(catalog_path(path), encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("//"):
+                continue
+            try:
+                record = json.loads(line)
+                if "section" in record:
+                    if announce:
+                        print(f"\n{record['section']}")
+                elif "template" in record:
+                    yield from expand_template(record)
+                else:
+                    yield make_spec(record)
+            except (ValueError, KeyError, IndexError) as e:
+                if errors is None:
+                    raise CatalogError(f"{path}:{number}: {e}") from e
+                errors.append(CatalogError(f"{path}:{number}: {e}"))
+
+def iter_catalogs(paths: Iterable[str], announce: bool = True) -> Iterator[Dict[str, str]]:
+    """Chain several catalogs into one stream"""
+    for path in paths:
+        yield from iter_catalog(path, announce)
+
+def count_specs(path: str) -> int:
+    """Count the specs a catalog expands to by streaming through it"""
+    return sum(1 for _ in iter_catalog(path, announce=False))
+
+def load_catalog(path: str, announce: bool = False) -> List[Dict[str, str]]:
+    """Materialize a whole catalog; only for small catalogs and tooling that needs random access"""
+    return list(iter_catalog(path, announce))
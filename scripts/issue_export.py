@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Issue Exporter
+Streams the board into the ALL_ISSUES_EXPORT.txt text format and patches only issues updated since the last export
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+from github_client import GitHubClient
+
+DEFAULT_EXPORT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ALL_ISSUES_EXPORT.txt")
+SEPARATOR = "=" * 80
+STATES = ("all", "open", "closed")
+
+def export_fields(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """The fields an export record carries, from a REST issue"""
+    return {
+        "number": issue["number"],
+        "title": issue["title"],
+        "labels": [label["name"] for label in issue.get("labels") or []],
+        "milestone": (issue.get("milestone") or {}).get("title") or "",
+        "state": issue.get("state") or "",
+        "body": issue.get("body") or "",
+        "updated_at": issue.get("updated_at") or "",
+    }
+
+def format_record(issue: Dict[str, Any]) -> str:
+    """One issue as an `Issue #N: title / Labels / Milestone / body / ====` text record"""
+    return (f"Issue #{issue['number']}: {issue['title']}\n"
+            f"Labels: {', '.join(issue['labels'])}\n"
+            f"Milestone: {issue['milestone']}\n"
+            f"{issue['body']}\n"
+            f"{SEPARATOR}\n\n")
+
+def iter_text_records(path: str) -> Iterator[Tuple[int, bytes]]:
+    """Split a text export into (offset, record bytes) at its separator lines, without the sidecar state"""
+    separator = f"{SEPARATOR}\n".encode("utf-8")
+    record = bytearray()
+    start = offset = 0
+    closed = False
+    with open(path, "rb") as f:
+        for line in f:
+            if closed:
+                closed = False
+                if line == b"\n":
+                    record += line
+                    offset += len(line)
+                    line = b""
+                yield start, bytes(record)
+                record = bytearray()
+                start = offset
+            record += line
+            offset += len(line)
+            closed = line == separator
+    if record:
+        yield start, bytes(record)
+
+def iter_remote(client: GitHubClient, repo: str, since: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Issues newest number first, or with `since` only those updated at or after it"""
+    path = f"/repos/{repo}/issues?state=all&per_page=100"
+    path += f"&sort=updated&direction=asc&since={quote(since)}" if since else "&sort=created&direction=desc"
+    for issue in client.paginate(path):
+        if "pull_request" not in issue:
+            yield export_fields(issue)
+
+class ExportState:
+    """Sidecar of an export: the repo, update cursor and each record's [number, offset, length, updated_at, state]
+
+    Records are kept in file order (newest number first), which is what lets a later run copy
+    unchanged records byte for byte instead of re-rendering them.
+    """
+
+    def __init__(self, path: str):
+        self.path = f"{path}.state.json"
+        self.repo = ""
+        self.state_filter = "all"
+        self.cursor = ""
+        self.records: List[List[Any]] = []
+
+    def load(self) -> bool:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        self.repo = data.get("repo", "")
+        self.state_filter = data.get("state", "all")
+        self.cursor = data.get("cursor", "")
+        self.records = data.get("records", [])
+        return True
+
+    def save(self) -> None:
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"repo": self.repo, "state": self.state_filter, "cursor": self.cursor,
+                       "records": self.records}, f)
+        os.replace(tmp, self.path)
+
+class ExportWriter:
+    """Writes records to a temporary file, tracking offsets, then swaps it in atomically"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.tmp = f"{path}.tmp"
+        self.file = open(self.tmp, "wb")
+        self.records: List[List[Any]] = []
+        self.offset = 0
+        self.cursor = ""
+
+    def write(self, issue: Dict[str, Any]) -> None:
+        self.write_raw(issue["number"], format_record(issue).encode("utf-8"), issue["updated_at"], issue["state"])
+
+    def write_raw(self, number: int, data: bytes, updated_at: str, state: str) -> None:
+        self.file.write(data)
+        self.records.append([number, self.offset, len(data), updated_at, state])
+        self.offset += len(data)
+        self.cursor = max(self.cursor, updated_at)
+
+    def commit(self) -> None:
+        self.file.close()
+        os.replace(self.tmp, self.path)
+
+    def abort(self) -> None:
+        self.file.close()
+        os.remove(self.tmp)
+
+def wanted(issue: Dict[str, Any], state_filter: str) -> bool:
+    return state_filter == "all" or issue["state"] == state_filter
+
+def merge_records(old: Iterable[List[Any]], changed: Dict[int, Dict[str, Any]]) -> Iterator[Tuple[List[Any], Optional[Dict[str, Any]]]]:
+    """Walk the old records in file order, yielding (old record or None, fresh issue or None)
+
+    Fresh issues replace the old record with the same number; new numbers are slotted in so the
+    file stays ordered newest number first.
+    """
+    pending = sorted(changed, reverse=True)
+    for record in old:
+        number = record[0]
+        while pending and pending[0] > number:
+            yield None, changed[pending.pop(0)]
+        if pending and pending[0] == number:
+            pending.pop(0)
+            yield record, changed[number]
+        else:
+            yield record, None
+    for number in pending:
+        yield None, changed[number]
+
+def export_issues(client: GitHubClient, repo: str, path: str = DEFAULT_EXPORT, state_filter: str = "all",
+                  full: bool = False) -> Dict[str, int]:
+    """Write or refresh the export at `path`, returning counts of written, patched and copied records
+
+    The first export (or one for a different repo or state filter, or with full) streams every
+    issue to disk as pages arrive. Later exports fetch only issues updated since the recorded
+    cursor and copy every other record unchanged from the previous file.
+    """
+    state = ExportState(path)
+    incremental = (not full and state.load() and state.repo == repo and state.state_filter == state_filter
+                   and os.path.exists(path) and all(len(record) == 5 for record in state.records))
+    writer = ExportWriter(path)
+    counts = {"written": 0, "patched": 0, "copied": 0, "removed": 0}
+    try:
+        if not incremental:
+            for issue in iter_remote(client, repo):
+                if wanted(issue, state_filter):
+                    writer.write(issue)
+                    counts["written"] += 1
+        else:
+            changed = {issue["number"]: issue for issue in iter_remote(client, repo, since=state.cursor)}
+            # `since` is inclusive, so issues at the cursor come back unchanged on every run
+            known = {record[0]: record[3] for record in state.records}
+            changed = {n: issue for n, issue in changed.items() if known.get(n) != issue["updated_at"]}
+            with open(path, "rb") as old:
+                for record, fresh in merge_records(state.records, changed):
+                    if fresh is None:
+                        old.seek(record[1])
+                        writer.write_raw(record[0], old.read(record[2]), record[3], record[4])
+                        counts["copied"] += 1
+                    elif wanted(fresh, state_filter):
+                        writer.write(fresh)
+                        counts["patched" if record else "written"] += 1
+                    elif record:
+                        counts["removed"] += 1
+            writer.cursor = max(writer.cursor, state.cursor)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.commit()
+    state.repo, state.state_filter, state.cursor, state.records = repo, state_filter, writer.cursor, writer.records
+    state.save()
+    return counts
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Remote Issue Index
+Single-pass, streamed index of a repository's existing issues by normalized title and content hash, optionally with a near-duplicate index
+"""
+
+import functools
+import hashlib
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from similarity import SimilarityIndex
+
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_title(title: str) -> str:
+    """Case-fold and collapse whitespace so cosmetic edits still match"""
+    return _WHITESPACE.sub(" ", title).strip().casefold()
+
+@functools.lru_cache(maxsize=4096)
+def body_digest(body: str) -> str:
+    """Hash of a body, insensitive to line endings and trailing spaces; memoized so shared template bodies hash once"""
+    lines = (line.rstrip() for line in body.replace("\r\n", "\n").strip().split("\n"))
+    return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+def content_hash(title: str, body: str, digest: Optional[str] = None) -> str:
+    """Stable hash of an issue's normalized title and body; pass `digest` when only the body_digest was kept"""
+    text = normalize_title(title) + "\n" + (digest or body_digest(body or ""))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def label_names(labels) -> List[str]:
+    """Label names from a comma-separated string or a list, in order, without blanks"""
+    items = labels.split(",") if isinstance(labels, str) else labels or []
+    return [name.strip() for name in items if name.strip()]
+
+def spec_hash(title: str, body: str, labels, milestone: Optional[str], digest: Optional[str] = None) -> str:
+    """Hash of everything provisioning controls on an issue: title, body, label set and milestone"""
+    label_key = ",".join(sorted(name.casefold() for name in label_names(labels)))
+    text = "\n".join([content_hash(title, body, digest), label_key, milestone or ""])
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+class IssueIndex:
+    """In-memory lookup of existing issues; only refs, hashes and MinHash signatures are kept, never bodies"""
+
+    def __init__(self, similarity: Optional[float] = None):
+        self.by_title: Dict[str, Dict[str, str]] = {}
+        self.by_hash: Dict[str, Dict[str, str]] = {}
+        self.similar = SimilarityIndex(similarity) if similarity else None
+
+    def __len__(self) -> int:
+        return len(self.by_title)
+
+    def add(self, title: str, body: str, ref: Dict[str, str]) -> None:
+        self.by_title.setdefault(normalize_title(title), ref)
+        self.by_hash.setdefault(content_hash(title, body), ref)
+        if self.similar is not None:
+            self.similar.add(title, body, ref)
+
+    def match(self, title: str, body: str) -> Optional[Dict[str, str]]:
+        """Return the existing issue with the same normalized title or identical content, if any"""
+        return self.by_title.get(normalize_title(title)) or self.by_hash.get(content_hash(title, body))
+
+    def near_matches(self, title: str, body: str) -> List[Tuple[Dict[str, str], float]]:
+        """(ref, estimated similarity) of indexed issues that read almost the same, when similarity is enabled"""
+        return self.similar.query(title, body) if self.similar is not None else []
+
+def build_index(issues: Iterable[Dict[str, str]], similarity: Optional[float] = None) -> IssueIndex:
+    """Build an index from a stream of {title, body, url, node_id, number} records in one pass"""
+    index = IssueIndex(similarity)
+    for issue in issues:
+        index.add(issue["title"], issue.get("body") or "",
+                  {"url": issue["url"], "node_id": issue["node_id"], "number": issue["number"]})
+    return index
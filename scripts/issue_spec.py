@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Issue Spec Model
+Compact typed issue specs and an offline validator that checks whole catalogs against the declared labels and milestones in one pass
+"""
+
+import difflib
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from issue_catalog import CatalogError, iter_catalog
+from label_sync import SETUP_SCRIPT, load_declared
+
+MILESTONE_CREATE = re.compile(r'gh milestone create "([^"]+)"')
+# Distinct label strings and milestones remembered once parsed or checked; catalogs reuse a handful of combinations
+LABEL_CACHE_LIMIT = 4096
+
+_split_cache: Dict[str, Tuple[str, ...]] = {}
+
+def parse_shell_milestones(path: str = SETUP_SCRIPT) -> List[str]:
+    """Titles of the `gh milestone create "..."` calls in setup-github-kanban.sh"""
+    with open(path, encoding="utf-8") as f:
+        return MILESTONE_CREATE.findall(f.read())
+
+def split_labels(labels: Any) -> Tuple[str, ...]:
+    """Label names from a comma-separated string or a list, blanks dropped"""
+    if not isinstance(labels, str):
+        return tuple(name.strip() for name in labels or () if name.strip())
+    names = _split_cache.get(labels)
+    if names is None:
+        names = tuple(name.strip() for name in labels.split(",") if name.strip())
+        if len(_split_cache) < LABEL_CACHE_LIMIT:
+            _split_cache[labels] = names
+    return names
+
+class IssueSpec:
+    """One issue to create: title, body, label names and milestone title, without a per-instance dict"""
+
+    __slots__ = ("title", "body", "labels", "milestone")
+
+    def __init__(self, title: str, body: str = "", labels: Tuple[str, ...] = (), milestone: str = ""):
+        self.title = title
+        self.body = body
+        self.labels = labels
+        self.milestone = milestone
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "IssueSpec":
+        """Build from a catalog spec dict; absent fields are left empty for the validator to report"""
+        return cls(record.get("title") or "", record.get("body") or "", split_labels(record.get("labels")),
+                   record.get("milestone") or "")
+
+    def as_record(self) -> Dict[str, str]:
+        """The dict form the provisioning engine and backends take"""
+        return {"title": self.title, "body": self.body, "labels": ",".join(self.labels), "milestone": self.milestone}
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, IssueSpec) and all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"IssueSpec({self.title!r}, labels={self.labels!r}, milestone={self.milestone!r})"
+
+class SpecValidator:
+    """Checks specs against a declared label set and milestone list without touching the network
+
+    Label and milestone names must match exactly, as the batched API backend looks them up; a
+    near miss is reported with the declared name it most likely meant. Results are cached per
+    distinct label string and milestone, so a large catalog costs a few dict lookups per spec.
+    """
+
+    def __init__(self, labels: Iterable[str], milestones: Iterable[str]):
+        self.labels = frozenset(labels)
+        self.milestones = frozenset(milestones)
+        self._label_problems: Dict[Any, List[str]] = {}
+        self._milestone_problems: Dict[str, List[str]] = {}
+
+    @classmethod
+    def declared(cls, manifest: Optional[str] = None, setup_script: str = SETUP_SCRIPT) -> "SpecValidator":
+        """A validator for the labels in `manifest` (default: the setup script's maps) and the setup script's milestones"""
+        return cls((label["name"] for label in load_declared(manifest)), parse_shell_milestones(setup_script))
+
+    @staticmethod
+    def suggest(name: str, choices: frozenset) -> str:
+        folded = name.casefold()
+        close = [choice for choice in choices if choice.casefold() == folded]
+        close = close or difflib.get_close_matches(name, choices, n=1, cutoff=0.75)
+        return f" (did you mean '{close[0]}'?)" if close else ""
+
+    def label_problems(self, labels: Any) -> List[str]:
+        key = labels if isinstance(labels, (str, tuple)) else tuple(labels or ())
+        problems = self._label_problems.get(key)
+        if problems is None:
+            names = split_labels(labels)
+            problems = [f"unknown label '{name}'{self.suggest(name, self.labels)}"
+                        for name in names if name not in self.labels]
+            if not names:
+                problems.append("no labels")
+            if len(self._label_problems) < LABEL_CACHE_LIMIT:
+                self._label_problems[key] = problems
+        return problems
+
+    def milestone_problems(self, milestone: str) -> List[str]:
+        problems = self._milestone_problems.get(milestone)
+        if problems is None:
+            problems = ([] if milestone in self.milestones else
+                        [f"unknown milestone '{milestone}'{self.suggest(milestone, self.milestones)}" if milestone
+                         else "no milestone"])
+            if len(self._milestone_problems) < LABEL_CACHE_LIMIT:
+                self._milestone_problems[milestone] = problems
+        return problems
+
+    def check(self, spec: IssueSpec) -> List[str]:
+        """Every problem with one spec; an empty list means it can be created as is"""
+        problems = [] if spec.title.strip() else ["no title"]
+        return problems + self.label_problems(spec.labels) + self.milestone_problems(spec.milestone)
+
+    def validate(self, specs: Iterable[IssueSpec]) -> Tuple[int, List[Tuple[int, str, str]]]:
+        """Check every spec in one streaming pass: (specs seen, [(position, title, problem), ...])"""
+        found = []
+        count = 0
+        for count, spec in enumerate(specs, 1):
+            for problem in self.check(spec):
+                found.append((count, spec.title, problem))
+        return count, found
+
+def iter_specs(records: Iterable[Dict[str, Any]]) -> Iterator[IssueSpec]:
+    return map(IssueSpec.from_record, records)
+
+def validate_catalogs(paths: Iterable[str], validator: SpecValidator) -> Tuple[int, List[str]]:
+    """Validate catalogs end to end: (specs checked, one message per malformed line or invalid spec)"""
+    total = 0
+    messages: List[str] = []
+    for path in paths:
+        errors: List[CatalogError] = []
+        count, found = validator.validate(iter_specs(iter_catalog(path, announce=False, errors=errors)))
+        total += count
+        messages.extend(str(error) for error in errors)
+        messages.extend(f"{path} spec {position} {title!r}: {problem}" for position, title, problem in found)
+    return total, messages
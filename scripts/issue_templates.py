@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Issue Body Templates
+Compiles catalog templates once and renders specs in batches, reusing identical rendered bodies instead of re-rendering them
+"""
+
+from operator import itemgetter
+from string import Formatter
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from pipeline import chunked
+
+RENDER_BATCH = 512
+# Upper bound on cached renders and shared bodies, so streaming a huge catalog stays bounded
+MAX_CACHED = 65536
+# A template that has missed this often without ever paying off (e.g. a title carrying a unique
+# counter) stops caching and renders directly
+CACHE_PROBATION = 4096
+
+_compiled: Dict[str, "CompiledTemplate"] = {}
+_texts: Dict[str, str] = {}
+
+def share_text(text: str) -> str:
+    """Return one shared object per distinct rendered text
+
+    Sharing the object means its str hash, and the body digest issue_index memoizes on it, are
+    computed once no matter how many specs carry the same body.
+    """
+    shared = _texts.get(text)
+    if shared is None:
+        if len(_texts) >= MAX_CACHED:
+            _texts.clear()
+        shared = _texts[text] = text
+    return shared
+
+class CompiledTemplate:
+    """A str.format template parsed once, with renders cached by the values of the fields it uses"""
+
+    def __init__(self, source: str):
+        self.source = source
+        names = {name for _, name, _, _ in Formatter().parse(source) if name is not None}
+        if "" in names or any(name.isdigit() for name in names):
+            raise ValueError(f"template {source[:40]!r} uses positional fields; name every field")
+        self.fields: Tuple[str, ...] = tuple(sorted({name.split(".")[0].split("[")[0] for name in names}))
+        self._key = itemgetter(*self.fields) if self.fields else None
+        self._cache: Dict[Any, str] = {}
+        self.caching = True
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, row: Dict[str, Any]) -> str:
+        return self.render_many([row])[0]
+
+    def render_many(self, rows: List[Dict[str, Any]]) -> List[str]:
+        """Render a batch of rows, serving repeats of an already-rendered combination from the cache"""
+        if self._key is None:
+            self.hits += len(rows)
+            return [self.source] * len(rows)
+        format_map = self.source.format_map
+        if not self.caching:
+            self.misses += len(rows)
+            return [format_map(row) for row in rows]
+        key_of = self._key
+        cache = self._cache
+        out = []
+        misses = 0
+        for row in rows:
+            key = key_of(row)
+            text = cache.get(key)
+            if text is None:
+                misses += 1
+                text = cache[key] = share_text(format_map(row))
+            out.append(text)
+        self.hits += len(rows) - misses
+        self.misses += misses
+        if self.misses >= CACHE_PROBATION and self.hits < self.misses:
+            self.caching = False
+            cache.clear()
+        elif len(cache) >= MAX_CACHED:
+            cache.clear()
+        return out
+
+def compile_template(source: str) -> CompiledTemplate:
+    """Compile a template, sharing one compiled copy (and its render cache) per distinct source"""
+    compiled = _compiled.get(source)
+    if compiled is None:
+        compiled = _compiled[source] = CompiledTemplate(source)
+    return compiled
+
+class TemplateSet:
+    """The compiled templates of one catalog record; fields it has no template for come from the row"""
+
+    def __init__(self, template: Dict[str, str], fields: Sequence[str]):
+        self.templates = [(field, compile_template(template[field])) for field in fields if field in template]
+        self.passthrough = [field for field in fields if field not in template]
+
+    @property
+    def complete(self) -> bool:
+        """True when every field is templated, so rendered rows never lack one"""
+        return not self.passthrough
+
+    def render(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        rendered = {field: row[field] for field in self.passthrough if field in row}
+        for field, template in self.templates:
+            rendered[field] = template.render(row)
+        return rendered
+
+    def render_batch(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Render a batch column by column, one tight loop per template"""
+        if self.passthrough:
+            return [self.render(row) for row in rows]
+        names = [field for field, _ in self.templates]
+        columns = [template.render_many(rows) for _, template in self.templates]
+        return [dict(zip(names, values)) for values in zip(*columns)]
+
+def render_rows(compiled: TemplateSet, rows: Iterable[Dict[str, Any]],
+                batch_size: int = RENDER_BATCH) -> Iterator[List[Dict[str, Any]]]:
+    """Render a stream of rows, a batch of up to `batch_size` at a time"""
+    for batch in chunked(rows, batch_size):
+        yield compiled.render_batch(batch)
+
+def cache_stats() -> Dict[str, int]:
+    """Render cache hits and misses across every compiled template"""
+    return {
+        "templates": len(_compiled),
+        "hits": sum(t.hits for t in _compiled.values()),
+        "misses": sum(t.misses for t in _compiled.values()),
+        "distinct_texts": len(_texts),
+    }
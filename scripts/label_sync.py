@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Label Sync
+Diffs the declared label set against a repository's labels and applies only the creates and updates that differ
+"""
+
+import json
+import os
+import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote
+
+from github_client import GitHubAPIError, GitHubClient
+from provisioning import run_gh_command
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SETUP_SCRIPT = os.path.join(SCRIPTS_DIR, "setup-github-kanban.sh")
+DEFAULT_LABEL_JOBS = 4
+
+Label = Dict[str, str]
+
+def make_label(name: str, color: str, description: str = "") -> Label:
+    return {"name": name.strip(), "color": color.strip().lstrip("#").lower(), "description": description.strip()}
+
+def parse_label_lines(lines: Iterable[str]) -> List[Label]:
+    """Parse `name|color|description` lines, the format setup-github-kanban.sh pipes in"""
+    labels = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            name, color, description = (line.split("|", 2) + ["", ""])[:3]
+            labels.append(make_label(name, color, description))
+    return labels
+
+def parse_shell_maps(path: str = SETUP_SCRIPT) -> List[Label]:
+    """Read the `["name"]="COLOR|description"` entries of the label maps in setup-github-kanban.sh"""
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    return [make_label(name, color, description)
+            for name, color, description in re.findall(r'\["([^"]+)"\]="([0-9A-Fa-f]{6})\|([^"]*)"', text)]
+
+def parse_labels_yml(path: str) -> List[Label]:
+    """Read a labels.yml manifest of `- name:` / `color:` / `description:` entries"""
+    labels: List[Label] = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            match = re.match(r'\s*(-\s*)?(name|color|description):\s*"?(.*?)"?\s*$', line)
+            if not match:
+                continue
+            dash, key, value = match.groups()
+            if dash or key == "name" and (not labels or "name" in labels[-1]):
+                labels.append({})
+            labels[-1][key] = value
+    return [make_label(l.get("name", ""), l.get("color", "ededed"), l.get("description", "")) for l in labels]
+
+def load_declared(manifest: Optional[str] = None, stream: Optional[Iterable[str]] = None) -> List[Label]:
+    """Load the declared labels from piped lines, a labels.yml file, or the setup script's maps"""
+    if stream is not None:
+        return parse_label_lines(stream)
+    if manifest and manifest.endswith((".yml", ".yaml")):
+        return parse_labels_yml(manifest)
+    return parse_shell_maps(manifest or SETUP_SCRIPT)
+
+def label_key(name: str) -> str:
+    """GitHub label names are case-insensitive"""
+    return name.casefold()
+
+def diff_labels(declared: List[Label], existing: List[Label]) -> Tuple[List[Label], List[Label], int]:
+    """Return (labels to create, labels to update, unchanged count)
+
+    Updates carry `current_name` so a label can be re-cased. Labels that exist remotely but are not
+    declared are left untouched.
+    """
+    current = {label_key(l["name"]): make_label(l["name"], l.get("color") or "", l.get("description") or "")
+               for l in existing}
+    creates: List[Label] = []
+    updates: List[Label] = []
+    unchanged = 0
+    for label in declared:
+        have = current.get(label_key(label["name"]))
+        if have is None:
+            creates.append(label)
+        elif have != label:
+            updates.append({**label, "current_name": have["name"]})
+        else:
+            unchanged += 1
+    return creates, updates, unchanged
+
+class ApiLabels:
+    """Label reads and writes through a pooled GitHubClient"""
+
+    def __init__(self, repo: str, client: Optional[GitHubClient] = None):
+        self.repo = repo
+        self.client = client or GitHubClient()
+
+    def list(self) -> List[Label]:
+        return list(self.client.paginate(f"/repos/{self.repo}/labels?per_page=100"))
+
+    def create(self, label: Label) -> bool:
+        try:
+            self.client.rest("POST", f"/repos/{self.repo}/labels", label)
+        except (GitHubAPIError, OSError) as e:
+            print(f"Error creating label {label['name']}: {e}")
+            return False
+        return True
+
+    def update(self, label: Label) -> bool:
+        payload = {"new_name": label["name"], "color": label["color"], "description": label["description"]}
+        try:
+            self.client.rest("PATCH", f"/repos/{self.repo}/labels/{quote(label['current_name'], safe='')}", payload)
+        except (GitHubAPIError, OSError) as e:
+            print(f"Error updating label {label['name']}: {e}")
+            return False
+        return True
+
+class GhLabels:
+    """Label reads and writes through `gh api`, which prints the label JSON on success"""
+
+    def __init__(self, repo: str):
+        self.repo = repo
+
+    def list(self) -> List[Label]:
+        """Every label, one compact JSON array per page so even an empty repository prints something"""
+        cmd = ["gh", "api", "--paginate", f"repos/{self.repo}/labels?per_page=100",
+               "--jq", "map({name, color, description}) | tojson"]
+        output = run_gh_command(cmd)
+        if not output:
+            # run_gh_command already reported the failure; an empty label list must not read as "create all"
+            raise subprocess.CalledProcessError(1, cmd)
+        return [label for page in output.splitlines() if page for label in json.loads(page)]
+
+    def _fields(self, label: Label) -> List[str]:
+        return ["-f", f"color={label['color']}", "-f", f"description={label['description']}"]
+
+    def create(self, label: Label) -> bool:
+        return bool(run_gh_command(["gh", "api", f"repos/{self.repo}/labels",
+                                    "-f", f"name={label['name']}"] + self._fields(label)))
+
+    def update(self, label: Label) -> bool:
+        return bool(run_gh_command(["gh", "api", "-X", "PATCH",
+                                    f"repos/{self.repo}/labels/{quote(label['current_name'], safe='')}",
+                                    "-f", f"new_name={label['name']}"] + self._fields(label)))
+
+def sync_labels(target, declared: List[Label], jobs: int = DEFAULT_LABEL_JOBS, dry_run: bool = False) -> bool:
+    """List the repository's labels once, then create/update only the differing ones concurrently"""
+    creates, updates, unchanged = diff_labels(declared, target.list())
+    print(f"🏷 {len(declared)} declared labels: {len(creates)} to create, {len(updates)} to update, {unchanged} unchanged")
+    if dry_run:
+        for label in creates:
+            print(f"  + {label['name']} #{label['color']} {label['description']}")
+        for label in updates:
+            print(f"  ~ {label['current_name']} -> {label['name']} #{label['color']} {label['description']}")
+        return True
+
+    operations = [(target.create, label) for label in creates] + [(target.update, label) for label in updates]
+    if not operations:
+        return True
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        results = list(pool.map(lambda op: op[0](op[1]), operations))
+    for (func, label), ok in zip(operations, results):
+        verb = "Created" if func == target.create else "Updated"
+        print(f"✓ {verb} label: {label['name']}" if ok else f"Failed to sync label: {label['name']}")
+    return all(results)
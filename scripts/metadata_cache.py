@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Repository Metadata Cache
+Label IDs, milestone numbers/IDs and the project node ID, fetched once per run and persisted with a TTL
+"""
+
+import fcntl
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+CACHE_DIR = os.environ.get("KANBAN_CACHE_DIR", ".kanban-cache")
+DEFAULT_TTL = 24 * 3600
+
+def cache_path(name: str) -> str:
+    """Path of a file inside the shared on-disk cache directory, creating the directory if needed"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return os.path.join(CACHE_DIR, name)
+
+class MetadataCache:
+    """Lazily loaded metadata for one repository/project pair
+
+    Entries are served from disk while younger than `ttl` seconds. A lookup that misses triggers one
+    refetch (the label or milestone may have been created since the cache was written) before the
+    miss is reported to the caller.
+    """
+
+    def __init__(self, key: str, fetch: Callable[[], Dict[str, Any]], ttl: float = DEFAULT_TTL,
+                 path: Optional[str] = None):
+        self.key = key
+        self.fetch = fetch
+        self.ttl = ttl
+        self.path = path or cache_path("metadata.json")
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, Any]] = None
+        self._fresh = False
+
+    def _load_disk(self) -> Optional[Dict[str, Any]]:
+        if self.ttl <= 0:
+            return None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                entry = json.load(f).get(self.key)
+        except (OSError, ValueError):
+            return None
+        if not entry or time.time() - entry.get("fetched_at", 0) > self.ttl:
+            return None
+        return entry["data"]
+
+    def _save_disk(self, data: Dict[str, Any]) -> None:
+        """Merge this key's entry into the file, locked so concurrent runs don't drop each other's keys"""
+        with open(f"{self.path}.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    entries = json.load(f)
+            except (OSError, ValueError):
+                entries = {}
+            entries[self.key] = {"fetched_at": time.time(), "data": data}
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp, self.path)
+
+    def _refresh(self) -> Dict[str, Any]:
+        self._data = self.fetch()
+        self._fresh = True
+        self._save_disk(self._data)
+        return self._data
+
+    def get(self) -> Dict[str, Any]:
+        """Return the cached metadata, loading it from disk or fetching it on first use"""
+        with self._lock:
+            if self._data is None:
+                self._data = self._load_disk()
+            if self._data is None:
+                self._refresh()
+            return self._data
+
+    def invalidate(self) -> None:
+        """Drop the in-memory copy so the next lookup refetches"""
+        with self._lock:
+            self._data = None
+            self._fresh = False
+
+    def lookup(self, section: str, name: Optional[str] = None) -> Any:
+        """Resolve data[section][name] (or data[section]), refetching once if a disk-cached copy misses"""
+        data = self.get()
+        value = data.get(section)
+        if name is not None:
+            value = (value or {}).get(name)
+        if value is not None:
+            return value
+        with self._lock:
+            if self._fresh:
+                return None
+            data = self._refresh()
+        value = data.get(section)
+        return (value or {}).get(name) if name is not None else value
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Parse Task Breakdown
+Lists the issue specs in TASK_BREAKDOWN.md, writes them as a JSONL catalog, or shows how a catalog has drifted from them
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+
+from issue_catalog import CatalogError, catalog_path, iter_catalogs
+from task_breakdown import TASK_BREAKDOWN, BreakdownError, load_breakdown
+
+def label_set(spec):
+    return {name.strip().lower() for name in spec["labels"].split(",") if name.strip()}
+
+def main():
+    """Parse the breakdown (or reuse the cached parse) and report on it"""
+    parser = argparse.ArgumentParser(description="Turn TASK_BREAKDOWN.md into issue specs")
+    parser.add_argument("--input", "-i", default=TASK_BREAKDOWN, metavar="PATH",
+                        help="task breakdown document (default: TASK_BREAKDOWN.md)")
+    parser.add_argument("--jsonl", metavar="PATH", help="write the specs as a JSONL catalog")
+    parser.add_argument("--diff", action="append", default=[], metavar="CATALOG",
+                        help="compare against catalogs (repeatable, e.g. --diff board --diff missing)")
+    parser.add_argument("--no-cache", action="store_true", help="parse the document even if the cached parse is current")
+    args = parser.parse_args()
+
+    try:
+        specs = load_breakdown(args.input, use_cache=not args.no_cache)
+    except (OSError, BreakdownError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    layers = Counter(spec["layer"] for spec in specs)
+    print(f"📄 {len(specs)} issues in {args.input}: "
+          + ", ".join(f"{layer} {count}" for layer, count in sorted(layers.items())))
+    for milestone, count in sorted(Counter(spec["milestone"] for spec in specs).items()):
+        print(f"   {milestone}: {count}")
+
+    if args.jsonl:
+        with open(args.jsonl, "w", encoding="utf-8") as f:
+            for spec in specs:
+                f.write(json.dumps({key: spec[key] for key in ("title", "labels", "milestone", "body")},
+                                   ensure_ascii=False) + "\n")
+        print(f"📄 Catalog written to {args.jsonl}")
+
+    if args.diff:
+        try:
+            catalog = {spec["title"]: spec for spec in iter_catalogs(args.diff, announce=False)}
+        except (OSError, CatalogError) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        names = ", ".join(catalog_path(name) for name in args.diff)
+        breakdown = {spec["title"]: spec for spec in specs}
+        only_breakdown = [title for title in breakdown if title not in catalog]
+        only_catalog = [title for title in catalog if title not in breakdown]
+        differing = [title for title in breakdown if title in catalog and (
+            label_set(breakdown[title]) != label_set(catalog[title])
+            or breakdown[title]["milestone"] != catalog[title]["milestone"])]
+        for title in only_breakdown:
+            print(f"  + {title} (not in {names})")
+        for title in only_catalog:
+            print(f"  - {title} (not in the breakdown)")
+        for title in differing:
+            print(f"  ~ {title} (labels or milestone differ)")
+        if only_breakdown or only_catalog or differing:
+            print(f"⚠ {len(only_breakdown)} missing, {len(only_catalog)} extra, {len(differing)} differing")
+            sys.exit(1)
+        print(f"✓ {names} matches the breakdown")
+
+if __name__ == "__main__":
+    main()
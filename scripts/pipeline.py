@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Staged Work Pipeline
+Thread-pooled stages joined by bounded queues, with per-stage queue depth and latency statistics
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_QUEUE_SIZE = 32
+_DONE = object()
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an unsorted list, 0.0 when empty"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+def bounded_map(func: Callable[[Any], Any], items: Iterable[Any], workers: int,
+                window: int = 0) -> Iterator[Tuple[Any, Any]]:
+    """Yield (item, func(item)) in input order, pulling items lazily with at most `window` in flight
+
+    Unlike Executor.map this never reads ahead of the window, so an unbounded stream is processed
+    in constant memory.
+    """
+    window = window or 2 * max(1, workers)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        pending: deque = deque()
+        for item in items:
+            pending.append((item, pool.submit(func, item)))
+            if len(pending) >= window:
+                item, future = pending.popleft()
+                yield item, future.result()
+        while pending:
+            item, future = pending.popleft()
+            yield item, future.result()
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Group a stream into lists of up to `size` items"""
+    iterator = iter(items)
+    return iter(lambda: list(islice(iterator, size)), [])
+
+class Stage:
+    """One pipeline step: `func` maps an item to the next stage's input, or None to drop it as failed"""
+
+    def __init__(self, name: str, func: Callable[[Any], Optional[Any]], workers: int = 1):
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        self.latencies: List[float] = []
+        self.failed = 0
+        self.max_depth = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, ok: bool) -> None:
+        with self._lock:
+            self.latencies.append(latency)
+            if not ok:
+                self.failed += 1
+
+    def stats(self, elapsed: float = 0.0) -> Dict[str, Any]:
+        busy = sum(self.latencies)
+        return {
+            "stage": self.name,
+            "workers": self.workers,
+            "processed": len(self.latencies),
+            "failed": self.failed,
+            "max_queue_depth": self.max_depth,
+            "p50_seconds": percentile(self.latencies, 50),
+            "p99_seconds": percentile(self.latencies, 99),
+            "busy_seconds": busy,
+            # Fraction of the run this stage's workers spent busy; the bottleneck stage approaches 1.0
+            "utilization": busy / (self.workers * elapsed) if elapsed else 0.0,
+        }
+
+class Pipeline:
+    """Runs items through stages concurrently so the slowest stage alone sets the throughput"""
+
+    def __init__(self, stages: List[Stage], queue_size: int = DEFAULT_QUEUE_SIZE,
+                 on_result: Optional[Callable[[Any, bool], None]] = None):
+        self.stages = stages
+        self.queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+        self.elapsed = 0.0
+        # Called with (last stage output, True) or (input of the stage that failed, False) per item
+        self.on_result = on_result
+
+    def _put(self, index: int, item: Any) -> None:
+        self.queues[index].put(item)
+        stage = self.stages[index]
+        depth = self.queues[index].qsize()
+        if depth > stage.max_depth:
+            stage.max_depth = depth
+
+    def _worker(self, index: int, results: List[bool], remaining: List[int], lock: threading.Lock) -> None:
+        stage = self.stages[index]
+        last = index == len(self.stages) - 1
+        while True:
+            entry = self.queues[index].get()
+            if entry is _DONE:
+                break
+            position, item = entry
+            start = time.monotonic()
+            try:
+                output = stage.func(item)
+            except Exception as e:
+                print(f"Error in {stage.name} stage: {e}")
+                output = None
+            stage.record(time.monotonic() - start, output is not None)
+            if output is None:
+                if self.on_result:
+                    self.on_result(item, False)
+                continue
+            if last:
+                results[position] = True
+                if self.on_result:
+                    self.on_result(output, True)
+            else:
+                self._put(index + 1, (position, output))
+
+        # The last worker of a stage to finish tells every worker downstream to stop
+        with lock:
+            remaining[index] -= 1
+            finished = remaining[index] == 0
+        if finished and not last:
+            for _ in range(self.stages[index + 1].workers):
+                self.queues[index + 1].put(_DONE)
+
+    def run(self, items: Iterable[Any]) -> List[bool]:
+        """Feed items through every stage and return per-item success in input order
+
+        An exception from the item stream is raised once the items fed before it have drained.
+        """
+        results: List[bool] = []
+        remaining = [stage.workers for stage in self.stages]
+        lock = threading.Lock()
+        threads = [threading.Thread(target=self._worker, args=(i, results, remaining, lock), daemon=True)
+                   for i, stage in enumerate(self.stages) for _ in range(stage.workers)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        try:
+            for position, item in enumerate(items):
+                results.append(False)
+                self._put(0, (position, item))
+        finally:
+            # Stop the workers even when the item stream raises, so what was fed drains and no thread is left blocked
+            for _ in range(self.stages[0].workers):
+                self.queues[0].put(_DONE)
+            for thread in threads:
+                thread.join()
+            self.elapsed = time.monotonic() - start
+        return results
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [stage.stats(self.elapsed) for stage in self.stages]
+
+    def print_report(self) -> None:
+        """Print per-stage throughput figures so the bottleneck stage stands out"""
+        print(f"\n⏱ Pipeline finished in {self.elapsed:.1f}s")
+        print(f"{'stage':<10} {'workers':>7} {'done':>6} {'failed':>6} {'max q':>6} {'p50 ms':>8} {'p99 ms':>8} {'util':>6}")
+        for s in self.stats():
+            print(f"{s['stage']:<10} {s['workers']:>7} {s['processed']:>6} {s['failed']:>6} {s['max_queue_depth']:>6} "
+                  f"{s['p50_seconds'] * 1000:>8.1f} {s['p99_seconds'] * 1000:>8.1f} {s['utilization']:>6.0%}")
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Project Fields
+Creates the Priority, Layer and Component single-select fields on a Projects v2 board and fills them from issue labels in batched mutations
+"""
+
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from board_mirror import issue_layer
+from github_client import GitHubAPIError, GitHubClient
+
+DEFAULT_FIELD_BATCH = 50
+# Projects v2 option colors, by field, in option order; anything past the list is GRAY
+OPTION_COLORS = {
+    "Priority": ["RED", "ORANGE", "YELLOW", "GRAY"],
+    "Layer": ["BLUE", "GREEN", "YELLOW", "ORANGE", "PURPLE", "PINK"],
+}
+
+FIELDS_QUERY = """query($project: ID!) {
+  node(id: $project) {
+    ... on ProjectV2 {
+      fields(first: 100) {
+        nodes {
+          ... on ProjectV2FieldCommon { id name dataType }
+          ... on ProjectV2SingleSelectField { options { id name } }
+        }
+      }
+    }
+  }
+}"""
+
+ITEMS_QUERY = """query($project: ID!, $after: String) {
+  node(id: $project) {
+    ... on ProjectV2 {
+      items(first: 100, after: $after) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          id
+          content { ... on Issue { number labels(first: 50) { nodes { name } } } }
+          fieldValues(first: 50) {
+            nodes { ... on ProjectV2ItemFieldSingleSelectValue { name field { ... on ProjectV2FieldCommon { name } } } }
+          }
+        }
+      }
+    }
+  }
+}"""
+
+CREATE_FIELD = """mutation($project: ID!, $name: String!, $options: [ProjectV2SingleSelectFieldOptionInput!]) {
+  createProjectV2Field(input: {projectId: $project, dataType: SINGLE_SELECT, name: $name, singleSelectOptions: $options}) {
+    projectV2Field { ... on ProjectV2SingleSelectField { id name options { id name } } }
+  }
+}"""
+
+class ProjectFieldError(ValueError):
+    """Raised when the project already has a field with one of the managed names but another data type"""
+
+def declared_fields(labels: Iterable[Dict[str, str]]) -> Dict[str, List[str]]:
+    """Option lists for each field, in declared label order: Prio:X -> Priority X, L0:... -> Layer L0, Comp:X -> Component X"""
+    fields: Dict[str, List[str]] = {"Priority": [], "Layer": [], "Component": []}
+    for label in labels:
+        name = label["name"]
+        field, value = label_field(name)
+        if field and value not in fields[field]:
+            fields[field].append(value)
+    return fields
+
+def label_field(name: str) -> Tuple[Optional[str], Optional[str]]:
+    """(field, option) a single label maps to, or (None, None)"""
+    if name.startswith("Prio:"):
+        return "Priority", name[len("Prio:"):]
+    if name.startswith("Comp:"):
+        return "Component", name[len("Comp:"):]
+    layer = issue_layer([name])
+    return ("Layer", layer) if layer else (None, None)
+
+def derive_values(labels: Iterable[str], options: Dict[str, List[str]]) -> Dict[str, str]:
+    """Field values implied by an issue's labels
+
+    An issue with several Comp: labels gets the one declared first, which puts specific components
+    (Crawler, Embedding) ahead of catch-alls (Infra, ML).
+    """
+    found: Dict[str, List[str]] = {}
+    for name in labels:
+        field, value = label_field(name.strip())
+        if field:
+            found.setdefault(field, []).append(value)
+    values = {}
+    for field, candidates in found.items():
+        order = options.get(field) or []
+        values[field] = min(candidates, key=lambda value: order.index(value) if value in order else len(order))
+    return values
+
+def option_input(field: str, names: List[str]) -> List[Dict[str, str]]:
+    colors = OPTION_COLORS.get(field, [])
+    return [{"name": name, "color": colors[i] if i < len(colors) else "GRAY", "description": ""}
+            for i, name in enumerate(names)]
+
+class ProjectFields:
+    """The label-derived single-select fields of one project: their IDs, option IDs and the writes that fill them"""
+
+    def __init__(self, client: GitHubClient, project: str, options: Dict[str, List[str]],
+                 batch_size: int = DEFAULT_FIELD_BATCH):
+        self.client = client
+        self.project = project
+        self.options = options
+        self.batch_size = max(1, batch_size)
+        self.fields: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Fetch every project field as {name: {"id", "type", "options": {option name: id}}}; only single-selects have options"""
+        data = self.client.graphql(FIELDS_QUERY, {"project": self.project})
+        nodes = (((data.get("node") or {}).get("fields")) or {}).get("nodes") or []
+        self.fields = {node["name"]: {"id": node["id"], "type": node.get("dataType"),
+                                      "options": {o["name"]: o["id"] for o in node.get("options") or []}}
+                       for node in nodes if node.get("name")}
+        return self.fields
+
+    def ensure(self, dry_run: bool = False) -> List[str]:
+        """Create any of the fields that are missing, returning their names
+
+        Options missing from a field that already exists are reported rather than added, since
+        replacing a field's option list can clear values people have set by hand. A same-named
+        field of another type cannot be reused or created alongside, so it raises ProjectFieldError.
+        """
+        self.load()
+        clashes = [f"{name} is {self.fields[name]['type']}" for name, options in self.options.items()
+                   if options and name in self.fields and self.fields[name]["type"] != "SINGLE_SELECT"]
+        if clashes:
+            raise ProjectFieldError(f"project fields must be single-select but {', '.join(clashes)}; "
+                                    f"rename or delete them so they can be created from the labels")
+        created = []
+        for name, options in self.options.items():
+            if not options:
+                continue
+            if name in self.fields:
+                missing = [option for option in options if option not in self.fields[name]["options"]]
+                if missing:
+                    print(f"⚠ Field {name} has no option for {', '.join(missing)}; add them in the project settings")
+                continue
+            created.append(name)
+            if dry_run:
+                print(f"  + field {name}: {', '.join(options)}")
+                continue
+            data = self.client.graphql(CREATE_FIELD, {"project": self.project, "name": name,
+                                                      "options": option_input(name, options)})
+            field = (data.get("createProjectV2Field") or {}).get("projectV2Field") or {}
+            self.fields[name] = {"id": field["id"], "type": "SINGLE_SELECT",
+                                 "options": {o["name"]: o["id"] for o in field.get("options") or []}}
+            print(f"✓ Created field {name} with {len(options)} options")
+        return created
+
+    def iter_items(self) -> Iterator[Dict[str, Any]]:
+        """Every issue item on the board with its labels and current single-select values"""
+        after = None
+        while True:
+            data = self.client.graphql(ITEMS_QUERY, {"project": self.project, "after": after})
+            items = ((data.get("node") or {}).get("items")) or {}
+            for node in items.get("nodes") or []:
+                content = node.get("content") or {}
+                if "number" not in content:
+                    continue
+                values = {}
+                for value in (node.get("fieldValues") or {}).get("nodes") or []:
+                    field = (value.get("field") or {}).get("name")
+                    if field and value.get("name") is not None:
+                        values[field] = value["name"]
+                yield {"id": node["id"], "number": content["number"], "values": values,
+                       "labels": [label["name"] for label in (content.get("labels") or {}).get("nodes") or []]}
+            page = items.get("pageInfo") or {}
+            if not page.get("hasNextPage"):
+                return
+            after = page["endCursor"]
+
+    def changes(self, item_id: str, labels: Iterable[str], current: Optional[Dict[str, str]] = None) -> List[Tuple[str, str, str, str]]:
+        """(item id, field name, field id, option id) for each derived value that differs from `current`"""
+        updates = []
+        for field, value in derive_values(labels, self.options).items():
+            if (current or {}).get(field) == value or field not in self.fields:
+                continue
+            option = self.fields[field]["options"].get(value)
+            if option:
+                updates.append((item_id, field, self.fields[field]["id"], option))
+        return updates
+
+    def apply(self, updates: List[Tuple[str, str, str, str]]) -> Tuple[int, int]:
+        """Write updates with aliased updateProjectV2ItemFieldValue mutations, returning (written, failed)"""
+        written = failed = 0
+        for start in range(0, len(updates), self.batch_size):
+            batch = updates[start:start + self.batch_size]
+            params = ["$project: ID!"]
+            fields = []
+            variables: Dict[str, Any] = {"project": self.project}
+            for i, (item_id, _, field_id, option_id) in enumerate(batch):
+                params.append(f"$i{i}: ID!, $f{i}: ID!, $v{i}: ProjectV2FieldValue!")
+                fields.append(f"u{i}: updateProjectV2ItemFieldValue(input: {{projectId: $project, itemId: $i{i}, "
+                              f"fieldId: $f{i}, value: $v{i}}}) {{ projectV2Item {{ id }} }}")
+                variables.update({f"i{i}": item_id, f"f{i}": field_id, f"v{i}": {"singleSelectOptionId": option_id}})
+            mutation = f"mutation({', '.join(params)}) {{\n  " + "\n  ".join(fields) + "\n}"
+            try:
+                data, errors = self.client.graphql_partial(mutation, variables)
+            except (GitHubAPIError, OSError) as e:
+                print(f"Error setting a batch of {len(batch)} field values: {e}")
+                failed += len(batch)
+                continue
+            for error in errors:
+                print(f"Error setting field value {(error.get('path') or ['?'])[0]}: {error.get('message', '')}")
+            done = sum(1 for i in range(len(batch)) if (data.get(f"u{i}") or {}).get("projectV2Item"))
+            written += done
+            failed += len(batch) - done
+        return written, failed
+
+    def setter(self) -> Callable[[Dict[str, Any]], None]:
+        """A provisioning field setter: fills a newly added item's fields from its spec's labels"""
+        def set_fields(spec: Dict[str, Any]) -> None:
+            try:
+                with self._lock:
+                    if not self.fields:
+                        self.ensure()
+            except (GitHubAPIError, OSError, ProjectFieldError) as e:
+                print(f"⚠ Project fields not set on {spec['title']}: {e}")
+                return
+            labels = [name.strip() for name in spec["labels"].split(",") if name.strip()]
+            _, failed = self.apply(self.changes(spec["item_id"], labels))
+            if failed:
+                print(f"⚠ {failed} project fields not set on {spec['title']}")
+        return set_fields
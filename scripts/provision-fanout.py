@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Provision Several Boards
+Creates the issue catalog on many repositories/projects at once, one process per board sharing one rate budget
+"""
+
+import argparse
+import sys
+import time
+
+from fanout import fan_out, load_targets, print_fanout_report, write_fanout_json, write_fanout_prometheus
+from github_client import load_token
+from issue_catalog import catalog_path
+from provisioning import add_provisioning_arguments, parse_stage_workers, preflight_catalog, provisioning_options
+
+def main():
+    """Fan the catalog out to every target and report per-target results"""
+    parser = argparse.ArgumentParser(description="Provision the issue catalog onto several boards in parallel")
+    parser.add_argument("--target", "-t", action="append", default=[], metavar="OWNER/REPO[:[LOGIN/]N]",
+                        help="board to provision; repeat or comma-separate (project owner defaults to the repo owner)")
+    parser.add_argument("--targets-file", metavar="PATH", help="file with one target per line")
+    parser.add_argument("--catalog", default="board", metavar="PATH",
+                        help="JSONL issue catalog, or \"breakdown\" for TASK_BREAKDOWN.md (default: catalog/board.jsonl)")
+    parser.add_argument("--processes", "-p", type=int, default=0, metavar="N",
+                        help="boards provisioned at once (default: one process per target)")
+    add_provisioning_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        targets = load_targets(args.target, args.targets_file)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    if not targets:
+        parser.error("give at least one --target or a --targets-file")
+    total = preflight_catalog(args.catalog, args.validate)
+
+    token = load_token() if args.backend != "gh" else ""
+    backend = args.backend if args.backend != "auto" else "api" if token else "gh"
+    stage_workers = parse_stage_workers(args)
+    options = provisioning_options(args)
+    # Each board reports its own progress to its log; the console shows boards as they finish
+    options["progress"] = False
+    settings = {
+        "backend": backend,
+        "token": token,
+        "metadata_ttl": args.metadata_ttl,
+        "journal": args.journal,
+        "resume": args.resume,
+        "mirror": args.mirror,
+        "fields": args.fields,
+        "similarity": (args.similarity, args.skip_similar),
+        "http_cache": args.http_cache,
+        "reconcile": args.reconcile,
+        "dry_run": args.dry_run,
+        "concurrency": max(1, sum(stage_workers.values()) if stage_workers else args.jobs),
+        "writes_per_minute": args.writes_per_minute,
+        "options": options,
+    }
+
+    print(f"🚀 Provisioning {total} issues from {catalog_path(args.catalog)} onto {len(targets)} boards")
+    print(f"   {args.writes_per_minute:.0f} writes/minute shared across all boards, {backend} backend")
+    started = time.monotonic()
+    results = fan_out(targets, args.catalog, settings, args.processes)
+    elapsed = time.monotonic() - started
+    print_fanout_report(results, elapsed)
+    if args.metrics_json:
+        write_fanout_json(args.metrics_json, results, elapsed)
+        print(f"📄 Metrics written to {args.metrics_json}")
+    if args.metrics_prom:
+        write_fanout_prometheus(args.metrics_prom, results)
+        print(f"📄 Prometheus metrics written to {args.metrics_prom}")
+    if any(r.get("error") or r["failed"] for r in results):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,844 @@
+#!/usr/bin/env python3
+"""
+Issue Provisioning Helpers
+Pluggable gh CLI / API backends and a bounded-concurrency engine used by the issue creation scripts
+"""
+
+import argparse
+import atexit
+import json
+import queue
+import re
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from board_mirror import BoardMirror
+from github_client import GitHubAPIError, GitHubClient, load_token
+from http_cache import use_http_cache
+from issue_catalog import count_specs
+from issue_index import IssueIndex, build_index, normalize_title
+from metadata_cache import DEFAULT_TTL, MetadataCache
+from pipeline import Pipeline, Stage, bounded_map, chunked
+from rate_limiter import DEFAULT_CREATE_RATE, configure_shared_limiter, server_error_backoff, shared_limiter
+from run_journal import ADDED, CREATED, DEFAULT_JOURNAL, INTENT, RunJournal, open_journal
+from run_metrics import gh_api_write, gh_operation_name, metrics
+from similarity import DEFAULT_THRESHOLD
+
+# Configuration
+REPO = "ughvvv/Idea_Foundry_Kanban"
+PROJECT_ID = "2"
+PROJECT_OWNER = "ughvvv"
+DEFAULT_JOBS = 4
+DEFAULT_BATCH_SIZE = 25
+BACKENDS = ("auto", "api", "gh")
+PIPELINE_STAGES = ("render", "create", "add", "fields")
+# Outcome of each spec in provisioning results
+RESULT_CREATED = "created"
+RESULT_SKIPPED = "skipped"
+RESULT_FAILED = "failed"
+# gh subcommands that create or modify content and therefore draw from the write budget
+GH_WRITE_SUBCOMMANDS = {"create", "edit", "close", "reopen", "delete", "item-add", "item-edit"}
+# How gh reports the transient server errors that are worth retrying
+GH_SERVER_ERROR = re.compile(r"HTTP (?:500|502|503|504)\b")
+
+def run_gh_command(cmd: List[str]) -> str:
+    """Run a GitHub CLI command and return output, backing off and retrying when rate limited or on a transient 5xx"""
+    limiter = shared_limiter()
+    write = len(cmd) > 2 and cmd[2] in GH_WRITE_SUBCOMMANDS or cmd[1] == "api" and gh_api_write(cmd)
+    operation = gh_operation_name(cmd)
+    run = metrics()
+    for attempt in range(limiter.max_retries + 1):
+        queued = time.monotonic()
+        limiter.acquire(write)
+        start = time.monotonic()
+        run.record_wait(operation, start - queued)
+        ok = False
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            limiter.observe(200, {})
+            ok = True
+            return result.stdout.strip()
+        except subprocess.CalledProcessError as e:
+            throttled = "rate limit" in (e.stderr or "").lower()
+            server_error = GH_SERVER_ERROR.search(e.stderr or "")
+            if not (throttled or server_error) or attempt == limiter.max_retries:
+                print(f"Error running command {' '.join(cmd)}: {e}")
+                return ""
+            if throttled:
+                delay = limiter.backoff(attempt)
+                print(f"⏳ Rate limited running gh {cmd[1]} {cmd[2]}, retrying in {delay:.0f}s")
+            else:
+                delay = server_error_backoff(attempt)
+                print(f"⚠ Server error running gh {cmd[1]} {cmd[2]}, retrying in {delay:.1f}s")
+        finally:
+            limiter.release()
+            run.record(operation, time.monotonic() - start, ok)
+        run.record_retry(operation, delay)
+        time.sleep(delay)
+    return ""
+
+class GhCliBackend:
+    """Provision issues by spawning one gh process per operation"""
+    name = "gh"
+
+    def __init__(self, repo: str = REPO, project_owner: str = PROJECT_OWNER, project_id: str = PROJECT_ID):
+        self.repo = repo
+        self.project_owner = project_owner
+        self.project_id = project_id
+
+    def create_issue(self, title: str, body: str, labels: str, milestone: str) -> Optional[Dict[str, str]]:
+        cmd = [
+            "gh", "issue", "create",
+            "--title", title,
+            "--body", body,
+            "--label", labels,
+            "--milestone", milestone,
+            "--repo", self.repo
+        ]
+        issue_url = run_gh_command(cmd)
+        return {"url": issue_url} if issue_url else None
+
+    def add_to_project(self, issue: Dict[str, str]) -> Optional[str]:
+        cmd = [
+            "gh", "project", "item-add", self.project_id,
+            "--owner", self.project_owner,
+            "--url", issue["url"],
+            "--format", "json"
+        ]
+        output = run_gh_command(cmd)
+        try:
+            return json.loads(output)["id"] if output else None
+        except (ValueError, KeyError):
+            return output
+
+    def find_issue(self, title: str) -> Optional[Dict[str, str]]:
+        cmd = [
+            "gh", "issue", "list",
+            "--repo", self.repo,
+            "--state", "all",
+            "--search", f'"{title}" in:title',
+            "--json", "id,number,title,url"
+        ]
+        output = run_gh_command(cmd)
+        for issue in json.loads(output) if output else []:
+            if issue["title"] == title:
+                return {"url": issue["url"], "node_id": issue["id"], "number": issue["number"]}
+        return None
+
+    def iter_issues(self) -> Iterator[Dict[str, str]]:
+        """Stream every issue in the repository, one JSON line per issue from gh api --paginate"""
+        cmd = [
+            "gh", "api", "--paginate", f"repos/{self.repo}/issues?state=all&per_page=100",
+            "--jq", ".[] | select(.pull_request == null) | {title, body, url: .html_url, node_id, number, state, state_reason, "
+                    "labels: [.labels[].name], milestone: .milestone.title}"
+        ]
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True) as proc:
+            for line in proc.stdout:
+                yield json.loads(line)
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+    def update_issue(self, number: int, changes: Dict[str, Any]) -> bool:
+        """Apply title/body/label/milestone/state changes with gh issue edit and gh issue close/reopen"""
+        ok = True
+        cmd = ["gh", "issue", "edit", str(number), "--repo", self.repo]
+        if "title" in changes:
+            cmd += ["--title", changes["title"]]
+        if "body" in changes:
+            cmd += ["--body", changes["body"]]
+        if changes.get("add_labels"):
+            cmd += ["--add-label", ",".join(changes["add_labels"])]
+        if changes.get("remove_labels"):
+            cmd += ["--remove-label", ",".join(changes["remove_labels"])]
+        if "milestone" in changes:
+            cmd += ["--milestone", changes["milestone"]]
+        if len(cmd) > 6:
+            ok = bool(run_gh_command(cmd))
+        if changes.get("state") == "closed":
+            ok = bool(run_gh_command(["gh", "issue", "close", str(number), "--repo", self.repo, "--reason", "not planned"])) and ok
+        elif changes.get("state") == "open":
+            ok = bool(run_gh_command(["gh", "issue", "reopen", str(number), "--repo", self.repo])) and ok
+        return ok
+
+class ApiBackend:
+    """Provision issues in-process through a pooled GitHubClient"""
+    name = "api"
+
+    def __init__(self, client: Optional[GitHubClient] = None, metadata_ttl: float = DEFAULT_TTL,
+                 repo: str = REPO, project_owner: str = PROJECT_OWNER, project_id: str = PROJECT_ID):
+        self.client = client or GitHubClient()
+        self.repo = repo
+        self.project_owner = project_owner
+        self.project_id = project_id
+        self.metadata = MetadataCache(f"{repo}#{project_owner}/{project_id}", self.fetch_metadata, ttl=metadata_ttl)
+
+    def fetch_metadata(self) -> Dict[str, Any]:
+        """Fetch the repository, label, milestone and project IDs in a single GraphQL query"""
+        query = """query($owner: String!, $name: String!, $login: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    id
+    labels(first: 100) { nodes { id name } }
+    milestones(first: 100, states: [OPEN, CLOSED]) { nodes { id number title } }
+  }
+  repositoryOwner(login: $login) {
+    ... on User { projectV2(number: $number) { id } }
+    ... on Organization { projectV2(number: $number) { id } }
+  }
+}"""
+        owner, name = self.repo.split("/")
+        data, errors = self.client.graphql_partial(query, {"owner": owner, "name": name, "login": self.project_owner,
+                                                           "number": int(self.project_id)})
+        repo = data.get("repository")
+        if not repo:
+            raise GitHubAPIError(404, "; ".join(e.get("message", "") for e in errors) or f"repository {self.repo} not found")
+        project = (data.get("repositoryOwner") or {}).get("projectV2") or {}
+        return {
+            "repository_id": repo["id"],
+            "labels": {l["name"]: l["id"] for l in repo["labels"]["nodes"]},
+            "milestones": {m["title"]: {"id": m["id"], "number": m["number"]} for m in repo["milestones"]["nodes"]},
+            "project_id": project.get("id"),
+        }
+
+    def milestone(self, title: str) -> Optional[Dict[str, Any]]:
+        """Resolve a milestone title to its {id, number}"""
+        return self.metadata.lookup("milestones", title)
+
+    def label_id(self, name: str) -> Optional[str]:
+        return self.metadata.lookup("labels", name)
+
+    def project_node_id(self) -> str:
+        """Resolve the Projects v2 node ID for the configured project number"""
+        project_id = self.metadata.lookup("project_id")
+        if not project_id:
+            raise GitHubAPIError(404, f"project {self.project_owner}/{self.project_id} not found")
+        return project_id
+
+    def create_issues_batch(self, issues: List[Dict[str, str]]) -> List[Optional[Dict[str, str]]]:
+        """Create many issues with one aliased createIssue mutation, returning a ref or None per issue"""
+        refs: List[Optional[Dict[str, str]]] = [None] * len(issues)
+        try:
+            repository_id = self.metadata.lookup("repository_id")
+        except (GitHubAPIError, OSError) as e:
+            print(f"Error resolving repository metadata: {e}")
+            return refs
+
+        params = ["$repo: ID!"]
+        fields = []
+        variables: Dict[str, Any] = {"repo": repository_id}
+        for i, issue in enumerate(issues):
+            names = [l.strip() for l in issue["labels"].split(",") if l.strip()]
+            label_ids = [self.label_id(n) for n in names]
+            milestone = self.milestone(issue["milestone"])
+            if None in label_ids or not milestone:
+                unknown = [n for n, label_id in zip(names, label_ids) if label_id is None]
+                problem = f"unknown labels {', '.join(unknown)}" if unknown else f"unknown milestone '{issue['milestone']}'"
+                print(f"Error creating {issue['title']}: {problem}")
+                continue
+            params.append(f"$t{i}: String!, $b{i}: String, $l{i}: [ID!], $m{i}: ID")
+            fields.append(f"i{i}: createIssue(input: {{repositoryId: $repo, title: $t{i}, body: $b{i}, labelIds: $l{i}, milestoneId: $m{i}}}) {{ issue {{ id url number }} }}")
+            variables.update({
+                f"t{i}": issue["title"],
+                f"b{i}": issue["body"],
+                f"l{i}": label_ids,
+                f"m{i}": milestone["id"],
+            })
+        if not fields:
+            return refs
+
+        mutation = f"mutation({', '.join(params)}) {{\n  " + "\n  ".join(fields) + "\n}"
+        try:
+            data, errors = self.client.graphql_partial(mutation, variables)
+        except (GitHubAPIError, OSError) as e:
+            print(f"Error creating batch of {len(fields)} issues: {e}")
+            return refs
+        report_batch_errors(errors, issues, "creating")
+        for i in range(len(issues)):
+            created = (data.get(f"i{i}") or {}).get("issue")
+            if created:
+                refs[i] = {"url": created["url"], "node_id": created["id"], "number": created["number"]}
+        return refs
+
+    def add_to_project_batch(self, refs: List[Dict[str, str]]) -> List[Optional[str]]:
+        """Add many issues to the project with one aliased addProjectV2ItemById mutation"""
+        try:
+            project = self.project_node_id()
+        except (GitHubAPIError, OSError) as e:
+            print(f"Error resolving project: {e}")
+            return [None] * len(refs)
+        params = ["$project: ID!"] + [f"$c{i}: ID!" for i in range(len(refs))]
+        fields = [f"a{i}: addProjectV2ItemById(input: {{projectId: $project, contentId: $c{i}}}) {{ item {{ id }} }}"
+                  for i in range(len(refs))]
+        variables = {"project": project, **{f"c{i}": ref["node_id"] for i, ref in enumerate(refs)}}
+        mutation = f"mutation({', '.join(params)}) {{\n  " + "\n  ".join(fields) + "\n}"
+        try:
+            data, errors = self.client.graphql_partial(mutation, variables)
+        except (GitHubAPIError, OSError) as e:
+            print(f"Error adding batch of {len(refs)} issues to project: {e}")
+            return [None] * len(refs)
+        report_batch_errors(errors, [{"title": ref["url"]} for ref in refs], "adding")
+        return [((data.get(f"a{i}") or {}).get("item") or {}).get("id") for i in range(len(refs))]
+
+    def iter_issues(self) -> Iterator[Dict[str, str]]:
+        """Stream every issue in the repository using the maximum page size"""
+        for issue in self.client.paginate(f"/repos/{self.repo}/issues?state=all&per_page=100"):
+            if "pull_request" not in issue:
+                yield {"title": issue["title"], "body": issue.get("body") or "", "url": issue["html_url"],
+                       "node_id": issue["node_id"], "number": issue["number"], "state": issue["state"],
+                       "state_reason": issue.get("state_reason"), "labels": [label["name"] for label in issue.get("labels") or []],
+                       "milestone": (issue.get("milestone") or {}).get("title")}
+
+    def update_issue(self, number: int, changes: Dict[str, Any]) -> bool:
+        """Apply title/body/label/milestone/state changes with a single PATCH"""
+        payload: Dict[str, Any] = {key: changes[key] for key in ("title", "body", "labels", "state") if key in changes}
+        if changes.get("state") == "closed":
+            payload["state_reason"] = "not_planned"
+        try:
+            if "milestone" in changes:
+                resolved = self.milestone(changes["milestone"])
+                if not resolved:
+                    print(f"Error updating #{number}: unknown milestone '{changes['milestone']}'")
+                    return False
+                payload["milestone"] = resolved["number"]
+            self.client.rest("PATCH", f"/repos/{self.repo}/issues/{number}", payload)
+        except (GitHubAPIError, OSError) as e:
+            print(f"Error updating #{number}: {e}")
+            return False
+        return True
+
+    def create_issue(self, title: str, body: str, labels: str, milestone: str) -> Optional[Dict[str, str]]:
+        payload = {"title": title, "body": body, "labels": [l.strip() for l in labels.split(",") if l.strip()]}
+        try:
+            resolved = self.milestone(milestone)
+            if not resolved:
+                print(f"Error creating {title}: unknown milestone '{milestone}'")
+                return None
+            payload["milestone"] = resolved["number"]
+            issue = self.client.rest("POST", f"/repos/{self.repo}/issues", payload)
+        except (GitHubAPIError, OSError) as e:
+            print(f"Error creating {title}: {e}")
+            return None
+        return {"url": issue["html_url"], "node_id": issue["node_id"], "number": issue["number"]}
+
+    def add_to_project(self, issue: Dict[str, str]) -> Optional[str]:
+        mutation = """mutation($project: ID!, $content: ID!) {
+  addProjectV2ItemById(input: {projectId: $project, contentId: $content}) { item { id } }
+}"""
+        try:
+            data = self.client.graphql(mutation, {"project": self.project_node_id(), "content": issue["node_id"]})
+        except (GitHubAPIError, OSError) as e:
+            print(f"Error adding {issue['url']} to project: {e}")
+            return None
+        return data["addProjectV2ItemById"]["item"]["id"]
+
+    def find_issue(self, title: str) -> Optional[Dict[str, str]]:
+        """Look for an issue with exactly this title, paging from the most recently created until one matches"""
+        try:
+            for issue in self.client.paginate(f"/repos/{self.repo}/issues?state=all&sort=created&direction=desc&per_page=100"):
+                if issue["title"] == title and "pull_request" not in issue:
+                    return {"url": issue["html_url"], "node_id": issue["node_id"], "number": issue["number"]}
+        except (GitHubAPIError, OSError) as e:
+            print(f"Error looking up {title}: {e}")
+        return None
+
+def report_batch_errors(errors: List[Dict[str, Any]], issues: List[Dict[str, str]], action: str) -> None:
+    """Print GraphQL errors from an aliased batch against the issue each alias was built from"""
+    for error in errors:
+        path = error.get("path") or [""]
+        alias = str(path[0])
+        if alias[1:].isdigit() and int(alias[1:]) < len(issues):
+            print(f"Error {action} {issues[int(alias[1:])]['title']}: {error.get('message', '')}")
+        else:
+            print(f"Error {action} batch: {error.get('message', '')}")
+
+_backend = None
+_journal: Optional[RunJournal] = None
+_field_setter: Optional[Callable[[Dict[str, Any]], None]] = None
+_mirror: Optional[BoardMirror] = None
+_similarity: Optional[float] = DEFAULT_THRESHOLD
+_skip_similar = False
+
+def set_backend(name: str = "auto", metadata_ttl: float = DEFAULT_TTL, client: Optional[GitHubClient] = None,
+                repo: str = REPO, project_owner: str = PROJECT_OWNER, project_id: str = PROJECT_ID):
+    """Select the provisioning backend: the in-process API client, the gh CLI, or auto-detect
+
+    repo, project_owner and project_id pick the board to provision; they default to this project's own.
+    """
+    global _backend
+    token = client.token if client else load_token() if name != "gh" else ""
+    if name == "auto":
+        name = "api" if token else "gh"
+    if name == "api":
+        _backend = ApiBackend(client or GitHubClient(token=token), metadata_ttl, repo, project_owner, project_id)
+    else:
+        _backend = GhCliBackend(repo, project_owner, project_id)
+    return _backend
+
+def set_journal(journal: Optional[RunJournal]) -> None:
+    """Install the journal that create_issue_and_add writes each step to"""
+    global _journal
+    _journal = journal
+
+def get_backend():
+    """Return the active provisioning backend, auto-selecting one on first use"""
+    return _backend or set_backend()
+
+def use_mirror(enabled: bool = True, path: Optional[str] = None) -> None:
+    """Read existing issues for dedup and reconcile from the local SQLite mirror instead of paging GitHub"""
+    global _mirror
+    _mirror = BoardMirror(get_backend().repo, path) if enabled else None
+
+def use_similarity(threshold: Optional[float] = DEFAULT_THRESHOLD, skip: bool = False) -> None:
+    """Flag specs that read almost like an existing issue (0 or None disables); skip drops them instead"""
+    global _similarity, _skip_similar
+    _similarity, _skip_similar = threshold or None, skip
+
+def live_issues() -> Iterator[Dict[str, Any]]:
+    """Every existing issue: from the mirror after an incremental sync when enabled, else paged from GitHub"""
+    backend = get_backend()
+    if _mirror is None:
+        return backend.iter_issues()
+    client = backend.client if isinstance(backend, ApiBackend) else GitHubClient()
+    changed = _mirror.sync_issues(client)
+    print(f"🔎 Mirror synced: {changed} issues changed since the last sync")
+    return _mirror.iter_issues()
+
+def journal_step(event: str, title: str, **fields: Any) -> None:
+    """Record a completed step in the run journal, if one is open"""
+    if _journal:
+        _journal.record(event, title, **fields)
+
+def resume_state(backend, title: str) -> Tuple[bool, Optional[Dict[str, str]]]:
+    """Return (fully provisioned, known issue ref) for title from the journal
+
+    An intent without a recorded result means the run died mid-request, so the issue may or may not
+    exist; it is looked up remotely instead of being created a second time. skip_existing settles
+    these against its index first, so this lookup only runs without dedup.
+    """
+    state = _journal.state(title) if _journal else {}
+    if state.get(ADDED):
+        return True, state["issue"]
+    if state.get(CREATED):
+        return False, state["issue"]
+    if state.get(INTENT):
+        issue = backend.find_issue(title)
+        if issue:
+            journal_step(CREATED, title, issue=issue)
+        return False, issue
+    return False, None
+
+def render_step(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a spec for the pipeline, rendering its body if it was given as a callable"""
+    spec = dict(issue)
+    if callable(spec["body"]):
+        spec["body"] = spec["body"]()
+    return spec
+
+def create_step(spec: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Create the issue unless the journal shows it already exists; None if creation failed"""
+    backend = get_backend()
+    title = spec["title"]
+    done, issue = resume_state(backend, title)
+    if done:
+        print(f"↷ Already provisioned: {title}")
+        metrics().increment("issues_already_provisioned")
+        metrics().advance()
+        return {**spec, "issue": issue, "done": True}
+
+    if issue:
+        print(f"Resuming: {title}")
+    else:
+        print(f"Creating: {title}")
+        journal_step(INTENT, title)
+        issue = backend.create_issue(title, spec["body"], spec["labels"], spec["milestone"])
+        if not issue:
+            print(f"Failed to create: {title}")
+            metrics().increment("issues_failed")
+            metrics().advance()
+            return None
+        journal_step(CREATED, title, issue=issue)
+        metrics().increment("issues_created")
+    return {**spec, "issue": issue}
+
+def add_step(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Add a created issue to the project; a failed add is reported but does not fail the issue"""
+    if spec.get("done"):
+        return spec
+    item_id = get_backend().add_to_project(spec["issue"])
+    if item_id:
+        journal_step(ADDED, spec["title"], item_id=item_id)
+        metrics().increment("items_added")
+    else:
+        print(f"⚠ Created but not added to project {get_backend().project_id}: {spec['title']}")
+        metrics().increment("items_add_failed")
+    print(f"✓ Created: {spec['title']}")
+    metrics().advance()
+    return {**spec, "item_id": item_id}
+
+def fields_step(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Set project custom fields on the new item through the registered field setter"""
+    if _field_setter and spec.get("item_id"):
+        _field_setter(spec)
+    return spec
+
+def register_field_setter(setter: Optional[Callable[[Dict[str, Any]], None]]) -> None:
+    """Install a callback that fills project fields for each added item, enabling the fields stage"""
+    global _field_setter
+    _field_setter = setter
+
+def create_issue_and_add(title: str, body: str, labels: str, milestone: str) -> bool:
+    """Create an issue and add it to the project"""
+    spec = create_step({"title": title, "body": body, "labels": labels, "milestone": milestone})
+    if not spec:
+        return False
+    fields_step(add_step(spec))
+    return True
+
+def provision_pipelined(issues: Iterable[Dict[str, Any]], stage_workers: Dict[str, int]) -> Iterator[Tuple[Dict[str, Any], str]]:
+    """Run issues through render -> create -> add -> fields stages joined by bounded queues
+
+    Yields (spec, RESULT_*) as each issue leaves the pipeline, so results arrive in completion order.
+    An error reading the issues (e.g. a CatalogError) is raised after the issues already fed finish.
+    """
+    stages = [
+        Stage("render", render_step, stage_workers.get("render", 1)),
+        Stage("create", create_step, stage_workers.get("create", DEFAULT_JOBS)),
+        Stage("add", add_step, stage_workers.get("add", DEFAULT_JOBS)),
+    ]
+    if _field_setter:
+        stages.append(Stage("fields", fields_step, stage_workers.get("fields", 1)))
+    finished: "queue.Queue[Optional[Tuple[Dict[str, Any], str]]]" = queue.Queue()
+    pipeline = Pipeline(stages, on_result=lambda spec, ok: finished.put((spec, result_status(spec if ok else None))))
+
+    errors: List[Exception] = []
+
+    def run() -> None:
+        try:
+            pipeline.run(issues)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            finished.put(None)
+
+    runner = threading.Thread(target=run, daemon=True)
+    runner.start()
+    for result in iter(finished.get, None):
+        yield result
+    runner.join()
+    pipeline.print_report()
+    if errors:
+        raise errors[0]
+
+def create_batch_and_add(issues: List[Dict[str, str]]) -> List[Optional[Dict[str, Any]]]:
+    """Create a batch of issues in one request, then add the created ones to the project in a second
+
+    Returns each spec with its issue ref, marked "done" if an earlier run finished it, or None where creation failed.
+    """
+    backend = get_backend()
+    refs: List[Optional[Dict[str, str]]] = [None] * len(issues)
+    finished = [False] * len(issues)
+    pending_create = []
+    pending_add = []
+    for i, issue in enumerate(issues):
+        finished[i], refs[i] = resume_state(backend, issue["title"])
+        if finished[i]:
+            print(f"↷ Already provisioned: {issue['title']}")
+            metrics().increment("issues_already_provisioned")
+        elif refs[i]:
+            pending_add.append(i)
+        else:
+            pending_create.append(i)
+
+    if pending_create:
+        print(f"Creating batch of {len(pending_create)}: {issues[pending_create[0]]['title']} ...")
+        for i in pending_create:
+            journal_step(INTENT, issues[i]["title"])
+        for i, ref in zip(pending_create, backend.create_issues_batch([issues[i] for i in pending_create])):
+            if ref:
+                refs[i] = ref
+                journal_step(CREATED, issues[i]["title"], issue=ref)
+                pending_add.append(i)
+        metrics().increment("issues_created", sum(1 for i in pending_create if refs[i]))
+        metrics().increment("issues_failed", sum(1 for i in pending_create if not refs[i]))
+
+    item_ids = backend.add_to_project_batch([refs[i] for i in pending_add]) if pending_add else []
+    for i, item_id in zip(pending_add, item_ids):
+        if item_id:
+            journal_step(ADDED, issues[i]["title"], item_id=item_id)
+            metrics().increment("items_added")
+            fields_step({**issues[i], "item_id": item_id})
+        else:
+            print(f"⚠ Created but not added to project {backend.project_id}: {issues[i]['title']}")
+            metrics().increment("items_add_failed")
+    for i in pending_create + [i for i in pending_add if i not in pending_create]:
+        print(f"✓ Created: {issues[i]['title']}" if refs[i] else f"Failed to create: {issues[i]['title']}")
+    metrics().advance(len(issues))
+    return [{**issue, "issue": ref, "done": done} if ref else None for issue, ref, done in zip(issues, refs, finished)]
+
+def remote_index() -> Optional[IssueIndex]:
+    """Page through every existing issue once and index it for duplicate detection; None if that failed"""
+    print(f"🔎 Indexing existing issues in {get_backend().repo}...")
+    try:
+        index = build_index(live_issues(), _similarity)
+    except (GitHubAPIError, OSError, subprocess.CalledProcessError) as e:
+        print(f"⚠ Could not index existing issues, duplicate check disabled: {e}")
+        return None
+    print(f"🔎 Indexed {len(index)} existing issues")
+    return index
+
+def skip_existing(issues: Iterable[Dict[str, str]],
+                  on_skip: Optional[Callable[[Dict[str, Any]], None]] = None) -> Iterator[Dict[str, str]]:
+    """Drop specs that already exist remotely or repeat an earlier spec, passing a slim copy of each to on_skip
+
+    Specs already in the run journal are kept so a resumed run can finish their remaining steps;
+    one journalled only as an intent is looked up in the index here rather than page by page later.
+    The remote index is built up front; the specs themselves are filtered as they stream past.
+    With similarity enabled, specs that read almost like an existing issue are flagged, or dropped
+    with skip_similar, using the MinHash index built in the same pass as the exact one.
+    """
+    index = remote_index()
+    complete = index is not None
+    if index is None:
+        index = IssueIndex(_similarity)
+    seen = set()
+    for issue in issues:
+        key = normalize_title(issue["title"])
+        state = _journal.state(issue["title"]) if _journal else {}
+        if set(state) == {INTENT}:
+            ref = index.match(issue["title"], issue["body"])
+            if ref:
+                journal_step(CREATED, issue["title"], issue=ref)
+            elif complete:
+                _journal.discard_intent(issue["title"])
+        journalled = bool(state)
+        existing = None if journalled else index.match(issue["title"], issue["body"])
+        similar = [] if journalled or existing or key in seen else index.near_matches(issue["title"], issue["body"])
+        skipped = None
+        if existing:
+            print(f"↷ Already exists as #{existing['number']}: {issue['title']}")
+            metrics().increment("issues_skipped_existing")
+            skipped = {"title": issue["title"], "issue": existing}
+        elif key in seen:
+            print(f"↷ Duplicate spec in catalog: {issue['title']}")
+            metrics().increment("issues_skipped_duplicate")
+            skipped = {"title": issue["title"]}
+        elif similar:
+            ref, score = similar[0]
+            print(f"{'↷ Skipping' if _skip_similar else '≈'} {score:.0%} similar to #{ref['number']}: {issue['title']}")
+            metrics().increment("issues_skipped_similar" if _skip_similar else "issues_flagged_similar")
+            if _skip_similar:
+                skipped = {"title": issue["title"], "issue": ref}
+        if skipped is None:
+            yield issue
+        elif on_skip:
+            on_skip(skipped)
+        seen.add(key)
+
+def iter_provision(issues: Iterable[Dict[str, str]], jobs: int = DEFAULT_JOBS,
+                   batch_size: int = 0, dedup: bool = True,
+                   stage_workers: Optional[Dict[str, int]] = None,
+                   progress: bool = False, total: int = 0) -> Iterator[Tuple[Dict[str, str], str]]:
+    """Create issues with up to `jobs` concurrent workers, yielding (issue, RESULT_*) as they finish
+
+    Specs are pulled from `issues` lazily with a bounded number in flight, so a streamed catalog is
+    provisioned in constant memory and the first create starts as soon as the first spec is read.
+    With batch_size > 1 and the API backend, each worker sends aliased GraphQL batches instead of
+    one request pair per issue. With stage_workers, issues flow through a staged pipeline instead.
+    With dedup, specs matching an existing issue are reported as skipped without being created, as
+    are specs the journal shows a resumed run already finished.
+    With progress, a live throughput/ETA line (against `total`, if known) is kept on stderr.
+    Each created or skipped result carries the issue's {url, ...} ref under "issue" when known.
+    """
+    def provision(issue: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        spec = create_step(render_step(issue))
+        return fields_step(add_step(spec)) if spec else None
+
+    def with_skipped(results: Iterator[Tuple[Dict[str, Any], str]]) -> Iterator[Tuple[Dict[str, Any], str]]:
+        for result in results:
+            while skipped:
+                yield skipped.popleft(), RESULT_SKIPPED
+            yield result
+        while skipped:
+            yield skipped.popleft(), RESULT_SKIPPED
+
+    skipped: "deque[Dict[str, Any]]" = deque()
+    if dedup:
+        issues = skip_existing(issues, skipped.append)
+    if progress:
+        metrics().start_progress(total)
+    try:
+        if stage_workers is not None:
+            yield from with_skipped(provision_pipelined(issues, stage_workers))
+        elif batch_size > 1 and hasattr(get_backend(), "create_issues_batch"):
+            batches = bounded_map(create_batch_and_add, chunked(issues, batch_size), jobs)
+            yield from with_skipped((spec or issue, result_status(spec))
+                                    for batch, specs in batches for issue, spec in zip(batch, specs))
+        else:
+            yield from with_skipped((spec or issue, result_status(spec))
+                                    for issue, spec in bounded_map(provision, issues, jobs))
+    finally:
+        metrics().stop_progress()
+
+def result_status(spec: Optional[Dict[str, Any]]) -> str:
+    """RESULT_* for a spec leaving provisioning: None failed, "done" was finished by an earlier run"""
+    if not spec:
+        return RESULT_FAILED
+    return RESULT_SKIPPED if spec.get("done") else RESULT_CREATED
+
+def provision_issues(issues: Iterable[Dict[str, str]], **options: Any) -> List[Tuple[Dict[str, str], str]]:
+    """Provision every issue and return all (issue, RESULT_*) pairs; see iter_provision for options"""
+    return list(iter_provision(issues, **options))
+
+def add_provisioning_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the command line options shared by the issue creation scripts"""
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS,
+                        help=f"number of issues to create concurrently (default: {DEFAULT_JOBS})")
+    parser.add_argument("--backend", choices=BACKENDS, default="auto",
+                        help="api uses a pooled in-process client, gh spawns the GitHub CLI (default: api when a token is available)")
+    parser.add_argument("--batch-size", type=int, default=0, metavar="N",
+                        help=f"with the api backend, create and add N issues per GraphQL request (e.g. {DEFAULT_BATCH_SIZE}; default: off)")
+    parser.add_argument("--pipeline", nargs="?", type=stage_worker_counts, const={}, default=None, metavar="STAGE=N,...",
+                        help="run render/create/add/fields as overlapping stages, optionally setting workers per stage "
+                             "(e.g. create=4,add=2); --jobs is the default for create and add")
+    parser.add_argument("--journal", default=DEFAULT_JOURNAL, metavar="PATH",
+                        help=f"write-ahead journal of every creation step (default: {DEFAULT_JOURNAL}; '' disables)")
+    parser.add_argument("--resume", action="store_true",
+                        help="replay the journal, skip completed issues and finish half-done ones")
+    parser.add_argument("--writes-per-minute", type=float, default=DEFAULT_CREATE_RATE * 60, metavar="N",
+                        help=f"sustained content-creating request rate (default: {DEFAULT_CREATE_RATE * 60:.0f}, GitHub's secondary limit)")
+    parser.add_argument("--metadata-ttl", type=float, default=DEFAULT_TTL, metavar="SECONDS",
+                        help=f"reuse cached label/milestone/project IDs for this long (default: {DEFAULT_TTL}; 0 always refetches)")
+    parser.add_argument("--no-validate", dest="validate", action="store_false",
+                        help="skip the offline check of every spec's labels and milestone against setup-github-kanban.sh")
+    parser.add_argument("--no-dedup", dest="dedup", action="store_false",
+                        help="skip the pre-flight index of existing issues and create every spec")
+    parser.add_argument("--similarity", type=float, default=DEFAULT_THRESHOLD, metavar="J",
+                        help=f"flag specs whose title+body shingles overlap an existing issue by at least J "
+                             f"(estimated Jaccard; default: {DEFAULT_THRESHOLD}; 0 disables)")
+    parser.add_argument("--skip-similar", action="store_true",
+                        help="skip the specs --similarity flags instead of creating them")
+    parser.add_argument("--no-http-cache", dest="http_cache", action="store_false",
+                        help="send reads unconditionally instead of revalidating cached responses (ETag/304)")
+    parser.add_argument("--fields", action="store_true",
+                        help="with the api backend, fill the Priority/Layer/Component project fields from each new item's labels")
+    parser.add_argument("--mirror", action="store_true",
+                        help="sync the local SQLite board mirror incrementally and read existing issues from it")
+    parser.add_argument("--reconcile", action="store_true",
+                        help="update changed issues, close ones dropped from the catalog and create only missing ones")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="with --reconcile, print the planned edits without writing anything")
+    parser.add_argument("--progress", action="store_true",
+                        help="show a live done/total, issues per second and ETA line on stderr")
+    parser.add_argument("--metrics-json", metavar="PATH",
+                        help="write per-operation timings, retries and rate-limit waits as JSON when the run ends")
+    parser.add_argument("--metrics-prom", metavar="PATH",
+                        help="write the same metrics as a Prometheus textfile-collector file (*.prom)")
+
+def provisioning_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """Keyword arguments for provision_issues taken from parsed command line options"""
+    return {"jobs": args.jobs, "batch_size": args.batch_size, "dedup": args.dedup,
+            "stage_workers": parse_stage_workers(args), "progress": args.progress}
+
+def parse_stage_workers(args: argparse.Namespace) -> Optional[Dict[str, int]]:
+    """Per-stage worker counts from --pipeline, or None when the pipeline is not enabled"""
+    if args.pipeline is None:
+        return None
+    stage_workers = {"create": args.jobs, "add": args.jobs}
+    stage_workers.update(args.pipeline or {})
+    return stage_workers
+
+def stage_worker_counts(value: str) -> Dict[str, int]:
+    """argparse type for --pipeline: comma-separated STAGE=N items naming known stages and positive counts"""
+    counts = {}
+    for part in filter(None, (part.strip() for part in value.split(","))):
+        stage, sep, workers = part.partition("=")
+        stage = stage.strip()
+        if stage not in PIPELINE_STAGES:
+            raise argparse.ArgumentTypeError(f"unknown stage '{stage}' (choose from {', '.join(PIPELINE_STAGES)})")
+        if not sep or not workers.strip().isdigit() or int(workers) < 1:
+            raise argparse.ArgumentTypeError(f"'{part}' needs a worker count of at least 1, e.g. {stage}=4")
+        counts[stage] = int(workers)
+    return counts
+
+def apply_provisioning_arguments(args: argparse.Namespace) -> None:
+    """Configure the rate limiter, backend, run journal and metrics export from parsed command line options"""
+    stage_workers = parse_stage_workers(args)
+    concurrency = sum(stage_workers.values()) if stage_workers else args.jobs
+    configure_shared_limiter(create_rate=args.writes_per_minute / 60.0, max_concurrency=max(1, concurrency))
+    use_http_cache(args.http_cache)
+    set_backend(args.backend, args.metadata_ttl)
+    if args.fields:
+        use_project_fields()
+    use_mirror(args.mirror)
+    use_similarity(args.similarity, args.skip_similar)
+    set_journal(open_journal(args.journal, args.resume))
+    atexit.register(export_metrics, args.metrics_json, args.metrics_prom)
+
+def preflight_catalog(path: str, validate: bool = True) -> int:
+    """Count the catalog's specs, first checking each one offline; lists every problem and exits if there are any"""
+    from issue_spec import SpecValidator, validate_catalogs
+
+    if not validate:
+        return count_specs(path)
+    try:
+        total, problems = validate_catalogs([path], SpecValidator.declared())
+    except OSError as e:
+        print(f"❌ Could not validate {path}: {e}")
+        sys.exit(1)
+    if problems:
+        print(f"❌ {len(problems)} problems in {path}, nothing was created:")
+        for problem in problems:
+            print(f"   {problem}")
+        sys.exit(1)
+    return total
+
+def use_project_fields() -> bool:
+    """Register a field setter that fills the label-derived project fields of every added item"""
+    from label_sync import parse_shell_maps
+    from project_fields import ProjectFields, declared_fields
+
+    backend = get_backend()
+    if not isinstance(backend, ApiBackend):
+        print("⚠ --fields needs the api backend; project fields will not be set")
+        return False
+    try:
+        project = backend.project_node_id()
+    except (GitHubAPIError, OSError) as e:
+        print(f"⚠ Project fields will not be set: {e}")
+        return False
+    register_field_setter(ProjectFields(backend.client, project, declared_fields(parse_shell_maps())).setter())
+    return True
+
+def export_metrics(json_path: Optional[str] = None, prom_path: Optional[str] = None) -> None:
+    """Print the per-operation timing table and write the requested metrics files"""
+    run = metrics()
+    run.print_summary()
+    if json_path:
+        run.write_json(json_path)
+        print(f"📄 Metrics written to {json_path}")
+    if prom_path:
+        run.write_prometheus(prom_path)
+        print(f"📄 Prometheus metrics written to {prom_path}")
+
+def report_failures(results: Iterable[Tuple[Dict[str, str], str]]) -> int:
+    """Consume provisioning results, print the issues that failed and return how many were created"""
+    created = 0
+    skipped = 0
+    failed = []
+    for issue, status in results:
+        if status == RESULT_CREATED:
+            created += 1
+        elif status == RESULT_SKIPPED:
+            skipped += 1
+        else:
+            failed.append(issue["title"])
+    if skipped:
+        print(f"\n↷ {skipped} issues skipped: already provisioned or already on the board")
+    if failed:
+        print(f"\n❌ {len(failed)} issues failed to create:")
+        for title in failed:
+            print(f"  - {title}")
+    return created
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Adaptive Rate Limiter
+Shared token bucket and AIMD concurrency cap that honor GitHub's primary and secondary rate limits
+"""
+
+import multiprocessing
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+# GitHub documents roughly 80 content-creating requests per minute before secondary limits apply
+DEFAULT_CREATE_RATE = 80 / 60.0
+DEFAULT_BURST = 10
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_RETRIES = 6
+BASE_BACKOFF = 2.0
+MAX_BACKOFF = 120.0
+# Consecutive successes required before the concurrency cap grows by one
+RAMP_UP_AFTER = 10
+# Transient server errors retried with a short jittered backoff that doubles per attempt
+RETRIED_SERVER_ERRORS = (500, 502, 503, 504)
+SERVER_ERROR_BACKOFF = 0.5
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, holding at most `capacity`"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available; returns the time spent waiting"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+class SharedBudget:
+    """Write tokens and a throttle pause shared by every process provisioning with the same token
+
+    The state lives in shared memory, so the budget must be created before the worker processes and
+    handed to them as they start (e.g. through a pool initializer). Times are wall-clock seconds,
+    the one clock every process agrees on.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        # tokens, last refill, end of the current throttle pause
+        self._state = multiprocessing.Array("d", [capacity, time.time(), 0.0])
+
+    def acquire(self) -> float:
+        """Take one token, sleeping through any shared pause and until a token is available"""
+        waited = 0.0
+        while True:
+            with self._state.get_lock():
+                now = time.time()
+                tokens, updated, paused_until = self._state[:]
+                if paused_until > now:
+                    delay = paused_until - now
+                else:
+                    tokens = min(self.capacity, tokens + max(0.0, now - updated) * self.rate)
+                    if tokens >= 1:
+                        self._state[0], self._state[1] = tokens - 1, now
+                        return waited
+                    self._state[0], self._state[1] = tokens, now
+                    delay = (1 - tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Hold every process's requests for `seconds`, e.g. after one of them was throttled"""
+        with self._state.get_lock():
+            self._state[2] = max(self._state[2], time.time() + seconds)
+
+    def pause_remaining(self) -> float:
+        with self._state.get_lock():
+            return max(0.0, self._state[2] - time.time())
+
+class AdaptiveRateLimiter:
+    """Schedules GitHub requests: paces writes, caps in-flight calls and backs off when throttled
+
+    The in-flight cap halves on every throttle response and grows by one after RAMP_UP_AFTER
+    consecutive successes, so workers settle at the highest rate GitHub will sustain. With a
+    SharedBudget, writes draw from the cross-process bucket and throttles pause every process.
+    """
+
+    def __init__(self, create_rate: float = DEFAULT_CREATE_RATE, burst: float = DEFAULT_BURST,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY, max_retries: int = DEFAULT_MAX_RETRIES,
+                 budget: Optional[SharedBudget] = None):
+        self.budget = budget
+        self.writes = budget or TokenBucket(create_rate, burst)
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.concurrency = max_concurrency
+        self.in_flight = 0
+        self.successes = 0
+        self.paused_until = 0.0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self, write: bool) -> None:
+        """Block until a request may be sent: outside any pause, under the cap and, for writes, holding a token"""
+        start = time.monotonic()
+        with self._cond:
+            while True:
+                pause = self.paused_until - time.monotonic()
+                if self.budget:
+                    pause = max(pause, self.budget.pause_remaining())
+                if pause > 0:
+                    self._cond.wait(pause)
+                elif self.in_flight >= self.concurrency:
+                    self._cond.wait()
+                else:
+                    break
+            self.in_flight += 1
+        if write:
+            self.writes.acquire()
+        with self._cond:
+            self.wait_seconds += time.monotonic() - start
+
+    def release(self) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def observe(self, status: int, headers: Dict[str, str], body: bytes = b"", attempt: int = 0) -> Optional[float]:
+        """Record a response; return how long to wait before retrying, or None if it needs no retry"""
+        delay = throttle_delay(status, headers, body)
+        if delay is None and status in RETRIED_SERVER_ERRORS:
+            # Not a throttle: only this request waits, the cap and the other workers are left alone
+            return server_error_backoff(attempt)
+        with self._cond:
+            if delay is None:
+                remaining, reset = headers.get("x-ratelimit-remaining"), headers.get("x-ratelimit-reset")
+                if remaining is not None and reset and int(remaining) < self.in_flight:
+                    # Primary budget nearly spent: hold new requests until the window resets
+                    self.paused_until = time.monotonic() + max(0.0, float(reset) - time.time())
+                    self._share_pause(self.paused_until - time.monotonic())
+                self.successes += 1
+                if self.successes >= RAMP_UP_AFTER and self.concurrency < self.max_concurrency:
+                    self.concurrency += 1
+                    self.successes = 0
+                    self._cond.notify_all()
+                return None
+            self.throttled += 1
+            self.successes = 0
+            self.concurrency = max(1, self.concurrency // 2)
+            self.paused_until = max(self.paused_until, time.monotonic() + delay)
+        self._share_pause(delay)
+        return delay
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for throttles that carry no explicit wait"""
+        delay = random.uniform(0, min(MAX_BACKOFF, BASE_BACKOFF * 2 ** attempt))
+        with self._cond:
+            self.throttled += 1
+            self.successes = 0
+            self.concurrency = max(1, self.concurrency // 2)
+            self.paused_until = max(self.paused_until, time.monotonic() + delay)
+        self._share_pause(delay)
+        return delay
+
+    def _share_pause(self, seconds: float) -> None:
+        # The primary and secondary limits are per token, so a throttle seen here applies everywhere
+        if self.budget and seconds > 0:
+            self.budget.pause(seconds)
+
+def server_error_backoff(attempt: int) -> float:
+    """Exponential backoff with full jitter before retrying a request that hit a transient 5xx"""
+    return random.uniform(0, min(MAX_BACKOFF, SERVER_ERROR_BACKOFF * 2 ** attempt))
+
+def throttle_delay(status: int, headers: Dict[str, str], body: bytes = b"") -> Optional[float]:
+    """Seconds to wait if a response is a primary or secondary rate-limit rejection, else None"""
+    if status == 200 and body[:1] == b"{" and b"RATE_LIMITED" in body[:512] and body.lstrip().startswith(b'{"errors"'):
+        # GraphQL reports an exhausted primary budget as a 200 carrying only errors
+        status = 403
+        body = b"rate limit"
+    if status not in (403, 429):
+        return None
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        return float(retry_after) + random.uniform(0, 1)
+    if headers.get("x-ratelimit-remaining") == "0" and headers.get("x-ratelimit-reset"):
+        return max(0.0, float(headers["x-ratelimit-reset"]) - time.time()) + random.uniform(0, 1)
+    if status == 429 or b"rate limit" in body.lower():
+        # Secondary limits without Retry-After: GitHub asks for at least a minute
+        return 60.0 + random.uniform(0, 5)
+    return None
+
+_shared: Optional[AdaptiveRateLimiter] = None
+_shared_lock = threading.Lock()
+
+def configure_shared_limiter(**kwargs) -> AdaptiveRateLimiter:
+    """Replace the process-wide limiter, e.g. with a different create rate or concurrency ceiling"""
+    global _shared
+    with _shared_lock:
+        _shared = AdaptiveRateLimiter(**kwargs)
+        return _shared
+
+def shared_limiter() -> AdaptiveRateLimiter:
+    """The process-wide limiter shared by every client and gh invocation using the same token"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = AdaptiveRateLimiter()
+        return _shared
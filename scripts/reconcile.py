@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Catalog Reconciler
+Compares catalog specs with the live board by content hash and sends only the edits needed to make them match
+"""
+
+import fcntl
+import json
+import os
+import subprocess
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from github_client import GitHubAPIError
+from issue_index import body_digest, label_names, normalize_title, spec_hash
+from metadata_cache import cache_path
+from pipeline import bounded_map
+from provisioning import DEFAULT_JOBS, RESULT_FAILED, get_backend, iter_provision, live_issues
+from run_metrics import metrics
+
+MANAGED_FILE = "managed-issues.json"
+
+class ManagedIssues:
+    """Issues this tooling provisioned, by normalized title: {number, hash, catalog, position}
+
+    Only issues recorded here are ever closed as obsolete, and only by a reconcile of the catalog
+    that recorded them, so running one catalog never touches another catalog's issues. Entries
+    outlive the close, which is how a spec put back into the catalog reopens its issue.
+    """
+
+    def __init__(self, repo: str, path: Optional[str] = None):
+        self.repo = repo
+        self.path = path or cache_path(MANAGED_FILE)
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.entries: Dict[str, Dict[str, Any]] = json.load(f).get(repo, {})
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def record(self, title: str, number: int, digest: str, catalog: str, position: Optional[int] = None) -> None:
+        self.entries[normalize_title(title)] = {"number": number, "hash": digest, "catalog": catalog,
+                                                "position": position}
+
+    def forget(self, title_key: str) -> None:
+        self.entries.pop(title_key, None)
+
+    def save(self) -> None:
+        """Write this repository's entries back, locked against fan-out workers saving other repositories"""
+        with open(f"{self.path}.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    repos = json.load(f)
+            except (OSError, ValueError):
+                repos = {}
+            repos[self.repo] = self.entries
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(repos, f, indent=2)
+            os.replace(tmp, self.path)
+
+def compact(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep what reconciling needs from a live issue, replacing the body with its digest"""
+    digest = body_digest(issue["body"] or "")
+    return {"number": issue["number"], "title": issue["title"], "state": issue["state"],
+            "state_reason": issue.get("state_reason"), "labels": issue["labels"], "milestone": issue["milestone"], "body_digest": digest,
+            "hash": spec_hash(issue["title"], "", issue["labels"], issue["milestone"], digest=digest)}
+
+def diff_issue(spec: Dict[str, str], live: Dict[str, Any], reopen: bool = False) -> Dict[str, Any]:
+    """The minimal set of field changes that turns the live issue into the spec, reopening it only when asked"""
+    changes: Dict[str, Any] = {}
+    if spec["title"] != live["title"]:
+        changes["title"] = spec["title"]
+    if body_digest(spec["body"] or "") != live["body_digest"]:
+        changes["body"] = spec["body"]
+    wanted = label_names(spec["labels"])
+    have = {name.casefold() for name in live["labels"]}
+    wanted_keys = {name.casefold() for name in wanted}
+    add = [name for name in wanted if name.casefold() not in have]
+    remove = [name for name in live["labels"] if name.casefold() not in wanted_keys]
+    if add or remove:
+        changes.update(labels=wanted, add_labels=add, remove_labels=remove)
+    if spec["milestone"] != live["milestone"]:
+        changes["milestone"] = spec["milestone"]
+    if reopen:
+        changes["state"] = "open"
+    return changes
+
+def describe(changes: Dict[str, Any]) -> str:
+    parts = []
+    if "title" in changes:
+        parts.append(f"title → {changes['title']}")
+    if "body" in changes:
+        parts.append("body")
+    parts += [f"+{name}" for name in changes.get("add_labels", [])]
+    parts += [f"-{name}" for name in changes.get("remove_labels", [])]
+    if "milestone" in changes:
+        parts.append(f"milestone → {changes['milestone']}")
+    if "state" in changes:
+        parts.append("close" if changes["state"] == "closed" else "reopen")
+    return ", ".join(parts)
+
+def plan_reconcile(specs: Iterable[Dict[str, str]], live_issues: Iterable[Dict[str, Any]], managed: ManagedIssues,
+                   catalog: str) -> Tuple[List[Tuple[Dict[str, Any], Dict[str, Any]]], List[Dict[str, str]], int]:
+    """Return (edits as (live issue, changes), specs to create, unchanged count)
+
+    Specs are matched to live issues by the number recorded for them, falling back to normalized
+    title and then, for a renamed spec, to the entry recorded at the same catalog position. An issue
+    whose live hash equals the spec hash is unchanged and costs no write; only an issue reconcile
+    itself closed as not planned is reopened, so one closed as completed stays closed.
+    """
+    by_number: Dict[int, Dict[str, Any]] = {}
+    by_title: Dict[str, Dict[str, Any]] = {}
+    for issue in map(compact, live_issues):
+        by_number[issue["number"]] = issue
+        by_title.setdefault(normalize_title(issue["title"]), issue)
+    specs = list(specs)
+    keys = {normalize_title(spec["title"]) for spec in specs}
+    renamed = {entry.get("position"): key for key, entry in managed.entries.items()
+               if entry.get("catalog") == catalog and entry.get("position") is not None and key not in keys
+               and entry["number"] in by_number and by_number[entry["number"]]["state_reason"] != "not_planned"}
+
+    edits: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+    creates: List[Dict[str, str]] = []
+    unchanged = 0
+    wanted = set()
+    for position, spec in enumerate(specs):
+        key = normalize_title(spec["title"])
+        wanted.add(key)
+        entry = managed.entries.get(key)
+        if not entry and key not in by_title and position in renamed:
+            entry = managed.entries.pop(renamed.pop(position))
+        live = by_number.get(entry["number"]) if entry else None
+        live = live or by_title.get(key)
+        if not live:
+            creates.append(spec)
+            continue
+        reopen = (entry is not None and entry["number"] == live["number"] and live["state"] == "closed"
+                  and live["state_reason"] == "not_planned")
+        digest = spec_hash(spec["title"], spec["body"], spec["labels"], spec["milestone"])
+        managed.record(spec["title"], live["number"], digest, catalog, position)
+        if live["hash"] == digest and not reopen:
+            unchanged += 1
+            continue
+        changes = diff_issue(spec, live, reopen)
+        if changes:
+            edits.append((live, changes))
+        else:
+            unchanged += 1
+
+    for key, entry in list(managed.entries.items()):
+        if entry.get("catalog") != catalog or key in wanted:
+            continue
+        live = by_number.get(entry["number"])
+        if not live:
+            managed.forget(key)
+        elif live["state"] == "open":
+            edits.append((live, {"state": "closed"}))
+    return edits, creates, unchanged
+
+def issue_number(ref: Dict[str, Any]) -> Optional[int]:
+    """The number of a created issue, read from its URL when the backend only returned that"""
+    if ref.get("number") is not None:
+        return ref["number"]
+    tail = (ref.get("url") or "").rstrip("/").rsplit("/", 1)[-1]
+    return int(tail) if tail.isdigit() else None
+
+def reconcile_issues(specs: Iterable[Dict[str, str]], catalog: str, dry_run: bool = False,
+                     jobs: int = DEFAULT_JOBS, **options: Any) -> Iterator[Tuple[Dict[str, str], str]]:
+    """Bring the live board in line with the catalog, yielding (spec, RESULT_*) for issues it had to create
+
+    Changed issues get one update each with only the differing fields; issues this catalog
+    provisioned earlier but no longer lists are closed as not planned. Remaining provisioning
+    options (batch size, pipeline, progress) apply to the creates.
+    """
+    backend = get_backend()
+    managed = ManagedIssues(backend.repo)
+    specs = list(specs)
+    positions = {normalize_title(spec["title"]): position for position, spec in enumerate(specs)}
+    print(f"🔎 Reading live issues in {backend.repo}...")
+    try:
+        edits, creates, unchanged = plan_reconcile(specs, live_issues(), managed, catalog)
+    except (GitHubAPIError, OSError, subprocess.CalledProcessError) as e:
+        print(f"❌ Could not read live issues, nothing reconciled: {e}")
+        return
+    closes = sum(1 for _, changes in edits if changes.get("state") == "closed")
+    print(f"🔁 {unchanged} unchanged, {len(edits) - closes} to update, {closes} to close, {len(creates)} to create")
+    for live, changes in edits:
+        print(f"  ~ #{live['number']} {live['title']}: {describe(changes)}")
+    if dry_run:
+        for spec in creates:
+            print(f"  + {spec['title']}")
+        return
+
+    def apply(edit: Tuple[Dict[str, Any], Dict[str, Any]]) -> bool:
+        live, changes = edit
+        return backend.update_issue(live["number"], changes)
+
+    for (live, changes), ok in bounded_map(apply, edits, jobs):
+        if ok:
+            metrics().increment("issues_closed" if changes.get("state") == "closed" else "issues_updated")
+            print(f"✓ {'Closed' if changes.get('state') == 'closed' else 'Updated'}: {live['title']}")
+        else:
+            print(f"Failed to update: {live['title']}")
+    managed.save()
+
+    if creates:
+        options["dedup"] = False
+        try:
+            for spec, status in iter_provision(creates, jobs=jobs, total=len(creates), **options):
+                number = issue_number(spec.get("issue") or {}) if status != RESULT_FAILED else None
+                if number is not None:
+                    managed.record(spec["title"], number,
+                                   spec_hash(spec["title"], spec["body"], spec["labels"], spec["milestone"]), catalog,
+                                   positions.get(normalize_title(spec["title"])))
+                yield spec, status
+        finally:
+            managed.save()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Provisioning Run Journal
+Append-only, fsync'd JSONL journal of each issue's creation steps so interrupted runs can resume
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+DEFAULT_JOURNAL = "provisioning-journal.jsonl"
+
+# Step events in the order they are written for a single issue
+INTENT = "intent"
+CREATED = "created"
+ADDED = "added"
+
+class RunJournal:
+    """Write-ahead log of issue creation: intent, then issue URL, then project item ID"""
+
+    def __init__(self, path: str = DEFAULT_JOURNAL, resume: bool = False):
+        self.path = path
+        self._lock = threading.Lock()
+        self._state: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(path):
+            if resume:
+                self._replay()
+            else:
+                archived = f"{path}.{time.strftime('%Y%m%d-%H%M%S')}"
+                os.replace(path, archived)
+                print(f"📒 Archived previous journal to {archived}")
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _replay(self) -> None:
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-write carries no completed step
+                    continue
+                self._apply(entry)
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        state = self._state.setdefault(entry["key"], {})
+        state[entry["event"]] = True
+        if entry["event"] == CREATED:
+            state["issue"] = entry["issue"]
+        elif entry["event"] == ADDED:
+            state["item_id"] = entry.get("item_id")
+
+    def record(self, event: str, key: str, **fields: Any) -> None:
+        """Durably append one step before the caller moves on to the next"""
+        entry = {"event": event, "key": key, "ts": time.time(), **fields}
+        with self._lock:
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._apply(entry)
+
+    def state(self, key: str) -> Dict[str, Any]:
+        """Return the steps already completed for key: intent/created/added flags, issue ref and item_id"""
+        with self._lock:
+            return dict(self._state.get(key, {}))
+
+    def discard_intent(self, key: str) -> None:
+        """Forget an intent-only entry in memory once the caller knows its create never landed"""
+        with self._lock:
+            if set(self._state.get(key, {})) == {INTENT}:
+                del self._state[key]
+
+    def summary(self) -> Dict[str, int]:
+        """Count journalled issues by the furthest step they reached"""
+        counts = {INTENT: 0, CREATED: 0, ADDED: 0}
+        with self._lock:
+            for state in self._state.values():
+                furthest = ADDED if state.get(ADDED) else CREATED if state.get(CREATED) else INTENT
+                counts[furthest] += 1
+        return counts
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+def open_journal(path: Optional[str], resume: bool) -> Optional[RunJournal]:
+    """Open the journal for a run, or return None when journalling is disabled"""
+    if not path:
+        return None
+    journal = RunJournal(path, resume=resume)
+    if resume:
+        counts = journal.summary()
+        print(f"📒 Resuming from {path}: {counts[ADDED]} complete, {counts[CREATED]} awaiting project add, "
+              f"{counts[INTENT]} with unknown outcome")
+    return journal
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Run Metrics
+Per-operation timers, retry and rate-limit counters for GitHub calls, exported as JSON or a Prometheus textfile
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from pipeline import percentile
+
+# `gh api` flags that take a value, so the value is not mistaken for the endpoint
+GH_API_VALUE_FLAGS = {"-X", "--method", "-f", "-F", "--field", "--raw-field", "--input", "-H", "--header",
+                      "-q", "--jq", "-t", "--template", "--hostname", "--cache", "-p", "--preview"}
+
+class OperationStats:
+    """Latency samples and counters for one kind of GitHub call"""
+
+    def __init__(self):
+        self.durations: List[float] = []
+        self.failures = 0
+        self.retries = 0
+        self.rate_limit_wait = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "calls": len(self.durations),
+            "failures": self.failures,
+            "retries": self.retries,
+            "rate_limit_wait_seconds": round(self.rate_limit_wait, 3),
+            "total_seconds": round(sum(self.durations), 3),
+            "p50_seconds": round(percentile(self.durations, 50), 4),
+            "p99_seconds": round(percentile(self.durations, 99), 4),
+            "max_seconds": round(max(self.durations, default=0.0), 4),
+        }
+
+class RunMetrics:
+    """Thread-safe collector shared by every client, gh invocation and provisioning step in a run"""
+
+    def __init__(self):
+        self.started = time.time()
+        self.operations: Dict[str, OperationStats] = {}
+        self.counters: Dict[str, int] = {}
+        self.progress_total = 0
+        self.progress_done = 0
+        self._lock = threading.Lock()
+        self._progress_thread: Optional[threading.Thread] = None
+        self._progress_stop = threading.Event()
+
+    def _op(self, name: str) -> OperationStats:
+        stats = self.operations.get(name)
+        if stats is None:
+            stats = self.operations[name] = OperationStats()
+        return stats
+
+    def record(self, operation: str, seconds: float, ok: bool = True) -> None:
+        with self._lock:
+            stats = self._op(operation)
+            stats.durations.append(seconds)
+            if not ok:
+                stats.failures += 1
+
+    def record_retry(self, operation: str, wait: float) -> None:
+        """Count a throttled attempt and the time spent backing off before retrying it"""
+        with self._lock:
+            stats = self._op(operation)
+            stats.retries += 1
+            stats.rate_limit_wait += wait
+
+    def record_wait(self, operation: str, wait: float) -> None:
+        """Add time spent queued in the rate limiter before a call was allowed out"""
+        if wait > 0:
+            with self._lock:
+                self._op(operation).rate_limit_wait += wait
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    @contextmanager
+    def timed(self, operation: str) -> Iterator[None]:
+        """Time a block as one call of `operation`; an exception marks it failed"""
+        start = time.monotonic()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.record(operation, time.monotonic() - start, ok)
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            elapsed = time.time() - self.started
+            return {
+                "started_at": self.started,
+                "elapsed_seconds": round(elapsed, 3),
+                "operations": {name: stats.summary() for name, stats in sorted(self.operations.items())},
+                "counters": dict(self.counters),
+                "api_calls": sum(len(stats.durations) for stats in self.operations.values()),
+                "retries": sum(stats.retries for stats in self.operations.values()),
+                "rate_limit_wait_seconds": round(sum(s.rate_limit_wait for s in self.operations.values()), 3),
+                "http_cache_hit_ratio": cache_hit_ratio(self.counters),
+            }
+
+    # --- progress ----------------------------------------------------------------
+
+    def start_progress(self, total: int, interval: float = 1.0) -> None:
+        """Print a live done/total, throughput and ETA line to stderr until stop_progress(); total 0 means unknown"""
+        self.progress_total = total
+        self.progress_done = 0
+        started = time.monotonic()
+
+        def loop() -> None:
+            while not self._progress_stop.wait(interval):
+                done = self.progress_done
+                rate = done / max(1e-9, time.monotonic() - started)
+                if not self.progress_total:
+                    sys.stderr.write(f"\r⏳ {done} issues · {rate:.1f}/s   ")
+                else:
+                    eta = f"{(self.progress_total - done) / rate:.0f}s" if rate else "?"
+                    sys.stderr.write(f"\r⏳ {done}/{self.progress_total} issues · {rate:.1f}/s · ETA {eta}   ")
+                sys.stderr.flush()
+
+        self._progress_stop.clear()
+        self._progress_thread = threading.Thread(target=loop, daemon=True)
+        self._progress_thread.start()
+
+    def advance(self, count: int = 1) -> None:
+        with self._lock:
+            self.progress_done += count
+
+    def stop_progress(self) -> None:
+        if self._progress_thread:
+            self._progress_stop.set()
+            self._progress_thread.join()
+            self._progress_thread = None
+            sys.stderr.write("\n")
+
+    # --- export ------------------------------------------------------------------
+
+    def write_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def write_prometheus(self, path: str, prefix: str = "kanban_provisioning") -> None:
+        """Write a node_exporter textfile-collector file, atomically replacing any previous one"""
+        summary = self.summary()
+        lines = [
+            f"# HELP {prefix}_operation_duration_seconds GitHub call latency by operation",
+            f"# TYPE {prefix}_operation_duration_seconds summary",
+        ]
+        for name, op in summary["operations"].items():
+            lines.append(f'{prefix}_operation_duration_seconds{{operation="{name}",quantile="0.5"}} {op["p50_seconds"]}')
+            lines.append(f'{prefix}_operation_duration_seconds{{operation="{name}",quantile="0.99"}} {op["p99_seconds"]}')
+            lines.append(f'{prefix}_operation_duration_seconds_sum{{operation="{name}"}} {op["total_seconds"]}')
+            lines.append(f'{prefix}_operation_duration_seconds_count{{operation="{name}"}} {op["calls"]}')
+        for metric, key, help_text in (
+            ("operation_failures_total", "failures", "Failed GitHub calls by operation"),
+            ("operation_retries_total", "retries", "Rate-limited attempts retried by operation"),
+            ("rate_limit_wait_seconds_total", "rate_limit_wait_seconds", "Time spent waiting on rate limits by operation"),
+        ):
+            lines.append(f"# HELP {prefix}_{metric} {help_text}")
+            lines.append(f"# TYPE {prefix}_{metric} counter")
+            for name, op in summary["operations"].items():
+                lines.append(f'{prefix}_{metric}{{operation="{name}"}} {op[key]}')
+        lines.append(f"# HELP {prefix}_events_total Provisioning events by kind")
+        lines.append(f"# TYPE {prefix}_events_total counter")
+        for name, value in sorted(summary["counters"].items()):
+            lines.append(f'{prefix}_events_total{{event="{name}"}} {value}')
+        if summary["http_cache_hit_ratio"] is not None:
+            lines.append(f"# HELP {prefix}_http_cache_hit_ratio Share of conditional reads answered 304 from the cache")
+            lines.append(f"# TYPE {prefix}_http_cache_hit_ratio gauge")
+            lines.append(f"{prefix}_http_cache_hit_ratio {summary['http_cache_hit_ratio']}")
+        lines.append(f"# HELP {prefix}_last_run_timestamp_seconds Start time of the last provisioning run")
+        lines.append(f"# TYPE {prefix}_last_run_timestamp_seconds gauge")
+        lines.append(f"{prefix}_last_run_timestamp_seconds {summary['started_at']:.0f}")
+        lines.append(f"# HELP {prefix}_last_run_duration_seconds Duration of the last provisioning run")
+        lines.append(f"# TYPE {prefix}_last_run_duration_seconds gauge")
+        lines.append(f"{prefix}_last_run_duration_seconds {summary['elapsed_seconds']}")
+
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp, path)
+
+    def print_summary(self) -> None:
+        """Print a per-operation timing table"""
+        summary = self.summary()
+        if not summary["operations"]:
+            return
+        print(f"\n📈 {summary['api_calls']} GitHub calls in {summary['elapsed_seconds']:.1f}s, "
+              f"{summary['retries']} retries, {summary['rate_limit_wait_seconds']:.1f}s waiting on rate limits")
+        if summary["http_cache_hit_ratio"] is not None:
+            hits = summary["counters"].get("http_cache_hits", 0)
+            reads = hits + summary["counters"].get("http_cache_misses", 0)
+            print(f"🗄  {hits}/{reads} reads answered 304 from the HTTP cache "
+                  f"({summary['http_cache_hit_ratio']:.0%} hit ratio)")
+        print(f"{'operation':<22} {'calls':>6} {'failed':>6} {'retries':>7} {'p50 ms':>8} {'p99 ms':>8} {'total s':>8}")
+        for name, op in summary["operations"].items():
+            print(f"{name:<22} {op['calls']:>6} {op['failures']:>6} {op['retries']:>7} "
+                  f"{op['p50_seconds'] * 1000:>8.1f} {op['p99_seconds'] * 1000:>8.1f} {op['total_seconds']:>8.2f}")
+
+def cache_hit_ratio(counters: Dict[str, int]) -> Optional[float]:
+    """Share of cacheable reads served from the HTTP cache, or None if the run made none"""
+    hits, misses = counters.get("http_cache_hits", 0), counters.get("http_cache_misses", 0)
+    return round(hits / (hits + misses), 4) if hits + misses else None
+
+_metrics = RunMetrics()
+
+def metrics() -> RunMetrics:
+    """The process-wide metrics collector"""
+    return _metrics
+
+def reset_metrics() -> RunMetrics:
+    """Start a fresh collector, e.g. between benchmark scenarios"""
+    global _metrics
+    _metrics = RunMetrics()
+    return _metrics
+
+def operation_name(method: str, path: str, payload: Any = None) -> str:
+    """Classify an API request as issue_create, item_add, label_create, milestone_create, ..."""
+    if path.endswith("/graphql"):
+        query = (payload or {}).get("query", "") if isinstance(payload, dict) else ""
+        if not query.lstrip().startswith("mutation"):
+            return "graphql_query"
+        for mutation, name in (("createIssue", "issue_create"), ("addProjectV2ItemById", "item_add")):
+            count = query.count(f"{mutation}(")
+            if count:
+                return f"{name}_batch" if count > 1 else name
+        return "graphql_mutation"
+    resource = path.split("?")[0].rstrip("/").split("/")
+    kinds = {"issues": "issue", "labels": "label", "milestones": "milestone"}
+    for index in range(len(resource) - 1, -1, -1):
+        if resource[index] in kinds:
+            kind = kinds[resource[index]]
+            is_item = index < len(resource) - 1
+            if method == "POST" and not is_item:
+                return f"{kind}_create"
+            if method == "PATCH":
+                return f"{kind}_update"
+            return f"{kind}_read"
+    return f"{method.lower()}_other"
+
+def gh_api_method(cmd: List[str]) -> str:
+    """HTTP method of a `gh api` invocation: -X/--method if given, else POST when fields are passed"""
+    for flag, value in zip(cmd, cmd[1:]):
+        if flag in ("-X", "--method"):
+            return value.upper()
+    return "POST" if any(arg in ("-f", "-F", "--field", "--raw-field", "--input") for arg in cmd) else "GET"
+
+def gh_api_path(cmd: List[str]) -> str:
+    """The endpoint of a `gh api` invocation with a leading slash, e.g. /repos/o/r/labels or /graphql"""
+    args = iter(cmd[2:])
+    for arg in args:
+        if arg in GH_API_VALUE_FLAGS:
+            next(args, None)
+        elif not arg.startswith("-"):
+            return "/" + arg.lstrip("/")
+    return ""
+
+def gh_api_payload(cmd: List[str]) -> Optional[Dict[str, str]]:
+    """The GraphQL document passed to `gh api graphql` as a query= field, if any"""
+    for flag, value in zip(cmd, cmd[1:]):
+        if flag in ("-f", "-F", "--field", "--raw-field") and value.startswith("query="):
+            return {"query": value[len("query="):]}
+    return None
+
+def gh_api_write(cmd: List[str]) -> bool:
+    """Whether a `gh api` invocation creates or changes content: REST calls other than GET, GraphQL mutations"""
+    if gh_api_path(cmd).endswith("/graphql"):
+        # A document read from a file (query=@path) cannot be classified here, so it is paced as a write
+        query = (gh_api_payload(cmd) or {}).get("query", "")
+        return query.startswith("@") or query.lstrip().startswith("mutation")
+    return gh_api_method(cmd) != "GET"
+
+def gh_operation_name(cmd: List[str]) -> str:
+    """Classify a gh CLI invocation the same way as API requests"""
+    if cmd[1] == "api":
+        return operation_name(gh_api_method(cmd), gh_api_path(cmd), gh_api_payload(cmd))
+    if cmd[1:3] == ["project", "item-add"]:
+        return "item_add"
+    if cmd[1] in ("issue", "label", "milestone") and len(cmd) > 2:
+        verb = {"create": "create", "edit": "update", "list": "read", "view": "read"}.get(cmd[2], cmd[2])
+        return f"{cmd[1]}_{verb}"
+    return f"gh_{cmd[1]}"
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Search Issues
+Full-text search over the issue exports and catalogs, re-indexing only what changed since the last search
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from issue_catalog import CatalogError, default_catalogs
+from issue_export import DEFAULT_EXPORT
+from search_index import SearchIndex, default_sources
+
+def main():
+    """Refresh the index and print the issues matching the query"""
+    parser = argparse.ArgumentParser(description="Search issues by terms, \"quoted phrases\", labels and milestone")
+    parser.add_argument("query", nargs="*", help="terms and \"quoted phrases\" that must all match")
+    parser.add_argument("--label", "-l", action="append", default=[], metavar="NAME",
+                        help="only issues carrying this label (repeatable, all must match)")
+    parser.add_argument("--milestone", "-m", metavar="TITLE", help="only issues in this milestone")
+    parser.add_argument("--source", metavar="TEXT", help="only documents from sources whose path contains TEXT")
+    parser.add_argument("--limit", "-n", type=int, default=20, help="maximum results (default: 20)")
+    parser.add_argument("--export", action="append", default=[], metavar="PATH",
+                        help="text export to index (repeatable; default: ALL_ISSUES_EXPORT.txt if present)")
+    parser.add_argument("--catalog", action="append", default=[], metavar="PATH",
+                        help="JSONL catalog or \"breakdown\" to index (repeatable; default: every bundled catalog "
+                             "and TASK_BREAKDOWN.md if present)")
+    parser.add_argument("--rebuild", action="store_true", help="drop the index and re-index every source")
+    parser.add_argument("--no-update", action="store_true", help="query the index as it is, without checking sources")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    query = " ".join(args.query)
+    if not query.strip() and not args.label and not args.milestone:
+        parser.error("give a query, --label or --milestone")
+    exports = args.export or ([DEFAULT_EXPORT] if os.path.exists(DEFAULT_EXPORT) else [])
+    catalogs = args.catalog or default_catalogs()
+
+    index = SearchIndex()
+    try:
+        if args.rebuild:
+            index.clear()
+        if not args.no_update:
+            started = time.monotonic()
+            try:
+                counts = index.update(default_sources(exports, catalogs))
+            except (OSError, CatalogError) as e:
+                print(f"❌ Could not index the sources: {e}")
+                sys.exit(1)
+            if counts["indexed"] or counts["removed"]:
+                print(f"🔎 Indexed {counts['indexed']} changed documents, removed {counts['removed']}, "
+                      f"{counts['unchanged']} unchanged in {time.monotonic() - started:.2f}s", file=sys.stderr)
+        started = time.monotonic()
+        results = index.search(query, args.label, args.milestone, args.source, args.limit)
+        elapsed = time.monotonic() - started
+    finally:
+        index.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return
+    for result in results:
+        number = f"#{result['number']}" if result["number"] is not None else "(catalog)"
+        print(f"{number:>10}  {result['title']}")
+        print(f"{'':>10}  {result['milestone'] or '-'} | {', '.join(result['labels']) or '-'} | "
+              f"{os.path.basename(result['source'])}")
+    print(f"🔎 {len(results)} results in {elapsed * 1000:.1f} ms", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
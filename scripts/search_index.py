@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Issue Search Index
+Positional inverted index over the issue exports and catalogs, updated incrementally, with term, phrase and label/milestone queries
+"""
+
+import hashlib
+import math
+import os
+import re
+import sqlite3
+import threading
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from export_formats import parse_record
+from issue_catalog import catalog_path, iter_catalog
+from issue_export import iter_text_records
+from metadata_cache import cache_path
+
+TOKEN = re.compile(r"\w+")
+QUERY_PART = re.compile(r'"([^"]*)"|(\S+)')
+# BM25 term-frequency saturation and length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    signature TEXT
+);
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    key TEXT NOT NULL,
+    number INTEGER,
+    title TEXT,
+    labels TEXT,
+    milestone TEXT,
+    length INTEGER,
+    hash TEXT,
+    UNIQUE (source, key)
+);
+CREATE TABLE IF NOT EXISTS doc_terms (
+    doc INTEGER PRIMARY KEY,
+    terms TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS doc_labels (
+    label TEXT NOT NULL COLLATE NOCASE,
+    doc INTEGER NOT NULL,
+    PRIMARY KEY (label, doc)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc INTEGER NOT NULL,
+    positions BLOB NOT NULL,
+    PRIMARY KEY (term, doc)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS doc_labels_by_doc ON doc_labels(doc);
+CREATE INDEX IF NOT EXISTS docs_by_milestone ON docs(milestone COLLATE NOCASE);
+-- covers count(*) and avg(length) for BM25 without reading whole document rows
+CREATE INDEX IF NOT EXISTS docs_by_length ON docs(length);
+"""
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN.findall(text.lower())
+
+def parse_query(text: str) -> List[List[str]]:
+    """Split a query into phrases: quoted text, or a bare word that tokenizes to several terms
+    (e.g. Phi-3-mini), must match consecutively; other words are single-term phrases"""
+    phrases = []
+    for quoted, word in QUERY_PART.findall(text):
+        tokens = tokenize(quoted if quoted else word)
+        if tokens:
+            phrases.append(tokens)
+    return phrases
+
+def document_hash(doc: Dict[str, Any]) -> str:
+    digest = hashlib.sha1()
+    for part in (doc["title"], ",".join(doc["labels"]), doc["milestone"] or "", doc["body"]):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def export_documents(path: str) -> Iterator[Dict[str, Any]]:
+    """Issues of a text export (ALL_ISSUES_EXPORT.txt format), keyed by number"""
+    for offset, data in iter_text_records(path):
+        if data.startswith(b"Issue #"):
+            issue = parse_record(data, offset)
+            yield {"key": str(issue["number"]), "number": issue["number"], "title": issue["title"],
+                   "labels": issue["labels"], "milestone": issue["milestone"], "body": issue["body"]}
+
+def catalog_documents(path: str) -> Iterator[Dict[str, Any]]:
+    """Specs of a JSONL catalog, keyed by title"""
+    for spec in iter_catalog(path, announce=False):
+        yield {"key": spec["title"], "number": None, "title": spec["title"],
+               "labels": [l.strip() for l in spec["labels"].split(",") if l.strip()],
+               "milestone": spec["milestone"], "body": spec["body"]}
+
+def default_sources(exports: Iterable[str], catalogs: Iterable[str]) -> Dict[str, Callable[[str], Iterator[Dict[str, Any]]]]:
+    """Map each source file to the reader for its format"""
+    sources: Dict[str, Callable[[str], Iterator[Dict[str, Any]]]] = {}
+    for path in exports:
+        sources[os.path.abspath(path)] = export_documents
+    for name in catalogs:
+        sources[os.path.abspath(catalog_path(name))] = catalog_documents
+    return sources
+
+def source_signature(path: str) -> str:
+    st = os.stat(path)
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+def phrase_positions(postings: Dict[str, Dict[int, array]], phrase: List[str], doc: int) -> bool:
+    """True if the phrase's terms occur at consecutive positions in the document"""
+    first, rest = phrase[0], phrase[1:]
+    following = [set(postings[term][doc]) for term in rest]
+    return any(all(start + i + 1 in positions for i, positions in enumerate(following))
+               for start in postings[first][doc])
+
+class SearchIndex:
+    """Inverted index with term positions, stored in SQLite and updated per changed document
+
+    A source whose size and mtime are unchanged is skipped without being read. A changed source is
+    re-read, but only documents whose content hash moved are re-tokenized and rewritten.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or cache_path("search.sqlite3")
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.execute("PRAGMA cache_size=-65536")
+            self.db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self.db.close()
+
+    def clear(self) -> None:
+        with self._lock, self.db:
+            for table in ("sources", "docs", "doc_terms", "doc_labels", "postings"):
+                self.db.execute(f"DELETE FROM {table}")
+
+    # --- indexing ------------------------------------------------------------------
+
+    def update(self, sources: Dict[str, Callable[[str], Iterator[Dict[str, Any]]]]) -> Dict[str, int]:
+        """Bring the index in line with the given sources; returns counts of skipped sources and changed documents"""
+        counts = {"sources_skipped": 0, "indexed": 0, "unchanged": 0, "removed": 0}
+        for path, reader in sources.items():
+            if not os.path.exists(path):
+                continue
+            signature = source_signature(path)
+            with self._lock:
+                row = self.db.execute("SELECT signature FROM sources WHERE path = ?", (path,)).fetchone()
+            if row and row[0] == signature:
+                counts["sources_skipped"] += 1
+                continue
+            for key, value in self._update_source(path, reader(path), signature).items():
+                counts[key] += value
+        return counts
+
+    def _update_source(self, source: str, docs: Iterable[Dict[str, Any]], signature: str) -> Dict[str, int]:
+        counts = {"indexed": 0, "unchanged": 0, "removed": 0}
+        with self._lock, self.db:
+            stored = {key: (doc_id, digest) for doc_id, key, digest in
+                      self.db.execute("SELECT id, key, hash FROM docs WHERE source = ?", (source,))}
+            seen: Set[str] = set()
+            for doc in docs:
+                if doc["key"] in seen:
+                    continue
+                seen.add(doc["key"])
+                digest = document_hash(doc)
+                previous = stored.get(doc["key"])
+                if previous and previous[1] == digest:
+                    counts["unchanged"] += 1
+                    continue
+                if previous:
+                    self._delete_doc(previous[0])
+                self._insert_doc(source, doc, digest)
+                counts["indexed"] += 1
+            for key, (doc_id, _) in stored.items():
+                if key not in seen:
+                    self._delete_doc(doc_id)
+                    counts["removed"] += 1
+            self.db.execute("INSERT OR REPLACE INTO sources(path, signature) VALUES (?, ?)", (source, signature))
+        return counts
+
+    def _insert_doc(self, source: str, doc: Dict[str, Any], digest: str) -> None:
+        tokens = tokenize(" ".join((doc["title"], " ".join(doc["labels"]), doc["milestone"] or "", doc["body"])))
+        positions: Dict[str, array] = {}
+        for position, token in enumerate(tokens):
+            found = positions.get(token)
+            if found is None:
+                found = positions[token] = array("I")
+            found.append(position)
+        cursor = self.db.execute(
+            "INSERT INTO docs(source, key, number, title, labels, milestone, length, hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (source, doc["key"], doc["number"], doc["title"], ",".join(doc["labels"]), doc["milestone"],
+             len(tokens), digest))
+        doc_id = cursor.lastrowid
+        self.db.execute("INSERT INTO doc_terms(doc, terms) VALUES (?, ?)", (doc_id, " ".join(positions)))
+        self.db.executemany("INSERT INTO postings(term, doc, positions) VALUES (?, ?, ?)",
+                            [(term, doc_id, found.tobytes()) for term, found in positions.items()])
+        self.db.executemany("INSERT OR IGNORE INTO doc_labels(label, doc) VALUES (?, ?)",
+                            [(label, doc_id) for label in doc["labels"]])
+
+    def _delete_doc(self, doc_id: int) -> None:
+        """Remove a document, finding its postings through its stored term list"""
+        row = self.db.execute("SELECT terms FROM doc_terms WHERE doc = ?", (doc_id,)).fetchone()
+        self.db.executemany("DELETE FROM postings WHERE term = ? AND doc = ?",
+                            [(term, doc_id) for term in (row[0] or "").split()] if row else [])
+        self.db.execute("DELETE FROM doc_terms WHERE doc = ?", (doc_id,))
+        self.db.execute("DELETE FROM doc_labels WHERE doc = ?", (doc_id,))
+        self.db.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+
+    # --- querying ------------------------------------------------------------------
+
+    def _postings(self, term: str) -> Dict[int, array]:
+        found = {}
+        for doc, blob in self.db.execute("SELECT doc, positions FROM postings WHERE term = ?", (term,)):
+            positions = array("I")
+            positions.frombytes(blob)
+            found[doc] = positions
+        return found
+
+    def _filters(self, labels: Iterable[str], milestone: Optional[str], source: Optional[str]) -> Tuple[str, List[str]]:
+        """WHERE clause and parameters selecting the docs allowed by the filters ("" when none are set)"""
+        clauses, params = [], []
+        for label in labels:
+            clauses.append("id IN (SELECT doc FROM doc_labels WHERE label = ?)")
+            params.append(label)
+        if milestone:
+            clauses.append("milestone = ? COLLATE NOCASE")
+            params.append(milestone)
+        if source:
+            clauses.append("source LIKE ?")
+            params.append(f"%{source}%")
+        return " AND ".join(clauses), params
+
+    def search(self, query: str = "", labels: Iterable[str] = (), milestone: Optional[str] = None,
+               source: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """Documents containing every term and phrase of the query and passing the filters, best BM25 first"""
+        phrases = parse_query(query)
+        where, params = self._filters(labels, milestone, source)
+        if not phrases and not where:
+            return []
+        with self._lock:
+            if phrases:
+                ranked, scores = self._rank(phrases, where, params, limit)
+            else:
+                # Nothing to rank by, so let SQLite pick the newest matching issues
+                ranked = [row[0] for row in self.db.execute(
+                    f"SELECT id FROM docs WHERE {where} ORDER BY number DESC LIMIT ?", params + [limit])]
+                scores = {}
+            rows = {row[0]: row for row in self._rows("id, source, number, title, labels, milestone", ranked)}
+        return [{"source": rows[doc][1], "number": rows[doc][2], "title": rows[doc][3],
+                 "labels": rows[doc][4].split(",") if rows[doc][4] else [], "milestone": rows[doc][5],
+                 "score": round(scores.get(doc, 0.0), 3)} for doc in ranked]
+
+    def _rank(self, phrases: List[List[str]], where: str, params: List[str], limit: int) -> Tuple[List[int], Dict[int, float]]:
+        """Top doc ids matching every phrase (and the filter clause) by BM25, with their scores"""
+        candidates: Optional[Set[int]] = None
+        if where:
+            candidates = {row[0] for row in self.db.execute(f"SELECT id FROM docs WHERE {where}", params)}
+        postings: Dict[str, Dict[int, array]] = {}
+        for term in {term for phrase in phrases for term in phrase}:
+            postings[term] = self._postings(term)
+        for term in sorted(postings, key=lambda t: len(postings[t])):
+            docs = set(postings[term])
+            candidates = docs if candidates is None else candidates & docs
+        candidates = {doc for doc in candidates or ()
+                      if all(len(phrase) == 1 or phrase_positions(postings, phrase, doc) for phrase in phrases)}
+        total, average = self.db.execute("SELECT count(*), avg(length) FROM docs").fetchone()
+        # Scoring needs only each candidate's number and length; full rows are read for the top hits
+        lengths, numbers = {}, {}
+        for doc, number, length in self._rows("id, number, length", sorted(candidates)):
+            lengths[doc], numbers[doc] = length or 0, number or 0
+
+        def score(doc: int) -> float:
+            value = 0.0
+            for found in postings.values():
+                tf = len(found[doc])
+                idf = math.log(1 + (total - len(found) + 0.5) / (len(found) + 0.5))
+                norm = 1 - BM25_B + BM25_B * lengths[doc] / (average or 1)
+                value += idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+            return value
+
+        scores = {doc: score(doc) for doc in lengths}
+        return sorted(scores, key=lambda doc: (-scores[doc], -numbers[doc]))[:limit], scores
+
+    def _rows(self, columns: str, ids: List[int]) -> Iterator[Tuple]:
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            yield from self.db.execute(f"SELECT {columns} FROM docs WHERE id IN ({','.join('?' * len(chunk))})", chunk)
+
+    def stats(self) -> Tuple[int, int]:
+        """(documents, distinct terms)"""
+        with self._lock:
+            docs = self.db.execute("SELECT count(*) FROM docs").fetchone()[0]
+            terms = self.db.execute("SELECT count(DISTINCT term) FROM postings").fetchone()[0]
+        return docs, terms
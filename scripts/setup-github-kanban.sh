@@ -18,6 +18,7 @@ REPO_OWNER=""
 REPO_NAME=""
 GITHUB_TOKEN=""
 PROJECT_NAME="Ideation Engine Development"
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 
 # Function to print colored output
 print_status() {
@@ -46,6 +47,11 @@ check_dependencies() {
         exit 1
     fi
     
+    if ! command -v python3 &> /dev/null; then
+        print_error "python3 is not installed. It is needed to sync labels."
+        exit 1
+    fi
+    
     if ! command -v jq &> /dev/null; then
         print_error "jq is not installed. Please install it first."
         echo "On macOS: brew install jq"
@@ -149,41 +155,17 @@ create_labels() {
         ["Prio:Low"]="6B7280|Nice to have - future work or optimizations"
     )
     
-    # Function to create label
-    create_label() {
-        local name=$1
-        local color=$2
-        local description=$3
-        
-        if gh label create "$name" --color "$color" --description "$description" --repo "$REPO_OWNER/$REPO_NAME" 2>/dev/null; then
-            print_success "Created label: $name"
-        else
-            print_warning "Label already exists or failed to create: $name"
-        fi
-    }
-    
-    # Create all labels
-    for label in "${!layer_labels[@]}"; do
-        IFS='|' read -r color description <<< "${layer_labels[$label]}"
-        create_label "$label" "$color" "$description"
-    done
-    
-    for label in "${!type_labels[@]}"; do
-        IFS='|' read -r color description <<< "${type_labels[$label]}"
-        create_label "$label" "$color" "$description"
-    done
-    
-    for label in "${!component_labels[@]}"; do
-        IFS='|' read -r color description <<< "${component_labels[$label]}"
-        create_label "$label" "$color" "$description"
-    done
-    
-    for label in "${!priority_labels[@]}"; do
-        IFS='|' read -r color description <<< "${priority_labels[$label]}"
-        create_label "$label" "$color" "$description"
-    done
-    
-    print_success "All labels created successfully"
+    # Diff against the repository's labels with one list call and apply only what differs
+    if {
+        for label in "${!layer_labels[@]}"; do echo "$label|${layer_labels[$label]}"; done
+        for label in "${!type_labels[@]}"; do echo "$label|${type_labels[$label]}"; done
+        for label in "${!component_labels[@]}"; do echo "$label|${component_labels[$label]}"; done
+        for label in "${!priority_labels[@]}"; do echo "$label|${priority_labels[$label]}"; done
+    } | python3 "$SCRIPT_DIR/sync-labels.py" --repo "$REPO_OWNER/$REPO_NAME" --manifest -; then
+        print_success "All labels are in sync"
+    else
+        print_warning "Some labels failed to sync; re-run to retry only those"
+    fi
 }
 
 # Function to create milestones
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Index
+MinHash signatures of title+body word shingles, bucketed with locality-sensitive hashing so similar issues are found without comparing every pair
+"""
+
+import operator
+import re
+import zlib
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_PERMUTATIONS = 128
+SHINGLE_WORDS = 3
+# Documents kept per LSH bucket: a bucket this full is a cluster of near-identical documents (e.g. rows
+# of one catalog template), and its first members stand for the rest, so lookups stay bounded
+BUCKET_LIMIT = 64
+# Candidates scored per query, taken in order of how many bands they share with it
+CANDIDATE_LIMIT = 32
+TOKEN = re.compile(r"\w+")
+# Markdown headings and **Label**: prefixes are template structure, not content; the same issue written
+# up in two formats should not look different because of them, nor two sibling issues alike
+MARKUP = re.compile(r"^\s*#+ .*$|\*\*[^*\n]+\*\*:?", re.MULTILINE)
+MASK = (1 << 64) - 1
+# Odd 64-bit multipliers: one spreads the two CRCs over every bit, the other offsets borrowed bins
+MIX = 0x9E3779B97F4A7C15
+ROTATION = 0xC2B2AE3D27D4EB4F
+
+def shingles(text: str, k: int = SHINGLE_WORDS) -> Set[int]:
+    """64-bit hashes of the text's overlapping k-word runs; texts shorter than k words give one shingle"""
+    words = TOKEN.findall(text.casefold())
+    grams = [" ".join(gram).encode("utf-8") for gram in zip(*(words[i:] for i in range(k)))]
+    if not grams and words:
+        grams = [" ".join(words).encode("utf-8")]
+    crc = zlib.crc32
+    return {((crc(gram) << 32 | crc(gram, 0x5BD1E995)) * MIX) & MASK for gram in grams}
+
+def minhash(hashes: Iterable[int], permutations: int = DEFAULT_PERMUTATIONS) -> Optional[array]:
+    """One-permutation MinHash: the top bits of each hash pick a bin, each bin keeps its smallest value
+
+    One hash per shingle instead of one per shingle and permutation. Bins no shingle fell into borrow
+    the value of the next filled bin to their right, offset by the distance, so the signatures stay
+    comparable position by position (densified one-permutation hashing).
+    """
+    empty = MASK
+    bins = [empty] * permutations
+    for value in hashes:
+        slot = ((value >> 32) * permutations) >> 32
+        if value < bins[slot]:
+            bins[slot] = value
+    filled = [i for i, value in enumerate(bins) if value != empty]
+    if not filled:
+        return None
+    if len(filled) < permutations:
+        dense = list(bins)
+        nearest = filled[0] + permutations
+        for i in range(permutations - 1, -1, -1):
+            if bins[i] != empty:
+                nearest = i
+            else:
+                dense[i] = (bins[nearest % permutations] + (nearest - i) * ROTATION) & MASK
+        bins = dense
+    return array("Q", bins)
+
+def similarity(a: array, b: array) -> float:
+    """Estimated Jaccard similarity of two signatures: the share of positions where they agree"""
+    return sum(map(operator.eq, a, b)) / len(a)
+
+def lsh_shape(threshold: float, permutations: int) -> Tuple[int, int]:
+    """(bands, rows) whose candidate S-curve rises well below `threshold`, so near-duplicates are rarely missed"""
+    best = (permutations, 1)
+    for rows in range(1, permutations + 1):
+        if permutations % rows == 0 and (1 / (permutations // rows)) ** (1 / rows) <= threshold - 0.1:
+            best = (permutations // rows, rows)
+    return best
+
+class SimilarityIndex:
+    """Signatures of indexed documents plus one bucket table per LSH band
+
+    A query hashes its signature band by band and only the documents sharing the most band buckets
+    with it are scored, so lookups stay near-constant as the index grows instead of scanning it.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, permutations: int = DEFAULT_PERMUTATIONS,
+                 shingle_words: int = SHINGLE_WORDS):
+        self.threshold = threshold
+        self.permutations = permutations
+        self.shingle_words = shingle_words
+        self.bands, self.rows = lsh_shape(threshold, permutations)
+        self.signatures = array("Q")
+        self.refs: List[Any] = []
+        self.buckets: List[Dict[int, Any]] = [{} for _ in range(self.bands)]
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    def signature(self, title: str, body: str = "") -> Optional[array]:
+        return minhash(shingles(f"{title}\n{MARKUP.sub(' ', body)}", self.shingle_words), self.permutations)
+
+    def _keys(self, signature: array) -> Iterator[Tuple[int, int]]:
+        for band in range(self.bands):
+            yield band, hash(tuple(signature[band * self.rows:(band + 1) * self.rows]))
+
+    def add(self, title: str, body: str, ref: Any, signature: Optional[array] = None) -> Optional[array]:
+        """Index a document under `ref`; returns its signature, or None for a document with no words"""
+        signature = signature or self.signature(title, body)
+        if signature is None:
+            return None
+        doc = len(self.refs)
+        self.refs.append(ref)
+        self.signatures.extend(signature)
+        for band, key in self._keys(signature):
+            bucket = self.buckets[band].get(key)
+            if bucket is None:
+                self.buckets[band][key] = doc
+            elif isinstance(bucket, list):
+                if len(bucket) < BUCKET_LIMIT:
+                    bucket.append(doc)
+            else:
+                self.buckets[band][key] = [bucket, doc]
+        return signature
+
+    def query(self, title: str, body: str = "", signature: Optional[array] = None,
+              threshold: Optional[float] = None) -> List[Tuple[Any, float]]:
+        """(ref, estimated similarity) of indexed documents at or above the threshold, most similar first"""
+        if not self.refs:
+            return []
+        signature = signature or self.signature(title, body)
+        if signature is None:
+            return []
+        shared: Counter = Counter()
+        for band, key in self._keys(signature):
+            bucket = self.buckets[band].get(key)
+            if isinstance(bucket, list):
+                shared.update(bucket)
+            elif bucket is not None:
+                shared[bucket] += 1
+        threshold = self.threshold if threshold is None else threshold
+        width = self.permutations
+        matches = []
+        for doc, _ in shared.most_common(CANDIDATE_LIMIT):
+            score = similarity(signature, self.signatures[doc * width:(doc + 1) * width])
+            if score >= threshold:
+                matches.append((self.refs[doc], score))
+        return sorted(matches, key=lambda match: -match[1])
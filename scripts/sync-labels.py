@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Sync Repository Labels
+Creates or updates only the labels that differ from the declared set, using one list call
+"""
+
+import argparse
+import subprocess
+import sys
+
+from github_client import GitHubAPIError, GitHubClient, load_token
+from label_sync import DEFAULT_LABEL_JOBS, ApiLabels, GhLabels, load_declared, sync_labels
+from provisioning import REPO
+from rate_limiter import DEFAULT_CREATE_RATE, configure_shared_limiter
+
+def main():
+    """Diff the declared labels against the repository and apply the changes"""
+    parser = argparse.ArgumentParser(description="Sync GitHub labels with the declared label set")
+    parser.add_argument("--repo", default=REPO, help=f"owner/name (default: {REPO})")
+    parser.add_argument("--manifest", metavar="PATH",
+                        help="labels.yml, a script with label maps, or '-' for name|color|description lines on stdin "
+                             "(default: the maps in setup-github-kanban.sh)")
+    parser.add_argument("--backend", choices=("auto", "api", "gh"), default="auto",
+                        help="api uses a pooled in-process client, gh shells out to gh api (default: api when a token is available)")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_LABEL_JOBS,
+                        help=f"number of labels to create/update concurrently (default: {DEFAULT_LABEL_JOBS})")
+    parser.add_argument("--writes-per-minute", type=float, default=DEFAULT_CREATE_RATE * 60, metavar="N",
+                        help=f"sustained write rate (default: {DEFAULT_CREATE_RATE * 60:.0f})")
+    parser.add_argument("--dry-run", action="store_true", help="print the planned changes without applying them")
+    args = parser.parse_args()
+
+    declared = load_declared(stream=sys.stdin) if args.manifest == "-" else load_declared(args.manifest)
+    if not declared:
+        print("❌ No labels declared")
+        sys.exit(1)
+
+    configure_shared_limiter(create_rate=args.writes_per_minute / 60.0, max_concurrency=max(1, args.jobs))
+    token = load_token() if args.backend != "gh" else ""
+    if args.backend == "api" or args.backend == "auto" and token:
+        target = ApiLabels(args.repo, GitHubClient(token=token))
+    else:
+        target = GhLabels(args.repo)
+
+    try:
+        ok = sync_labels(target, declared, jobs=args.jobs, dry_run=args.dry_run)
+    except (GitHubAPIError, OSError, subprocess.CalledProcessError) as e:
+        print(f"❌ Could not list labels in {args.repo}: {e}")
+        sys.exit(1)
+    if not ok:
+        sys.exit(1)
+    if not args.dry_run:
+        print(f"🎉 Labels in {args.repo} are in sync")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Sync Project Fields
+Creates the Priority, Layer and Component fields on the project board and sets them on every item from its labels
+"""
+
+import argparse
+import sys
+from collections import Counter
+
+from github_client import GitHubAPIError, GitHubClient
+from label_sync import load_declared
+from project_fields import DEFAULT_FIELD_BATCH, ProjectFieldError, ProjectFields, declared_fields, derive_values
+from provisioning import PROJECT_ID, PROJECT_OWNER, REPO, ApiBackend
+from rate_limiter import DEFAULT_CREATE_RATE, configure_shared_limiter
+from run_metrics import metrics
+
+def main():
+    """Ensure the fields exist, diff every item's values against its labels and write only the differences"""
+    parser = argparse.ArgumentParser(description="Fill Projects v2 Priority/Layer/Component fields from issue labels")
+    parser.add_argument("--repo", default=REPO, help=f"owner/name (default: {REPO})")
+    parser.add_argument("--project-owner", default=PROJECT_OWNER, metavar="LOGIN",
+                        help=f"user or organization owning the project (default: {PROJECT_OWNER})")
+    parser.add_argument("--project", default=PROJECT_ID, metavar="N", help=f"project number (default: {PROJECT_ID})")
+    parser.add_argument("--manifest", metavar="PATH",
+                        help="labels.yml or script with label maps that defines the field options "
+                             "(default: the maps in setup-github-kanban.sh)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_FIELD_BATCH, metavar="N",
+                        help=f"field values set per GraphQL request (default: {DEFAULT_FIELD_BATCH})")
+    parser.add_argument("--writes-per-minute", type=float, default=DEFAULT_CREATE_RATE * 60, metavar="N",
+                        help=f"sustained mutation rate (default: {DEFAULT_CREATE_RATE * 60:.0f})")
+    parser.add_argument("--dry-run", action="store_true", help="print the planned changes without writing anything")
+    args = parser.parse_args()
+
+    options = declared_fields(load_declared(args.manifest))
+    if not any(options.values()):
+        print("❌ No Prio:, L<n>: or Comp: labels declared")
+        sys.exit(1)
+    configure_shared_limiter(create_rate=args.writes_per_minute / 60.0)
+    client = GitHubClient()
+    backend = ApiBackend(client, repo=args.repo, project_owner=args.project_owner, project_id=args.project)
+    try:
+        fields = ProjectFields(client, backend.project_node_id(), options, args.batch_size)
+        fields.ensure(args.dry_run)
+        updates = []
+        planned: Counter = Counter()
+        items = 0
+        for item in fields.iter_items():
+            items += 1
+            if args.dry_run:
+                for field, value in derive_values(item["labels"], options).items():
+                    if item["values"].get(field) != value:
+                        planned[field] += 1
+                        print(f"  ~ #{item['number']} {field}: {item['values'].get(field) or '-'} -> {value}")
+            else:
+                updates.extend(fields.changes(item["id"], item["labels"], item["values"]))
+    except ProjectFieldError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    except (GitHubAPIError, OSError) as e:
+        print(f"❌ Could not read project {args.project_owner}/{args.project}: {e}")
+        sys.exit(1)
+
+    if args.dry_run:
+        print(f"🔎 {items} items, {sum(planned.values())} field values to set "
+              f"({', '.join(f'{name} {count}' for name, count in sorted(planned.items())) or 'none'})")
+        return
+    if not updates:
+        print(f"✓ {items} items checked, every field already matches its labels")
+        return
+    for field, count in sorted(Counter(update[1] for update in updates).items()):
+        print(f"   {field}: {count} items to update")
+    written, failed = fields.apply(updates)
+    print(f"🎉 {items} items checked, {written} field values set, {failed} failed")
+    metrics().print_summary()
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Task Breakdown Parser
+Turns TASK_BREAKDOWN.md into issue specs in one pass over its lines, caching the result keyed on the file's mtime and hash
+"""
+
+import hashlib
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from metadata_cache import cache_path
+
+TASK_BREAKDOWN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "TASK_BREAKDOWN.md")
+FIELD = re.compile(r"^\*\*(Title|Labels|Milestone|Description)\*\*:\s*(.*)$")
+BACKTICKED = re.compile(r"`([^`]*)`")
+LAYER = re.compile(r"\b(L\d)\b")
+GENERAL_LAYER = "General"
+
+class BreakdownError(ValueError):
+    """Raised for a task entry missing a field, naming the line it starts on"""
+
+def section_layer(heading: str) -> Optional[str]:
+    """The layer a `## ...` heading introduces (e.g. "L0"), or None for general sections"""
+    match = LAYER.search(heading)
+    return match.group(1) if match else None
+
+def spec_layer(labels: List[str], section: Optional[str]) -> str:
+    for label in labels:
+        match = LAYER.match(label)
+        if match:
+            return match.group(1)
+    return section or GENERAL_LAYER
+
+def finish(task: Dict[str, Any], section: Optional[str], path: str) -> Dict[str, str]:
+    """Close an entry: check its fields and join its collected body lines"""
+    missing = [field for field in ("labels", "milestone") if field not in task]
+    if missing:
+        raise BreakdownError(f"{path}:{task['line']}: {task['title']!r} has no {', '.join(missing)}")
+    return {"title": task["title"], "layer": spec_layer(task["labels"], section), "labels": ",".join(task["labels"]),
+            "milestone": task["milestone"], "body": "\n".join(task["body"]).strip()}
+
+def parse_lines(lines: Iterable[str], path: str = TASK_BREAKDOWN) -> Iterator[Dict[str, str]]:
+    """Yield a spec per `**Title**:` entry as soon as its closing `---` (or the next heading) is reached
+
+    Everything after `**Description**:` up to that point becomes the body, so the technical
+    approach and acceptance criteria travel with the issue unchanged.
+    """
+    section: Optional[str] = None
+    task: Optional[Dict[str, Any]] = None
+    in_body = False
+    for number, line in enumerate(lines, 1):
+        line = line.rstrip("\n")
+        if line.startswith("#") or line.strip() == "---":
+            if task:
+                yield finish(task, section, path)
+                task, in_body = None, False
+            if line.startswith("## "):
+                section = section_layer(line)
+            continue
+        match = FIELD.match(line)
+        if match and (not in_body or match.group(1) == "Title"):
+            field, value = match.groups()
+            if field == "Title":
+                if task:
+                    yield finish(task, section, path)
+                title = BACKTICKED.findall(value)
+                task, in_body = {"title": title[0] if title else value.strip(), "line": number, "body": []}, False
+            elif task is None:
+                raise BreakdownError(f"{path}:{number}: **{field}** outside a task entry")
+            elif field == "Labels":
+                task["labels"] = BACKTICKED.findall(value) or [name.strip() for name in value.split(",") if name.strip()]
+            elif field == "Milestone":
+                task["milestone"] = value.strip()
+            else:
+                in_body = True
+                if value.strip():
+                    task["body"].append(value.strip())
+        elif in_body:
+            task["body"].append(line)
+    if task:
+        yield finish(task, section, path)
+
+class BreakdownCache:
+    """Parsed specs stored under .kanban-cache, valid while the document's mtime or content hash matches
+
+    An unchanged mtime and size skips reading the file at all; a touched file whose bytes hash the
+    same is re-read but not re-parsed.
+    """
+
+    def __init__(self, path: str = TASK_BREAKDOWN):
+        self.source = os.path.abspath(path)
+        digest = hashlib.sha1(self.source.encode("utf-8")).hexdigest()[:12]
+        self.path = cache_path(f"breakdown-{digest}.json")
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    def specs(self) -> List[Dict[str, str]]:
+        st = os.stat(self.source)
+        entry = self._read()
+        if entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            return entry["specs"]
+        with open(self.source, "rb") as f:
+            data = f.read()
+        sha256 = hashlib.sha256(data).hexdigest()
+        if entry.get("sha256") != sha256:
+            entry["specs"] = list(parse_lines(data.decode("utf-8").splitlines(), self.source))
+        entry.update(mtime_ns=st.st_mtime_ns, size=st.st_size, sha256=sha256)
+        self._write(entry)
+        return entry["specs"]
+
+def load_breakdown(path: str = TASK_BREAKDOWN, use_cache: bool = True) -> List[Dict[str, str]]:
+    """Specs from a task breakdown document, parsed at most once per content change"""
+    if use_cache:
+        return BreakdownCache(path).specs()
+    with open(path, encoding="utf-8") as f:
+        return list(parse_lines(f, path))
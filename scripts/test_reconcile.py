@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Reconcile Planner Tests
+Checks plan_reconcile against in-memory live issues: what it reopens, leaves closed and renames
+"""
+
+import os
+import tempfile
+import unittest
+
+from issue_index import spec_hash
+from reconcile import ManagedIssues, plan_reconcile
+
+CATALOG = "board.jsonl"
+
+def spec(title: str, body: str = "Body") -> dict:
+    return {"title": title, "body": body, "labels": "L0: Foundation", "milestone": "M1"}
+
+def live(number: int, item: dict, state: str = "open", state_reason: str = None) -> dict:
+    return {"number": number, "title": item["title"], "body": item["body"], "state": state,
+            "state_reason": state_reason, "labels": ["L0: Foundation"], "milestone": "M1"}
+
+class PlanReconcileTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.managed = ManagedIssues("owner/repo", os.path.join(self.tmp.name, "managed-issues.json"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def manage(self, number: int, item: dict, position: int) -> None:
+        digest = spec_hash(item["title"], item["body"], item["labels"], item["milestone"])
+        self.managed.record(item["title"], number, digest, CATALOG, position)
+
+    def test_completed_issue_stays_closed(self):
+        item = spec("Build the ingest layer")
+        self.manage(1, item, 0)
+        edits, creates, unchanged = plan_reconcile([item], [live(1, item, "closed", "completed")], self.managed, CATALOG)
+        self.assertEqual((edits, creates, unchanged), ([], [], 1))
+
+    def test_completed_issue_is_edited_without_reopening(self):
+        item = spec("Build the ingest layer")
+        self.manage(1, item, 0)
+        edits, _, _ = plan_reconcile([spec(item["title"], "New body")], [live(1, item, "closed", "completed")],
+                                     self.managed, CATALOG)
+        self.assertEqual(len(edits), 1)
+        self.assertEqual(edits[0][1], {"body": "New body"})
+
+    def test_issue_closed_as_not_planned_is_reopened(self):
+        item = spec("Build the ingest layer")
+        self.manage(1, item, 0)
+        edits, _, _ = plan_reconcile([item], [live(1, item, "closed", "not_planned")], self.managed, CATALOG)
+        self.assertEqual([changes for _, changes in edits], [{"state": "open"}])
+
+    def test_unmanaged_closed_issue_is_not_reopened(self):
+        item = spec("Build the ingest layer")
+        edits, _, unchanged = plan_reconcile([item], [live(1, item, "closed", "not_planned")], self.managed, CATALOG)
+        self.assertEqual((edits, unchanged), ([], 1))
+
+    def test_renamed_spec_edits_the_title(self):
+        old, new = spec("Build the ingest layer"), spec("Build the ingestion layer")
+        self.manage(1, old, 0)
+        edits, creates, _ = plan_reconcile([new], [live(1, old)], self.managed, CATALOG)
+        self.assertEqual(creates, [])
+        self.assertEqual([changes for _, changes in edits], [{"title": new["title"]}])
+        self.assertEqual(self.managed.entries["build the ingestion layer"]["number"], 1)
+        self.assertNotIn("build the ingest layer", self.managed.entries)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Validate Catalog
+Checks every spec's labels and milestone against setup-github-kanban.sh offline, listing all problems in one pass
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from issue_spec import SpecValidator, validate_catalogs
+from label_sync import SETUP_SCRIPT
+
+def main():
+    """Stream each catalog through the validator and report every malformed line or invalid spec"""
+    parser = argparse.ArgumentParser(description="Validate issue catalogs before anything is sent to GitHub")
+    parser.add_argument("--catalog", action="append", default=[], metavar="PATH",
+                        help="JSONL catalog or \"breakdown\" to check (repeatable; default: board and missing)")
+    parser.add_argument("--manifest", metavar="PATH",
+                        help="labels.yml or script with label maps that declares the labels (default: the maps in setup-github-kanban.sh)")
+    parser.add_argument("--setup-script", default=SETUP_SCRIPT, metavar="PATH",
+                        help="script whose `gh milestone create` calls declare the milestones (default: setup-github-kanban.sh)")
+    parser.add_argument("--json", action="store_true", help="print the problems as JSON")
+    args = parser.parse_args()
+
+    catalogs = args.catalog or ["board", "missing"]
+    started = time.monotonic()
+    try:
+        validator = SpecValidator.declared(args.manifest, args.setup_script)
+        total, problems = validate_catalogs(catalogs, validator)
+    except OSError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    elapsed = time.monotonic() - started
+
+    if args.json:
+        print(json.dumps(problems, indent=2, ensure_ascii=False))
+    else:
+        for problem in problems:
+            print(f"❌ {problem}")
+        print(f"\n🔎 {total} specs checked against {len(validator.labels)} labels and {len(validator.milestones)} "
+              f"milestones in {elapsed:.2f}s: {len(problems)} problems")
+    if problems:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()